@@ -0,0 +1,52 @@
+"""Build the offline anniversary corpus for every day of the year."""
+import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from config import Config
+from utils.logger import setup_logger
+from fetchers.corpus_fetcher import corpus_file
+from pipeline.corpus import build_corpus
+from utils.rate_limit import WIKIPEDIA_BUCKET
+from main import build_wikipedia_fetcher, build_candidate_pipeline, get_rate_limiter
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the offline Wikipedia corpus")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Requests in flight per language (default: 4)")
+    parser.add_argument("--rate", type=float, default=2.0,
+                        help="Maximum requests per second per language, 0 for unlimited "
+                             "(default: 2; replaces WIKIPEDIA_REQUESTS_PER_SECOND)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stop each download once the section lists are read (skips the HTTP cache)")
+    args = parser.parse_args()
+
+    config = Config.load()
+    setup_logger(config.LOGS_DIR)
+
+    # Languages are separate hosts, so each gets its own rate limit; the
+    # fetchers wait on these buckets
+    rate_limiter = get_rate_limiter(config)
+    for language in config.LANGUAGES:
+        rate_limiter.configure(WIKIPEDIA_BUCKET.format(lang=language.value), args.rate)
+
+    def build(language):
+        return build_corpus(
+            build_wikipedia_fetcher(config, language, streaming=args.stream or None), language,
+            corpus_file(config.DATA_DIR, language),
+            concurrency=args.concurrency,
+            pipeline=build_candidate_pipeline(config, language, shortlist=False),
+        )
+
+    with ThreadPoolExecutor(max_workers=len(config.LANGUAGES)) as pool:
+        results = dict(zip(config.LANGUAGES, pool.map(build, config.LANGUAGES)))
+
+    for language, failed in results.items():
+        print(f"{language.value}: wrote {corpus_file(config.DATA_DIR, language)} "
+              f"({len(failed)} days failed)")
+
+    sys.exit(1 if any(results.values()) else 0)
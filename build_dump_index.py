@@ -0,0 +1,47 @@
+"""Build the offset index of every local Wikipedia dump so day pages can be read offline."""
+import sys
+import argparse
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from config import Config
+from utils.logger import setup_logger
+from fetchers.dump_fetcher import build_dump_index, find_dump, load_dump_index
+from main import dump_index_file
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Index the day pages of local Wikipedia dumps")
+    parser.add_argument("--dump-dir", type=Path,
+                        help="Directory with the dumps (default: WIKIPEDIA_DUMP_DIR)")
+    parser.add_argument("--force", action="store_true", help="Rebuild indexes that are up to date")
+    args = parser.parse_args()
+
+    config = Config.load()
+    setup_logger(config.LOGS_DIR)
+
+    dump_dir = args.dump_dir or config.WIKIPEDIA_DUMP_DIR
+    if not dump_dir:
+        print("Set WIKIPEDIA_DUMP_DIR or pass --dump-dir")
+        sys.exit(1)
+
+    missing = False
+    for language in config.LANGUAGES:
+        dump = find_dump(dump_dir, language)
+        if not dump:
+            print(f"{language.value}: no {language.value}wiki-*-pages-articles-multistream.xml.bz2 "
+                  f"with its -index.txt.bz2 in {dump_dir}")
+            missing = True
+            continue
+
+        dump_file, multistream_index = dump
+        index_file = dump_index_file(config, dump_file)
+        if not args.force and load_dump_index(dump_file, index_file) is not None:
+            print(f"{language.value}: {index_file} is up to date")
+            continue
+
+        blocks = build_dump_index(dump_file, multistream_index, index_file, language)
+        print(f"{language.value}: wrote {index_file} ({len(blocks)} day pages)")
+
+    sys.exit(1 if missing else 0)
@@ -0,0 +1,34 @@
+"""Compile the fallback anniversary JSON into the indexed SQLite files the fetchers read."""
+import sys
+import argparse
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from config import Config
+from utils.logger import setup_logger
+from fetchers.fallback_index import compile_fallback_index
+from main import fallback_index_file
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the fallback anniversary index")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild from scratch instead of updating changed days")
+    args = parser.parse_args()
+
+    config = Config.load()
+    setup_logger(config.LOGS_DIR)
+
+    for language in config.LANGUAGES:
+        data_file = config.DATA_DIR / f"fallback_anniversaries_{language.value}.json"
+        index_file = fallback_index_file(config, language)
+        if args.force:
+            index_file.unlink(missing_ok=True)
+
+        result = compile_fallback_index(data_file, index_file, language)
+        if result.skipped:
+            print(f"{language.value}: {index_file} is up to date")
+        else:
+            print(f"{language.value}: wrote {index_file} ({result.days_written} days written, "
+                  f"{result.days_removed} removed, {result.days_unchanged} unchanged)")
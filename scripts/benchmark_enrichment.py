@@ -0,0 +1,126 @@
+"""Context enrichment latency against a local stand-in summary server.
+
+The stand-in answers /page/summary/<title> with a synthetic summary after
+--delay seconds, and titles starting with "Slow" after --slow-delay
+seconds. Prints the stage time and the facts found for a cold cache, a
+warm cache, and a server slower than the stage limit. The last case
+should take about --seconds, with the slow articles left out.
+
+Usage:
+    python scripts/benchmark_enrichment.py [--lang ja] [--delay 0.05] [--seconds 0.5]
+"""
+
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+import threading
+from datetime import date
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import unquote
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from config import Language
+from fetchers.base_fetcher import Anniversary
+from generators.context_enricher import ContextEnricher
+from utils.http_transport import HttpTransport
+from utils.summary_cache import SummaryCache
+
+
+def serve_summaries(delay: float, slow_delay: float) -> ThreadingHTTPServer:
+    """Start a local stand-in for the page summary endpoint.
+
+    Args:
+        delay: Seconds before answering
+        slow_delay: Seconds before answering for titles starting with "Slow"
+
+    Returns:
+        Running server (call shutdown() when done)
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            title = unquote(self.path.rsplit("/", 1)[-1]).replace("_", " ")
+            time.sleep(slow_delay if title.startswith("Slow") else delay)
+            body = json.dumps({
+                "type": "standard",
+                "title": title,
+                "description": f"Stand-in article {title}",
+                "extract": f"{title} is an article served by the benchmark. " * 10,
+            }).encode("utf-8")
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except OSError:
+                pass  # Client gave up at its deadline
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(label: str, enricher: ContextEnricher, anniversary: Anniversary, use_async: bool) -> None:
+    """Time one enrichment and print the result."""
+    started = time.perf_counter()
+    if use_async:
+        facts = asyncio.run(enricher.facts_async(anniversary))
+    else:
+        facts = enricher.facts(anniversary)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"{label:>12}: {elapsed:7.1f} ms, {len(facts)} of {len(anniversary.links)} articles")
+
+
+def main(argv=None) -> int:
+    """Benchmark the enrichment stage.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="AADD context enrichment benchmark")
+    parser.add_argument("--lang", choices=[lang.value for lang in Language], default="en")
+    parser.add_argument("--delay", type=float, default=0.05, help="Server delay in seconds (default: 0.05)")
+    parser.add_argument("--slow-delay", type=float, default=3.0,
+                        help="Server delay for slow titles in seconds (default: 3)")
+    parser.add_argument("--seconds", type=float, default=0.5, help="Stage limit in seconds (default: 0.5)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Use facts_async")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("AADD").setLevel(logging.WARNING)
+    server = serve_summaries(args.delay, args.slow_delay)
+    base_url = f"http://127.0.0.1:{server.server_port}/page/summary"
+    event = Anniversary(date=date.today(), title="Benchmark event", description="", category="historical",
+                        year=1969, source="Benchmark", links=["Apollo 11", "Neil Armstrong", "Moon", "Saturn V"])
+    slow_event = Anniversary(date=date.today(), title="Slow event", description="", category="historical",
+                             year=1969, source="Benchmark", links=["Apollo 11", "Slow page", "Slow rocket"])
+
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            enricher = ContextEnricher(Language(args.lang), SummaryCache(Path(cache_dir)), HttpTransport(),
+                                       max_pages=4, max_seconds=args.seconds, base_url=base_url)
+            run("cold cache", enricher, event, args.use_async)
+            run("warm cache", enricher, event, args.use_async)
+            run("slow server", enricher, slow_event, args.use_async)
+            print(f"Stats: {enricher.stats}")
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""End-to-end fetch+parse latency: HTML day page fetchers vs the on-this-day feed.
+
+Serves a saved day page and a saved feed response from a local stand-in
+server (so network jitter does not drown the parse cost) and times
+fetcher.fetch() for each source. With --live, fetches from Wikipedia
+instead.
+
+Save inputs first, e.g.:
+    curl -o January_1.html https://en.wikipedia.org/wiki/January_1
+    curl -o 01-01.json https://en.wikipedia.org/api/rest_v1/feed/onthisday/events/01/01
+
+Usage:
+    python scripts/benchmark_fetch.py --html January_1.html --json 01-01.json [--lang en]
+    python scripts/benchmark_fetch.py --live [--lang ja] [--date 2026-01-01]
+"""
+
+import sys
+import time
+import logging
+import argparse
+import statistics
+import threading
+from datetime import date
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Callable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from config import Language
+from fetchers.wikipedia_fetcher import WikipediaFetcher
+from fetchers.wikipedia_ja_fetcher import WikipediaJaFetcher
+from fetchers.onthisday_fetcher import OnThisDayFetcher
+from utils.http_transport import HttpTransport
+
+
+def serve_files(html: bytes, feed: bytes) -> ThreadingHTTPServer:
+    """Start a local stand-in server: /api/... serves the feed, anything else the page.
+
+    Args:
+        html: Day page body
+        feed: Feed response body
+
+    Returns:
+        Running server (call shutdown() when done)
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            is_feed = self.path.startswith("/api/")
+            body = feed if is_feed else html
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json" if is_feed else "text/html; charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def time_fetch(fetch: Callable[[], list], runs: int) -> List[float]:
+    """Time repeated calls in milliseconds, after one warm-up call."""
+    fetch()
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fetch()
+        times.append((time.perf_counter() - started) * 1000)
+    return times
+
+
+def main(argv=None) -> int:
+    """Benchmark both sources for one language.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="AADD fetch+parse latency benchmark")
+    parser.add_argument("--lang", choices=[lang.value for lang in Language], default="en")
+    parser.add_argument("--html", type=Path, help="Saved day page")
+    parser.add_argument("--json", type=Path, help="Saved on-this-day feed response")
+    parser.add_argument("--live", action="store_true", help="Fetch from Wikipedia instead")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today(),
+                        help="Date to fetch (default: today)")
+    parser.add_argument("--runs", type=int, default=10, help="Fetches per source (default: 10)")
+    args = parser.parse_args(argv)
+
+    if not args.live and not (args.html and args.json):
+        parser.error("--html and --json are required unless --live is given")
+
+    logging.getLogger("AADD").setLevel(logging.WARNING)
+    language = Language(args.lang)
+    transport = HttpTransport()
+    html_class = WikipediaJaFetcher if language == Language.JAPANESE else WikipediaFetcher
+    html_fetcher = html_class(transport=transport)
+
+    server = None
+    if args.live:
+        feed_fetcher = OnThisDayFetcher(language, transport=transport)
+    else:
+        server = serve_files(args.html.read_bytes(), args.json.read_bytes())
+        base = f"http://127.0.0.1:{server.server_port}"
+        html_fetcher.BASE_URL = f"{base}/wiki"
+        feed_fetcher = OnThisDayFetcher(language, base_url=f"{base}/api/onthisday/events",
+                                        transport=transport)
+
+    try:
+        results = {}
+        for name, fetcher in (("html", html_fetcher), ("rest", feed_fetcher)):
+            count = len(fetcher.fetch(args.date))
+            times = time_fetch(lambda: fetcher.fetch(args.date), max(1, args.runs))
+            results[name] = statistics.median(times)
+            print(f"{name:>5}: {results[name]:7.1f} ms median, {min(times):7.1f} ms min "
+                  f"({count} anniversaries)")
+    finally:
+        if server:
+            server.shutdown()
+
+    print(f"Feed speedup: {results['html'] / results['rest']:.1f}x")
+    stats = transport.stats
+    print(f"HTTP: {stats['requests']} requests, {stats['reused']} on reused connections, "
+          f"{stats['bytes_received'] / 1024:.0f} KB received, {stats['compressed']} compressed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""Day page parsing benchmark: full BeautifulSoup tree vs lxml section extraction.
+
+Parses saved Wikipedia day pages with the previous approach (a
+BeautifulSoup tree of the whole page) and with the lxml extraction the
+fetchers use now, and reports parse time and peak memory for each. Each
+method runs in its own process so peak memory is not shared.
+
+Save pages first, e.g.:
+    curl -o January_1.html https://en.wikipedia.org/wiki/January_1
+
+Usage:
+    python scripts/benchmark_parse.py PAGE [PAGE ...] [--runs 5]
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tracemalloc
+from pathlib import Path
+from typing import List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+# Section heading ids, English first
+SECTION_IDS = ["Events", "できごと"]
+
+
+def parse_beautifulsoup(content: bytes) -> Optional[List[str]]:
+    """Previous approach: build a BeautifulSoup tree of the whole page."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, "lxml")
+    for section_id in SECTION_IDS:
+        span = soup.find("span", id=section_id)
+        heading = span.find_parent(["h2", "h3"]) if span else soup.find(["h2", "h3"], id=section_id)
+        if heading:
+            events_list = heading.find_next("ul")
+            if not events_list:
+                return []
+            return [li.get_text() for li in events_list.find_all("li", recursive=False)]
+    return None
+
+
+def parse_lxml(content: bytes) -> Optional[List[str]]:
+    """Current approach: lxml extraction of the section list only."""
+    from fetchers.html_sections import extract_section_items
+
+    for section_id in SECTION_IDS:
+        items = extract_section_items(content, section_id)
+        if items is not None:
+            return items
+    return None
+
+
+METHODS = {
+    "beautifulsoup": parse_beautifulsoup,
+    "lxml": parse_lxml,
+}
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process in KB, where the platform reports it."""
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_worker(method: str, pages: List[Path], runs: int) -> dict:
+    """Parse every page with one method and measure it.
+
+    Args:
+        method: Key of METHODS
+        pages: Saved day pages
+        runs: Parses per page
+
+    Returns:
+        Dictionary with per-run times, peak memory and item counts
+    """
+    parse = METHODS[method]
+    contents = [page.read_bytes() for page in pages]
+    parse(contents[0])  # Warm up imports and parser setup
+    rss_before = peak_rss_kb()
+
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        for content in contents:
+            parse(content)
+        times.append((time.perf_counter() - started) * 1000 / len(contents))
+
+    tracemalloc.start()
+    items = [parse(content) for content in contents]
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rss_after = peak_rss_kb()
+    return {
+        "times_ms": times,
+        "traced_peak_kb": traced_peak // 1024,
+        "rss_growth_kb": None if rss_before is None else rss_after - rss_before,
+        "items": items,
+    }
+
+
+def main(argv=None) -> int:
+    """Benchmark both parsing methods on the given pages.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code (0 if both methods extract the same items)
+    """
+    parser = argparse.ArgumentParser(description="AADD day page parsing benchmark")
+    parser.add_argument("pages", nargs="+", type=Path, help="Saved Wikipedia day pages")
+    parser.add_argument("--runs", type=int, default=5, help="Parses per page (default: 5)")
+    parser.add_argument("--worker", choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.pages, max(1, args.runs)), ensure_ascii=False))
+        return 0
+
+    size_kb = sum(page.stat().st_size for page in args.pages) / 1024 / len(args.pages)
+    print(f"{len(args.pages)} pages, {size_kb:.0f} KB average, {args.runs} runs")
+
+    results = {}
+    for method in METHODS:
+        result = subprocess.run(
+            [sys.executable, __file__, "--worker", method, "--runs", str(args.runs),
+             *map(str, args.pages)],
+            capture_output=True, text=True, encoding="utf-8"
+        )
+        if result.returncode != 0:
+            print(f"{method} failed:\n{result.stderr[-2000:]}")
+            return 1
+        results[method] = json.loads(result.stdout)
+
+        stats = results[method]
+        rss = stats["rss_growth_kb"]
+        print(f"{method:>14}: {statistics.median(stats['times_ms']):7.1f} ms/page median, "
+              f"traced peak {stats['traced_peak_kb']:6d} KB, "
+              f"peak RSS growth {'n/a' if rss is None else f'{rss} KB'}")
+
+    before = statistics.median(results["beautifulsoup"]["times_ms"])
+    after = statistics.median(results["lxml"]["times_ms"])
+    print(f"Speedup: {before / after:.1f}x")
+
+    if results["beautifulsoup"]["items"] != results["lxml"]["items"]:
+        print("Extracted items differ between methods")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
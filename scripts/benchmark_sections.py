@@ -0,0 +1,92 @@
+"""Day page section benchmark: Events-only extraction vs Events, Births and Observances.
+
+Parses saved Wikipedia day pages once reading only the Events lists and
+once reading every section the fetchers use, and reports the extra parse
+time the additional sections cost.
+
+Save pages first, e.g.:
+    curl -o January_1.html https://en.wikipedia.org/wiki/January_1
+    curl -o 1月1日.html https://ja.wikipedia.org/wiki/1月1日
+
+Usage:
+    python scripts/benchmark_sections.py PAGE [PAGE ...] [--runs 20]
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+from typing import Callable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from fetchers.html_sections import extract_section_items, extract_sections
+from fetchers.wikipedia_fetcher import WikipediaFetcher
+from fetchers.wikipedia_ja_fetcher import WikipediaJaFetcher
+
+
+def sections_for(content: bytes) -> list:
+    """(heading id, heading text) of every section, for the page's language."""
+    fetcher = WikipediaJaFetcher if "できごと".encode("utf-8") in content else WikipediaFetcher
+    return list(fetcher.SECTIONS.values())
+
+
+def time_parse(parse: Callable[[bytes], object], contents: List[bytes], runs: int) -> List[float]:
+    """Milliseconds per page for each run, after one warm-up pass."""
+    for content in contents:
+        parse(content)
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        for content in contents:
+            parse(content)
+        times.append((time.perf_counter() - started) * 1000 / len(contents))
+    return times
+
+
+def main(argv=None) -> int:
+    """Benchmark Events-only and all-section extraction on the given pages.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="AADD day page section benchmark")
+    parser.add_argument("pages", nargs="+", type=Path, help="Saved Wikipedia day pages")
+    parser.add_argument("--runs", type=int, default=20, help="Parses per page (default: 20)")
+    args = parser.parse_args(argv)
+
+    contents = [page.read_bytes() for page in args.pages]
+    sections = {id(content): sections_for(content) for content in contents}
+
+    def events_only(content: bytes):
+        section_id, heading_text = sections[id(content)][0]
+        return extract_section_items(content, section_id, heading_text=heading_text)
+
+    def all_sections(content: bytes):
+        return extract_sections(content, sections[id(content)])
+
+    size_kb = sum(len(content) for content in contents) / 1024 / len(contents)
+    print(f"{len(contents)} pages, {size_kb:.0f} KB average, {args.runs} runs")
+
+    results = {}
+    for name, parse in (("events only", events_only), ("all sections", all_sections)):
+        times = time_parse(parse, contents, max(1, args.runs))
+        results[name] = statistics.median(times)
+        print(f"{name:>12}: {results[name]:7.2f} ms/page median, {min(times):7.2f} ms min")
+
+    for content, page in zip(contents, args.pages):
+        counts = {section_id: len(items or []) for section_id, items in all_sections(content).items()}
+        print(f"  {page.name}: {counts}")
+
+    extra = results["all sections"] - results["events only"]
+    print(f"Extra sections: {extra:+.2f} ms/page ({extra / results['events only']:+.1%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Startup import-time benchmark for AADD entry points.
+
+Runs each entry point under ``python -X importtime`` and fails if its
+import time goes over budget, so heavy SDKs (anthropic, GitPython, bs4,
+requests/httpx) cannot creep back into paths that do not use them.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 5] [--top 10]
+"""
+
+import sys
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# (name, command arguments after the interpreter, budget in milliseconds)
+ENTRY_POINTS = [
+    ("regenerate_indexes.py", ["-c", "import regenerate_indexes"], 150),
+    ("main.py --help", [str(PROJECT_ROOT / "src" / "main.py"), "--help"], 250),
+]
+
+# Imported by the interpreter before the entry point runs (site-packages .pth hooks)
+IGNORED_ROOTS = {"site"}
+
+
+def measure(args: List[str]) -> Tuple[float, Dict[str, float]]:
+    """Run one entry point under -X importtime.
+
+    Args:
+        args: Command arguments after the interpreter
+
+    Returns:
+        Tuple of (total import time in ms, cumulative ms per top-level import)
+
+    Raises:
+        RuntimeError: If the entry point exits with an error
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{result.stderr[-2000:]}")
+
+    top_level = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        # Top-level imports have a single space of indentation after the bar
+        if name.startswith("  "):
+            continue
+        name = name.strip()
+        if name in IGNORED_ROOTS:
+            continue
+        top_level[name] = top_level.get(name, 0.0) + int(cumulative) / 1000
+
+    return sum(top_level.values()), top_level
+
+
+def main(argv=None) -> int:
+    """Benchmark every entry point and compare with its budget.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code (0 if every entry point is within budget)
+    """
+    parser = argparse.ArgumentParser(description="AADD startup import-time benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per entry point (default: 5)")
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports to list (default: 8)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiply every budget, e.g. 2 on slow CI machines (default: 1)")
+    args = parser.parse_args(argv)
+
+    over_budget = []
+    for name, command, budget_ms in ENTRY_POINTS:
+        budget_ms *= args.scale
+        totals = []
+        slowest = {}
+        for _ in range(max(1, args.runs)):
+            total, top_level = measure(command)
+            totals.append(total)
+            for module, ms in top_level.items():
+                slowest[module] = min(ms, slowest.get(module, ms))
+
+        median = statistics.median(totals)
+        status = "OK" if median <= budget_ms else "OVER BUDGET"
+        print(f"{name}: {median:.1f} ms median import time "
+              f"(min {min(totals):.1f}, budget {budget_ms:.0f}) {status}")
+        for module, ms in sorted(slowest.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {ms:8.1f} ms  {module}")
+
+        if median > budget_ms:
+            over_budget.append(name)
+
+    if over_budget:
+        print(f"Import time over budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
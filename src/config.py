@@ -4,6 +4,7 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 from enum import Enum
+from typing import List, Optional
 from dotenv import load_dotenv
 
 
@@ -32,6 +33,12 @@ class Config:
     LOGS_DIR: Path
     DATA_DIR: Path
     SRC_DIR: Path
+    RUNS_DIR: Path
+    STAGING_DIR: Path
+    CACHE_DIR: Path
+
+    # Languages to generate, in order
+    LANGUAGES: List[Language]
 
     # Git Settings
     GIT_USER_NAME: str
@@ -42,6 +49,59 @@ class Config:
     # Retry Settings
     MAX_RETRIES: int
     RETRY_DELAY: int
+    RETRY_BUDGET_RATIO: float  # Retries allowed per call, across the whole run
+    RETRY_BUDGET_MIN: int  # Retries allowed regardless of the number of calls
+
+    # Run Budget
+    RUN_BUDGET_SECONDS: int
+
+    # Fetch Settings
+    FETCH_MODE: str  # "first" (first usable source) or "merge" (union of all sources)
+    FETCH_HEDGE_SECONDS: float  # 0 = try sources one after another
+    FETCH_MAX_SECONDS: float
+    BREAKER_FAILURES: int  # 0 = circuit breakers disabled
+    BREAKER_COOLDOWN_SECONDS: float
+
+    # Offline Corpus Settings
+    CORPUS_MODE: str  # "first", "last" or "off"
+
+    # HTTP Cache Settings
+    HTTP_CACHE_MAX_MB: int
+    HTTP_CACHE_MAX_STALE_HOURS: int
+    WIKIPEDIA_STREAMING: bool
+
+    # HTTP Transport Settings
+    HTTP_POOL_HOSTS: int  # Hosts to keep connection pools for
+    HTTP_MAX_PER_HOST: int  # Connections (and concurrent requests) per host
+    HTTP_USER_AGENT: str
+
+    # Rate Limits (0 = unlimited)
+    WIKIPEDIA_REQUESTS_PER_SECOND: float  # Per language edition
+    ANTHROPIC_REQUESTS_PER_MINUTE: int
+    ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE: int
+
+    # Context Enrichment Settings
+    ENRICHMENT_PAGES: int  # Linked articles summarized for the prompt (0 = disabled)
+    ENRICHMENT_SECONDS: float  # Longest the enrichment stage may take
+    SUMMARY_CACHE_TTL_HOURS: int
+
+    # Wikipedia source: "html" (day pages) or "rest" (on-this-day JSON feed)
+    WIKIPEDIA_SOURCE: str
+    WIKIPEDIA_SECTIONS: List[str]  # Day page sections: events, births, observances
+    WIKIPEDIA_DUMP_DIR: Optional[Path]  # Local multistream dumps (None = not used)
+
+    # Candidate Selection Settings
+    CANDIDATES_PER_SECTION: int  # Candidates kept per day page section
+    CANDIDATE_SHORTLIST: int  # Best-scored candidates offered for selection (0 = all, unranked)
+
+    # Daemon Settings
+    DAEMON_SCHEDULE: str
+    DAEMON_CONTROL_PORT: int
+
+    # Preview Service Settings
+    SERVICE_PORT: int
+    SERVICE_MAX_CONCURRENCY: int
+    SERVICE_MAX_QUEUE: int
 
     # Feature Flags
     ENABLE_GIT_PUSH: bool
@@ -57,11 +117,13 @@ class Config:
     SMTP_PASSWORD: str
 
     @classmethod
-    def load(cls, env_file: Path = None) -> "Config":
+    def load(cls, env_file: Path = None, override: bool = False) -> "Config":
         """Load configuration from .env file.
 
         Args:
             env_file: Path to .env file. If None, searches for .env in project root.
+            override: Let .env values replace variables already in the
+                environment (used when reloading a changed .env).
 
         Returns:
             Config instance with loaded settings.
@@ -85,7 +147,7 @@ class Config:
             )
 
         # Load .env file
-        load_dotenv(env_file)
+        load_dotenv(env_file, override=override)
 
         # Validate required fields
         claude_api_key = os.getenv("CLAUDE_API_KEY")
@@ -110,6 +172,46 @@ class Config:
             except ValueError:
                 return default
 
+        # Parse float helper
+        def parse_float(value: str, default: float) -> float:
+            if not value:
+                return default
+            try:
+                return float(value)
+            except ValueError:
+                return default
+
+        # Parse comma-separated language codes helper
+        def parse_languages(value: str, default: List[Language]) -> List[Language]:
+            if not value:
+                return default
+            try:
+                return [Language(code.strip()) for code in value.split(",") if code.strip()]
+            except ValueError:
+                raise ValueError(f"LANGUAGES must be a comma-separated list of ja/en, got: {value}")
+
+        corpus_mode = os.getenv("CORPUS_MODE", "last").strip().lower()
+        if corpus_mode not in ("first", "last", "off"):
+            raise ValueError(f"CORPUS_MODE must be first, last or off, got: {corpus_mode}")
+
+        fetch_mode = os.getenv("FETCH_MODE", "first").strip().lower()
+        if fetch_mode not in ("first", "merge"):
+            raise ValueError(f"FETCH_MODE must be first or merge, got: {fetch_mode}")
+
+        wikipedia_source = os.getenv("WIKIPEDIA_SOURCE", "html").strip().lower()
+        if wikipedia_source not in ("html", "rest"):
+            raise ValueError(f"WIKIPEDIA_SOURCE must be html or rest, got: {wikipedia_source}")
+
+        wikipedia_sections = [name.strip().lower()
+                              for name in os.getenv("WIKIPEDIA_SECTIONS", "events,births,observances").split(",")
+                              if name.strip()]
+        unknown_sections = set(wikipedia_sections) - {"events", "births", "observances"}
+        if unknown_sections:
+            raise ValueError(
+                f"WIKIPEDIA_SECTIONS must be a comma-separated list of events/births/observances, "
+                f"got: {', '.join(sorted(unknown_sections))}"
+            )
+
         return cls(
             # API Keys
             CLAUDE_API_KEY=claude_api_key,
@@ -126,6 +228,12 @@ class Config:
             LOGS_DIR=project_root / "logs",
             DATA_DIR=project_root / "data",
             SRC_DIR=project_root / "src",
+            RUNS_DIR=project_root / "runs",
+            STAGING_DIR=project_root / "staging",
+            CACHE_DIR=project_root / "cache",
+
+            # Languages to generate, in order
+            LANGUAGES=parse_languages(os.getenv("LANGUAGES"), [Language.JAPANESE, Language.ENGLISH]),
 
             # Git Settings
             GIT_USER_NAME=os.getenv("GIT_USER_NAME", "AADD Bot"),
@@ -136,6 +244,60 @@ class Config:
             # Retry Settings
             MAX_RETRIES=parse_int(os.getenv("MAX_RETRIES"), 3),
             RETRY_DELAY=parse_int(os.getenv("RETRY_DELAY"), 5),
+            RETRY_BUDGET_RATIO=parse_float(os.getenv("RETRY_BUDGET_RATIO"), 0.2),
+            RETRY_BUDGET_MIN=parse_int(os.getenv("RETRY_BUDGET_MIN"), 10),
+
+            # Run Budget
+            RUN_BUDGET_SECONDS=parse_int(os.getenv("RUN_BUDGET_SECONDS"), 1800),
+
+            # Fetch Settings
+            FETCH_MODE=fetch_mode,
+            FETCH_HEDGE_SECONDS=parse_float(os.getenv("FETCH_HEDGE_SECONDS"), 0.0),
+            FETCH_MAX_SECONDS=parse_float(os.getenv("FETCH_MAX_SECONDS"), 60.0),
+            BREAKER_FAILURES=parse_int(os.getenv("BREAKER_FAILURES"), 3),
+            BREAKER_COOLDOWN_SECONDS=parse_float(os.getenv("BREAKER_COOLDOWN_SECONDS"), 900.0),
+
+            # Offline Corpus Settings
+            CORPUS_MODE=corpus_mode,
+
+            # HTTP Cache Settings
+            HTTP_CACHE_MAX_MB=parse_int(os.getenv("HTTP_CACHE_MAX_MB"), 50),
+            HTTP_CACHE_MAX_STALE_HOURS=parse_int(os.getenv("HTTP_CACHE_MAX_STALE_HOURS"), 168),
+            WIKIPEDIA_STREAMING=parse_bool(os.getenv("WIKIPEDIA_STREAMING"), False),
+
+            # HTTP Transport Settings
+            HTTP_POOL_HOSTS=parse_int(os.getenv("HTTP_POOL_HOSTS"), 10),
+            HTTP_MAX_PER_HOST=parse_int(os.getenv("HTTP_MAX_PER_HOST"), 4),
+            HTTP_USER_AGENT=os.getenv("HTTP_USER_AGENT", "AADD Bot/1.0 (Anniversary App Generator)"),
+
+            # Rate Limits
+            WIKIPEDIA_REQUESTS_PER_SECOND=parse_float(os.getenv("WIKIPEDIA_REQUESTS_PER_SECOND"), 5.0),
+            ANTHROPIC_REQUESTS_PER_MINUTE=parse_int(os.getenv("ANTHROPIC_REQUESTS_PER_MINUTE"), 50),
+            ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE=parse_int(os.getenv("ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE"), 0),
+
+            # Context Enrichment Settings
+            ENRICHMENT_PAGES=parse_int(os.getenv("ENRICHMENT_PAGES"), 4),
+            ENRICHMENT_SECONDS=parse_float(os.getenv("ENRICHMENT_SECONDS"), 2.0),
+            SUMMARY_CACHE_TTL_HOURS=parse_int(os.getenv("SUMMARY_CACHE_TTL_HOURS"), 720),
+
+            # Wikipedia Source
+            WIKIPEDIA_SOURCE=wikipedia_source,
+            WIKIPEDIA_SECTIONS=wikipedia_sections,
+            WIKIPEDIA_DUMP_DIR=(project_root / os.getenv("WIKIPEDIA_DUMP_DIR")
+                                if os.getenv("WIKIPEDIA_DUMP_DIR") else None),
+
+            # Candidate Selection Settings
+            CANDIDATES_PER_SECTION=parse_int(os.getenv("CANDIDATES_PER_SECTION"), 15),
+            CANDIDATE_SHORTLIST=parse_int(os.getenv("CANDIDATE_SHORTLIST"), 0),
+
+            # Daemon Settings
+            DAEMON_SCHEDULE=os.getenv("DAEMON_SCHEDULE", "0 9 * * *"),
+            DAEMON_CONTROL_PORT=parse_int(os.getenv("DAEMON_CONTROL_PORT"), 8765),
+
+            # Preview Service Settings
+            SERVICE_PORT=parse_int(os.getenv("SERVICE_PORT"), 8766),
+            SERVICE_MAX_CONCURRENCY=parse_int(os.getenv("SERVICE_MAX_CONCURRENCY"), 2),
+            SERVICE_MAX_QUEUE=parse_int(os.getenv("SERVICE_MAX_QUEUE"), 8),
 
             # Feature Flags
             ENABLE_GIT_PUSH=parse_bool(os.getenv("ENABLE_GIT_PUSH"), True),
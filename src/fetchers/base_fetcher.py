@@ -1,10 +1,19 @@
 """Base classes and data structures for anniversary fetchers."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, asdict, field
 from datetime import date
-from typing import List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 import logging
+import time
+
+from fetchers.circuit_breaker import BreakerStore, CircuitBreaker, OPEN
+from utils.deadline import Deadline, DeadlineExceeded
+from utils.near_duplicates import NearDuplicateIndex
+
+if TYPE_CHECKING:
+    from fetchers.candidates import CandidatePipeline
 
 logger = logging.getLogger("AADD")
 
@@ -17,25 +26,58 @@ class Anniversary:
     title: str
     description: str
     category: str  # "historical", "commemorative", "cultural", "scientific", etc.
-    year: int  # Year of the original event
+    year: Optional[int]  # Year of the original event (None for observances)
     source: str  # "Wikipedia", "API Ninjas", "Fallback", etc.
     interest_score: float = 0.0  # Calculated score for ranking (0-1)
+    section: str = "events"  # Day page section: "events", "births" or "observances"
+    links: List[str] = field(default_factory=list)  # Titles of the articles the item links to
+
+    @property
+    def event_text(self) -> str:
+        """Description without appended context (the feed adds a page extract after a blank line)."""
+        return self.description.split("\n\n", 1)[0]
 
     def __str__(self) -> str:
         """String representation."""
+        if self.year is None:
+            return f"{self.title} (observance)"
         years_ago = self.date.year - self.year
         return f"{self.title} ({self.year}, {years_ago} years ago)"
 
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["date"] = self.date.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Anniversary":
+        """Create an Anniversary from a to_dict() dictionary."""
+        data = dict(data)
+        data["date"] = date.fromisoformat(data["date"])
+        return cls(**data)
+
 
 class BaseFetcher(ABC):
     """Abstract base class for anniversary fetchers."""
 
+    REMOTE = True  # Fetches over the network (skipped when the run budget is low)
+
+    # Circuit breaker guarding this fetcher, attached by FetcherManager (optional)
+    breaker: Optional[CircuitBreaker] = None
+
+    @property
+    def name(self) -> str:
+        """Name used in logs."""
+        return self.__class__.__name__
+
     @abstractmethod
-    def fetch(self, target_date: date) -> List[Anniversary]:
+    def fetch(self, target_date: date, deadline: Optional[Deadline] = None) -> List[Anniversary]:
         """Fetch anniversaries for a given date.
 
         Args:
             target_date: The date to fetch anniversaries for
+            deadline: Run budget to size timeouts and retries from (optional)
 
         Returns:
             List of Anniversary objects
@@ -45,31 +87,116 @@ class BaseFetcher(ABC):
         """
         pass
 
+    async def fetch_async(self, target_date: date,
+                          deadline: Optional[Deadline] = None) -> List[Anniversary]:
+        """Fetch anniversaries without blocking the event loop.
+
+        The default implementation runs ``fetch`` in a worker thread.
+        Fetchers with a native async transport override this.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget to size timeouts and retries from (optional)
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            Exception: If fetching fails
+        """
+        import asyncio  # Deferred: Anniversary is imported by entry points that never run async
+
+        return await asyncio.to_thread(self.fetch, target_date, deadline=deadline)
+
     def is_available(self) -> bool:
         """Check if this fetcher can be used.
 
+        A fetcher is unavailable while its circuit breaker is open; when the
+        breaker is half-open, the call claims the recovery probe.
+
         Returns:
             True if available, False otherwise
         """
-        return True
+        return self.breaker is None or self.breaker.allow_request()
+
+
+@dataclass
+class FetchOutcome:
+    """Which source a fetch ended with and how long it took, for tuning."""
+
+    source: str  # Winning fetcher name(s), or "" if every source failed
+    elapsed: float  # Seconds from the first request to the result
+    started: int  # Number of sources started
+    hedged: bool  # Whether the sources were raced
+    merged: bool = False  # Whether the results of all sources were merged
+
+    def __str__(self) -> str:
+        mode = "merged" if self.merged else "hedged" if self.hedged else "serial"
+        winner = self.source or "no source"
+        return f"{winner} after {self.elapsed:.2f}s ({mode}, {self.started} sources started)"
 
 
 class FetcherManager:
-    """Manages multiple fetchers with fallback strategy."""
+    """Manages multiple fetchers with fallback strategy.
+
+    By default fetchers are tried one after another. With a hedge delay,
+    the primary source is started and, each time the delay passes without
+    a usable result (or a source fails), the next source is started in
+    parallel; the first source with candidates wins and the other sources
+    are cancelled. In merge mode every source is started at once and
+    their candidates are combined by merge_anniversaries().
 
-    def __init__(self, fetchers: List[BaseFetcher]):
+    Fetchers only parse; each source's result is turned into candidates
+    by the manager's CandidatePipeline (content filter, ordering, cuts).
+    """
+
+    # Below this much run budget, remote fetchers are skipped so the
+    # remaining time goes to selection and generation
+    REMOTE_MIN_SECONDS = 300
+
+    def __init__(self, fetchers: List[BaseFetcher], hedge_delay: Optional[float] = None,
+                 max_seconds: Optional[float] = None, breakers: Optional[BreakerStore] = None,
+                 merge: bool = False, pipeline: Optional["CandidatePipeline"] = None):
         """Initialize with list of fetchers.
 
         Args:
             fetchers: List of fetchers to try, in order
+            hedge_delay: Seconds to wait for a source before also starting
+                the next one (None for serial fallback)
+            max_seconds: Overall time limit for a hedged or merged fetch, on
+                top of the run budget (optional)
+            breakers: Store providing a circuit breaker for every remote
+                fetcher, so failing sources are skipped immediately (optional)
+            merge: Fetch from every source in parallel and return the
+                deduplicated union instead of the first result (overrides
+                hedge_delay)
+            pipeline: Stages turning a source's result into candidates
+                (defaults to the content filter only)
         """
-        self.fetchers = fetchers
+        if pipeline is None:
+            # candidates imports this module, so it is imported on first use
+            from fetchers.candidates import CandidatePipeline, positive_only
+            pipeline = CandidatePipeline([positive_only()])
 
-    def fetch_anniversaries(self, target_date: date) -> List[Anniversary]:
+        self.fetchers = fetchers
+        self.pipeline = pipeline
+        self.hedge_delay = hedge_delay
+        self.max_seconds = max_seconds
+        self.merge = merge
+        self.last_outcome: Optional[FetchOutcome] = None
+
+        if breakers is not None:
+            for fetcher in fetchers:
+                if fetcher.REMOTE and fetcher.breaker is None:
+                    fetcher.breaker = breakers.breaker(fetcher.name)
+
+    def fetch_anniversaries(self, target_date: date,
+                            deadline: Optional[Deadline] = None) -> List[Anniversary]:
         """Fetch anniversaries using fallback strategy.
 
         Args:
             target_date: The date to fetch anniversaries for
+            deadline: Run budget; when low, only local fetchers are tried (optional)
 
         Returns:
             List of Anniversary objects
@@ -77,22 +204,102 @@ class FetcherManager:
         Raises:
             Exception: If all fetchers fail
         """
-        for fetcher in self.fetchers:
-            fetcher_name = fetcher.__class__.__name__
+        if self.merge:
+            return self._fetch_merged(target_date, deadline)
+        if self.hedge_delay is not None:
+            return self._fetch_hedged(target_date, deadline)
+
+        started = time.monotonic()
+        for index, fetcher in enumerate(self.fetchers):
+            fetcher_name = fetcher.name
+
+            try:
+                if not fetcher.is_available():
+                    logger.debug(f"{fetcher_name} not available, skipping")
+                    continue
+
+                if self._over_budget(fetcher, deadline):
+                    logger.warning(f"Run budget low ({deadline}), skipping {fetcher_name}")
+                    continue
+
+                logger.info(f"Trying {fetcher_name}...")
+                try:
+                    anniversaries = fetcher.fetch(target_date, deadline=deadline)
+                except DeadlineExceeded:
+                    raise
+                except Exception:
+                    self._record_failure(fetcher)
+                    raise
+                self._record_success(fetcher)
+                anniversaries = self.pipeline.run(anniversaries, fetcher_name)
+
+                if anniversaries:
+                    logger.info(
+                        f"Successfully fetched {len(anniversaries)} anniversaries "
+                        f"from {fetcher_name}"
+                    )
+                    self._record(fetcher_name, started, index + 1, hedged=False)
+                    return anniversaries
+                else:
+                    logger.warning(f"{fetcher_name} returned no anniversaries")
+
+            except Exception as e:
+                logger.warning(f"{fetcher_name} failed: {e}")
+                continue
+
+        self._record("", started, len(self.fetchers), hedged=False)
+        raise Exception("All anniversary fetchers failed")
+
+    async def fetch_anniversaries_async(
+        self, target_date: date, deadline: Optional[Deadline] = None
+    ) -> List[Anniversary]:
+        """Async variant of fetch_anniversaries using each fetcher's fetch_async.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget; when low, only local fetchers are tried (optional)
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            Exception: If all fetchers fail
+        """
+        if self.merge:
+            return await self._fetch_merged_async(target_date, deadline)
+        if self.hedge_delay is not None:
+            return await self._fetch_hedged_async(target_date, deadline)
+
+        started = time.monotonic()
+        for index, fetcher in enumerate(self.fetchers):
+            fetcher_name = fetcher.name
 
             try:
                 if not fetcher.is_available():
                     logger.debug(f"{fetcher_name} not available, skipping")
                     continue
 
+                if self._over_budget(fetcher, deadline):
+                    logger.warning(f"Run budget low ({deadline}), skipping {fetcher_name}")
+                    continue
+
                 logger.info(f"Trying {fetcher_name}...")
-                anniversaries = fetcher.fetch(target_date)
+                try:
+                    anniversaries = await fetcher.fetch_async(target_date, deadline=deadline)
+                except DeadlineExceeded:
+                    raise
+                except Exception:
+                    self._record_failure(fetcher)
+                    raise
+                self._record_success(fetcher)
+                anniversaries = self.pipeline.run(anniversaries, fetcher_name)
 
                 if anniversaries:
                     logger.info(
                         f"Successfully fetched {len(anniversaries)} anniversaries "
                         f"from {fetcher_name}"
                     )
+                    self._record(fetcher_name, started, index + 1, hedged=False)
                     return anniversaries
                 else:
                     logger.warning(f"{fetcher_name} returned no anniversaries")
@@ -101,11 +308,416 @@ class FetcherManager:
                 logger.warning(f"{fetcher_name} failed: {e}")
                 continue
 
+        self._record("", started, len(self.fetchers), hedged=False)
         raise Exception("All anniversary fetchers failed")
 
+    def _fetch_hedged(self, target_date: date, deadline: Optional[Deadline]) -> List[Anniversary]:
+        """Race the sources, starting the next one after each hedge delay.
 
-def select_best_anniversary(anniversaries: List[Anniversary], language=None) -> Anniversary:
-    """Select the most interesting anniversary using scoring criteria.
+        Losing fetches run in worker threads that cannot be interrupted;
+        they are abandoned and end at their own (budget-capped) timeout.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget (optional)
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            Exception: If every source fails or the time limit passes
+        """
+        fetchers = self._hedge_candidates(deadline, defer_probes=True)
+        limit = self._hedge_deadline(deadline)
+        started = time.monotonic()
+        pending = {}
+        next_index = 0
+        launched = 0
+        next_start = started
+
+        pool = ThreadPoolExecutor(max_workers=max(1, len(fetchers)), thread_name_prefix="aadd-hedge")
+        try:
+            while not limit.expired():
+                if next_index < len(fetchers) and time.monotonic() >= next_start:
+                    fetcher = fetchers[next_index]
+                    next_index += 1
+                    if not self._launchable(fetcher):
+                        continue  # Start the next one now
+                    logger.info(f"Starting {fetcher.name} ({next_index}/{len(fetchers)})...")
+                    pending[pool.submit(fetcher.fetch, target_date, deadline=limit)] = fetcher
+                    launched += 1
+                    next_start = time.monotonic() + self.hedge_delay
+                if not pending:
+                    break
+
+                wait_for = self._wait_time(limit, next_start if next_index < len(fetchers) else None)
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    fetcher = pending.pop(future)
+                    anniversaries = self._usable_result(fetcher, future.exception, future.result)
+                    if anniversaries:
+                        self._record(fetcher.name, started, launched, hedged=True)
+                        return anniversaries
+                    next_start = time.monotonic()  # A source failed; start the next now
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        self._record("", started, launched, hedged=True)
+        if pending:
+            raise Exception(f"No anniversary source answered within {limit.seconds:.1f}s")
+        raise Exception("All anniversary fetchers failed")
+
+    async def _fetch_hedged_async(self, target_date: date,
+                                  deadline: Optional[Deadline]) -> List[Anniversary]:
+        """Async variant of _fetch_hedged; losing fetches are cancelled.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget (optional)
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            Exception: If every source fails or the time limit passes
+        """
+        import asyncio
+
+        fetchers = self._hedge_candidates(deadline, defer_probes=True)
+        limit = self._hedge_deadline(deadline)
+        started = time.monotonic()
+        pending = {}
+        next_index = 0
+        launched = 0
+        next_start = started
+
+        try:
+            while not limit.expired():
+                if next_index < len(fetchers) and time.monotonic() >= next_start:
+                    fetcher = fetchers[next_index]
+                    next_index += 1
+                    if not self._launchable(fetcher):
+                        continue  # Start the next one now
+                    logger.info(f"Starting {fetcher.name} ({next_index}/{len(fetchers)})...")
+                    task = asyncio.ensure_future(fetcher.fetch_async(target_date, deadline=limit))
+                    pending[task] = fetcher
+                    launched += 1
+                    next_start = time.monotonic() + self.hedge_delay
+                if not pending:
+                    break
+
+                wait_for = self._wait_time(limit, next_start if next_index < len(fetchers) else None)
+                done, _ = await asyncio.wait(pending, timeout=wait_for,
+                                             return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    fetcher = pending.pop(task)
+                    anniversaries = self._usable_result(fetcher, task.exception, task.result)
+                    if anniversaries:
+                        self._record(fetcher.name, started, launched, hedged=True)
+                        return anniversaries
+                    next_start = time.monotonic()  # A source failed; start the next now
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self._record("", started, launched, hedged=True)
+        if pending:
+            raise Exception(f"No anniversary source answered within {limit.seconds:.1f}s")
+        raise Exception("All anniversary fetchers failed")
+
+    def _fetch_merged(self, target_date: date, deadline: Optional[Deadline]) -> List[Anniversary]:
+        """Fetch from every available source in parallel and merge the results.
+
+        Sources still running at the time limit are abandoned, as in
+        _fetch_hedged.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget (optional)
+
+        Returns:
+            Deduplicated, ranked union of the sources' anniversaries
+
+        Raises:
+            Exception: If no source returns usable anniversaries
+        """
+        fetchers = self._hedge_candidates(deadline)
+        limit = self._hedge_deadline(deadline)
+        started = time.monotonic()
+
+        pool = ThreadPoolExecutor(max_workers=max(1, len(fetchers)), thread_name_prefix="aadd-merge")
+        try:
+            futures = [pool.submit(fetcher.fetch, target_date, deadline=limit) for fetcher in fetchers]
+            wait(futures, timeout=self._wait_time(limit, None))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        results = []
+        for fetcher, future in zip(fetchers, futures):
+            if not future.done():
+                logger.warning(f"{fetcher.name} did not answer within {limit.seconds:.1f}s")
+                continue
+            anniversaries = self._usable_result(fetcher, future.exception, future.result)
+            if anniversaries:
+                results.append((fetcher, anniversaries))
+
+        return self._merge_results(results, started, len(fetchers))
+
+    async def _fetch_merged_async(self, target_date: date,
+                                  deadline: Optional[Deadline]) -> List[Anniversary]:
+        """Async variant of _fetch_merged; sources still running at the limit are cancelled.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget (optional)
+
+        Returns:
+            Deduplicated, ranked union of the sources' anniversaries
+
+        Raises:
+            Exception: If no source returns usable anniversaries
+        """
+        import asyncio
+
+        fetchers = self._hedge_candidates(deadline)
+        limit = self._hedge_deadline(deadline)
+        started = time.monotonic()
+
+        tasks = [asyncio.ensure_future(fetcher.fetch_async(target_date, deadline=limit))
+                 for fetcher in fetchers]
+        done = set()
+        try:
+            if tasks:
+                done, _ = await asyncio.wait(tasks, timeout=self._wait_time(limit, None))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        results = []
+        for fetcher, task in zip(fetchers, tasks):
+            if task not in done:
+                logger.warning(f"{fetcher.name} did not answer within {limit.seconds:.1f}s")
+                continue
+            anniversaries = self._usable_result(fetcher, task.exception, task.result)
+            if anniversaries:
+                results.append((fetcher, anniversaries))
+
+        return self._merge_results(results, started, len(fetchers))
+
+    def _merge_results(self, results: List[Tuple[BaseFetcher, List[Anniversary]]],
+                       started: float, count: int) -> List[Anniversary]:
+        """Record a merged fetch and merge the usable results, in fetcher order."""
+        self._record("+".join(fetcher.name for fetcher, _ in results), started, count,
+                     hedged=False, merged=True)
+        if not results:
+            raise Exception("All anniversary fetchers failed")
+
+        merged = merge_anniversaries([anniversaries for _, anniversaries in results])
+        total = sum(len(anniversaries) for _, anniversaries in results)
+        logger.info(f"Merged {total} anniversaries from {len(results)} sources into {len(merged)}")
+        return merged
+
+    def _wait_time(self, limit: Deadline, next_start: Optional[float]) -> Optional[float]:
+        """Seconds to wait for a result: until the next hedge or the time limit (None = forever)."""
+        wait_for = limit.remaining()
+        if next_start is not None:
+            wait_for = min(wait_for, max(0.0, next_start - time.monotonic()))
+        return None if wait_for == float("inf") else wait_for
+
+    def _hedge_candidates(self, deadline: Optional[Deadline],
+                          defer_probes: bool = False) -> List[BaseFetcher]:
+        """Available fetchers that fit the run budget, in order.
+
+        is_available() claims the probe of a half-open breaker, so with
+        ``defer_probes`` fetchers with a breaker are only dropped here if it
+        is open; _launchable() checks them fully just before they start.
+        """
+        candidates = []
+        for fetcher in self.fetchers:
+            try:
+                if defer_probes and fetcher.breaker is not None:
+                    available = fetcher.breaker.state != OPEN
+                else:
+                    available = fetcher.is_available()
+                if not available:
+                    logger.debug(f"{fetcher.name} not available, skipping")
+                    continue
+            except Exception as e:
+                logger.warning(f"{fetcher.name} failed: {e}")
+                continue
+            if self._over_budget(fetcher, deadline):
+                logger.warning(f"Run budget low ({deadline}), skipping {fetcher.name}")
+                continue
+            candidates.append(fetcher)
+        return candidates
+
+    def _launchable(self, fetcher: BaseFetcher) -> bool:
+        """Final availability check of a hedge candidate about to start (see _hedge_candidates)."""
+        if fetcher.breaker is None:
+            return True  # Fully checked when the candidates were chosen
+        try:
+            if fetcher.is_available():
+                return True
+            logger.debug(f"{fetcher.name} not available, skipping")
+        except Exception as e:
+            logger.warning(f"{fetcher.name} failed: {e}")
+        return False
+
+    def _hedge_deadline(self, deadline: Optional[Deadline]) -> Deadline:
+        """Time limit for a hedged fetch: max_seconds, capped by the run budget."""
+        seconds = self.max_seconds
+        if deadline is not None and deadline.seconds is not None:
+            remaining = deadline.remaining()
+            seconds = min(seconds, remaining) if seconds else remaining
+        # A spent budget must not turn into an unlimited Deadline(0)
+        return Deadline(max(seconds, 0.001)) if seconds is not None else Deadline()
+
+    def _usable_result(self, fetcher: BaseFetcher, exception, result) -> Optional[List[Anniversary]]:
+        """Candidates from a finished source, or None if it failed or none pass the pipeline."""
+        error = exception()
+        if error is not None:
+            logger.warning(f"{fetcher.name} failed: {error}")
+            if not isinstance(error, DeadlineExceeded):
+                self._record_failure(fetcher)
+            return None
+        self._record_success(fetcher)
+
+        anniversaries = self.pipeline.run(result() or [], fetcher.name)
+        if not anniversaries:
+            logger.warning(f"{fetcher.name} returned no anniversaries")
+            return None
+
+        logger.info(f"Successfully fetched {len(anniversaries)} anniversaries from {fetcher.name}")
+        return anniversaries
+
+    def _record_success(self, fetcher: BaseFetcher) -> None:
+        """Tell the fetcher's circuit breaker (if any) that it answered."""
+        if fetcher.breaker is not None:
+            fetcher.breaker.record_success()
+
+    def _record_failure(self, fetcher: BaseFetcher) -> None:
+        """Tell the fetcher's circuit breaker (if any) that it failed."""
+        if fetcher.breaker is not None:
+            fetcher.breaker.record_failure()
+
+    def _record(self, source: str, started: float, count: int, hedged: bool,
+                merged: bool = False) -> None:
+        """Keep and log the outcome of a fetch."""
+        self.last_outcome = FetchOutcome(source, time.monotonic() - started, count, hedged, merged)
+        logger.info(f"Anniversary source: {self.last_outcome}")
+
+    def _over_budget(self, fetcher: BaseFetcher, deadline: Optional[Deadline]) -> bool:
+        """Check whether a remote fetcher should be skipped to save run budget."""
+        return deadline is not None and fetcher.REMOTE and deadline.is_low(self.REMOTE_MIN_SECONDS)
+
+
+def merge_anniversaries(source_lists: List[List[Anniversary]]) -> List[Anniversary]:
+    """Deduplicated union of several sources' anniversaries, ranked.
+
+    Anniversaries with the same year and near-identical text (see
+    NearDuplicateIndex) count as one; the copy from the earliest source is
+    kept, with the links of a later copy if it has none. Events reported
+    by more sources rank first, then source order, then each source's own
+    order.
+
+    Args:
+        source_lists: Anniversaries of each source, in priority order
+
+    Returns:
+        Merged list of Anniversary objects
+    """
+    index = NearDuplicateIndex()
+    kept: List[Anniversary] = []
+    support: List[set] = []  # Sources reporting each kept anniversary
+
+    for source, anniversaries in enumerate(source_lists):
+        for ann in anniversaries:
+            text = ann.event_text or ann.title
+            duplicate = index.add(len(kept), ann.year, text)
+            if duplicate is None:
+                kept.append(ann)
+                support.append({source})
+            else:
+                support[duplicate].add(source)
+                if not kept[duplicate].links:  # e.g. kept from a source without links
+                    kept[duplicate].links = ann.links
+
+    order = sorted(range(len(kept)), key=lambda i: -len(support[i]))  # Stable: ties keep order
+    return [kept[i] for i in order]
+
+
+# Japan-related keywords for Japanese language preference
+JAPAN_SCORE_KEYWORDS = [
+    '日本', 'Japan', 'Japanese',
+    '東京', 'Tokyo',
+    '江戸', 'Edo',
+    '京都', 'Kyoto',
+    '大阪', 'Osaka',
+    '天皇', 'Emperor',
+    '幕府', 'Shogunate',
+    '明治', 'Meiji',
+    '大正', 'Taisho',
+    '昭和', 'Showa',
+    '平成', 'Heisei',
+    '令和', 'Reiwa',
+    '将軍', 'Shogun',
+    'サムライ', 'Samurai',
+    '侍',
+]
+
+CATEGORY_SCORES = {
+    "historical": 0.3,
+    "cultural": 0.25,
+    "scientific": 0.25,
+    "political": 0.2,
+    "commemorative": 0.15,
+}
+
+
+def content_score(ann: Anniversary, language=None) -> float:
+    """Part of the interest score that depends only on the event itself.
+
+    Covers category, description richness and language-specific relevance,
+    but not the anniversary year, so it can be computed ahead of time.
+
+    Args:
+        ann: Anniversary to score
+        language: Language enum for language-specific scoring (optional)
+
+    Returns:
+        Score (not capped)
+    """
+    # Category preference
+    score = CATEGORY_SCORES.get(ann.category.lower(), 0.1)
+
+    # Description richness (longer = more interesting content)
+    desc_length = len(ann.description)
+    if desc_length > 500:
+        score += 0.2
+    elif desc_length > 250:
+        score += 0.15
+    elif desc_length > 100:
+        score += 0.1
+
+    # Language-specific relevance bonus
+    if language:
+        from config import Language
+        if language == Language.JAPANESE:
+            # Check for Japan-related keywords
+            text_to_check = f"{ann.title} {ann.description}".lower()
+            for keyword in JAPAN_SCORE_KEYWORDS:
+                if keyword.lower() in text_to_check:
+                    score += 0.5  # Major bonus for Japan-related content
+                    logger.debug(f"Japan-related keyword '{keyword}' found in: {ann.title}")
+                    break
+
+    return score
+
+
+def score_anniversary(ann: Anniversary, language=None) -> float:
+    """Interest score of an anniversary.
 
     Scoring criteria:
     - Significant anniversaries (50, 100, 150, 200 years) get bonus points
@@ -113,6 +725,37 @@ def select_best_anniversary(anniversaries: List[Anniversary], language=None) ->
     - Description richness (longer descriptions indicate more content)
     - Language-specific relevance (Japan-related for Japanese)
 
+    Args:
+        ann: Anniversary to score
+        language: Language enum for language-specific scoring (optional)
+
+    Returns:
+        Score between 0 and 1
+    """
+    score = 0.0
+
+    # Calculate years ago (observances have no year and get no bonus)
+    years_ago = ann.date.year - ann.year if ann.year is not None else 0
+
+    # Significant year bonus
+    if years_ago <= 0:
+        pass
+    elif years_ago % 100 == 0:
+        score += 0.4
+    elif years_ago % 50 == 0:
+        score += 0.3
+    elif years_ago % 25 == 0:
+        score += 0.2
+    elif years_ago % 10 == 0:
+        score += 0.1
+
+    score += content_score(ann, language)
+    return min(score, 1.0)  # Cap at 1.0
+
+
+def select_best_anniversary(anniversaries: List[Anniversary], language=None) -> Anniversary:
+    """Select the most interesting anniversary by score (see score_anniversary).
+
     Args:
         anniversaries: List of anniversaries to choose from
         language: Language enum for language-specific scoring (optional)
@@ -123,76 +766,8 @@ def select_best_anniversary(anniversaries: List[Anniversary], language=None) ->
     if not anniversaries:
         raise ValueError("Cannot select from empty list")
 
-    current_year = date.today().year
-
-    # Japan-related keywords for Japanese language preference
-    japan_keywords = [
-        '日本', 'Japan', 'Japanese',
-        '東京', 'Tokyo',
-        '江戸', 'Edo',
-        '京都', 'Kyoto',
-        '大阪', 'Osaka',
-        '天皇', 'Emperor',
-        '幕府', 'Shogunate',
-        '明治', 'Meiji',
-        '大正', 'Taisho',
-        '昭和', 'Showa',
-        '平成', 'Heisei',
-        '令和', 'Reiwa',
-        '将軍', 'Shogun',
-        'サムライ', 'Samurai',
-        '侍',
-    ]
-
     for ann in anniversaries:
-        score = 0.0
-
-        # Calculate years ago
-        years_ago = current_year - ann.year
-
-        # Significant year bonus
-        if years_ago % 100 == 0:
-            score += 0.4
-        elif years_ago % 50 == 0:
-            score += 0.3
-        elif years_ago % 25 == 0:
-            score += 0.2
-        elif years_ago % 10 == 0:
-            score += 0.1
-
-        # Category preference
-        category_scores = {
-            "historical": 0.3,
-            "cultural": 0.25,
-            "scientific": 0.25,
-            "political": 0.2,
-            "commemorative": 0.15,
-        }
-        score += category_scores.get(ann.category.lower(), 0.1)
-
-        # Description richness (longer = more interesting content)
-        desc_length = len(ann.description)
-        if desc_length > 500:
-            score += 0.2
-        elif desc_length > 250:
-            score += 0.15
-        elif desc_length > 100:
-            score += 0.1
-
-        # Language-specific relevance bonus
-        if language:
-            from config import Language
-            if language == Language.JAPANESE:
-                # Check for Japan-related keywords
-                text_to_check = f"{ann.title} {ann.description}".lower()
-                for keyword in japan_keywords:
-                    if keyword.lower() in text_to_check:
-                        score += 0.5  # Major bonus for Japan-related content
-                        logger.debug(f"Japan-related keyword '{keyword}' found in: {ann.title}")
-                        break
-
-        # Update score
-        ann.interest_score = min(score, 1.0)  # Cap at 1.0
+        ann.interest_score = score_anniversary(ann, language)
 
     # Return highest scoring
     best = max(anniversaries, key=lambda a: a.interest_score)
@@ -0,0 +1,140 @@
+"""In-process fetch cache shared by every run and site in one process."""
+
+import time
+import asyncio
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from fetchers.base_fetcher import BaseFetcher, Anniversary
+from utils.deadline import Deadline
+
+logger = logging.getLogger("AADD")
+
+
+class CachingFetcher(BaseFetcher):
+    """Wraps a fetcher so each date is fetched and parsed once per process.
+
+    Concurrent requests for the same date are single-flighted: one caller
+    fetches while the others wait for its result. Results are kept for
+    ``ttl`` seconds for the most recent ``max_entries`` dates, and every
+    caller gets its own copies, since selection writes interest_score.
+    Failures are not cached. fetch_async awaits the wrapped fetcher's own
+    fetch_async, single-flighted per event loop.
+    """
+
+    def __init__(self, fetcher: BaseFetcher, ttl: float = 900, max_entries: int = 8):
+        """Initialize caching fetcher.
+
+        Args:
+            fetcher: Fetcher to wrap
+            ttl: Seconds a result stays fresh
+            max_entries: Number of dates to keep
+        """
+        self.fetcher = fetcher
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.REMOTE = fetcher.REMOTE
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[date, Tuple[float, List[Anniversary]]]" = OrderedDict()
+        self._date_locks: Dict[date, threading.Lock] = {}
+        # asyncio locks belong to one loop, so async single-flight is per loop
+        self._async_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[date, asyncio.Lock]]" = (
+            weakref.WeakKeyDictionary())
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def name(self) -> str:
+        """Name of the wrapped fetcher."""
+        return self.fetcher.name
+
+    def fetch(self, target_date: date, deadline: Optional[Deadline] = None) -> List[Anniversary]:
+        """Fetch anniversaries, reusing a fresh cached result if there is one.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget passed to the wrapped fetcher on a miss (optional)
+
+        Returns:
+            List of Anniversary objects (copies owned by the caller)
+
+        Raises:
+            Exception: Whatever the wrapped fetcher raises
+        """
+        with self._date_lock(target_date):
+            anniversaries = self._get(target_date)
+            if anniversaries is None:
+                anniversaries = self.fetcher.fetch(target_date, deadline=deadline)
+                self._put(target_date, anniversaries)
+
+        return [replace(ann) for ann in anniversaries]
+
+    async def fetch_async(self, target_date: date,
+                          deadline: Optional[Deadline] = None) -> List[Anniversary]:
+        """Async variant of fetch, awaiting the wrapped fetcher's fetch_async on a miss.
+
+        Cancelling the call cancels the wrapped fetch; a waiter for the
+        same date then fetches itself.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget passed to the wrapped fetcher on a miss (optional)
+
+        Returns:
+            List of Anniversary objects (copies owned by the caller)
+
+        Raises:
+            Exception: Whatever the wrapped fetcher raises
+        """
+        async with self._async_date_lock(target_date):
+            anniversaries = self._get(target_date)
+            if anniversaries is None:
+                anniversaries = await self.fetcher.fetch_async(target_date, deadline=deadline)
+                self._put(target_date, anniversaries)
+
+        return [replace(ann) for ann in anniversaries]
+
+    def is_available(self) -> bool:
+        """Check if the wrapped fetcher can be used and this wrapper's breaker allows it."""
+        return self.fetcher.is_available() and super().is_available()
+
+    def _date_lock(self, target_date: date) -> threading.Lock:
+        """Lock serializing fetches of one date (the single-flight)."""
+        with self._lock:
+            return self._date_locks.setdefault(target_date, threading.Lock())
+
+    def _async_date_lock(self, target_date: date) -> asyncio.Lock:
+        """Lock serializing async fetches of one date in the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            locks = self._async_locks.setdefault(loop, {})
+            return locks.setdefault(target_date, asyncio.Lock())
+
+    def _get(self, target_date: date) -> Optional[List[Anniversary]]:
+        """Fresh cached result for a date, or None."""
+        with self._lock:
+            entry = self._entries.get(target_date)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(target_date)
+                self.hits += 1
+                logger.debug(f"{self.name} cache hit for {target_date.isoformat()}")
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def _put(self, target_date: date, anniversaries: List[Anniversary]) -> None:
+        """Store a result, evicting the least recently used dates."""
+        with self._lock:
+            self._entries[target_date] = (time.monotonic(), anniversaries)
+            self._entries.move_to_end(target_date)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._date_locks.pop(evicted, None)
+                for locks in self._async_locks.values():
+                    locks.pop(evicted, None)
@@ -0,0 +1,216 @@
+"""Candidate pipeline: lazy filter, order and shortlist stages over fetched anniversaries."""
+
+import time
+import logging
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from config import Language
+from fetchers.base_fetcher import Anniversary, score_anniversary
+from utils.content_filter import is_positive_topic
+
+logger = logging.getLogger("AADD")
+
+# A pipeline step: takes the stream of the previous step, yields what passes
+Stage = Callable[[Iterator[Anniversary]], Iterator[Anniversary]]
+
+# Keywords marking an event as Japan-related (matched case-insensitively)
+JAPAN_KEYWORDS = [
+    '日本', 'Japan', '東京', 'Tokyo', '江戸', 'Edo',
+    '京都', 'Kyoto', '大阪', 'Osaka',
+    '幕府', 'Shogunate', '明治', 'Meiji', '大正', 'Taisho',
+    '昭和', 'Showa', '平成', 'Heisei', '令和', 'Reiwa',
+    '将軍', 'Shogun', 'サムライ', 'Samurai', '侍',
+    '作動', 'sado', '和', '記念日','の日'
+]
+_JAPAN_KEYWORDS_LOWER = [keyword.lower() for keyword in JAPAN_KEYWORDS]
+
+
+def is_japan_related(anniversary: Anniversary) -> bool:
+    """Check whether an anniversary's event text mentions Japan.
+
+    Args:
+        anniversary: Anniversary to check
+
+    Returns:
+        True if a JAPAN_KEYWORDS keyword appears in the title or event text
+    """
+    text = f"{anniversary.title} {anniversary.event_text}".lower()
+    return any(keyword in text for keyword in _JAPAN_KEYWORDS_LOWER)
+
+
+def positive_only() -> Tuple[str, Stage]:
+    """Stage dropping negative topics (war, violence, tragedy); see is_positive_topic."""
+    def stage(items: Iterator[Anniversary]) -> Iterator[Anniversary]:
+        return (ann for ann in items if is_positive_topic(ann))
+    return "positive", stage
+
+
+def japan_first() -> Tuple[str, Stage]:
+    """Stage yielding Japan-related events at once and the others after them, each in order.
+
+    Reads its whole input before yielding the others, so a later cut does
+    not spare the stages before it.
+    """
+    def stage(items: Iterator[Anniversary]) -> Iterator[Anniversary]:
+        others = []
+        for ann in items:
+            if is_japan_related(ann):
+                yield ann
+            else:
+                others.append(ann)
+        yield from others
+    return "japan_first", stage
+
+
+def per_section(limit: int, sections: Sequence[str] = ("events",)) -> Tuple[str, Stage]:
+    """Stage keeping the first ``limit`` anniversaries of each section, grouped by section.
+
+    Stops reading its input once every listed section is full. Sections
+    come out in the order of ``sections``, then any others in the order
+    they were first seen.
+
+    Args:
+        limit: Anniversaries kept per section
+        sections: Section names, in output order
+    """
+    def stage(items: Iterator[Anniversary]) -> Iterator[Anniversary]:
+        kept: Dict[str, List[Anniversary]] = {name: [] for name in sections}
+        for ann in items:
+            section = kept.setdefault(ann.section, [])
+            if len(section) < limit:
+                section.append(ann)
+                if sections and all(len(kept[name]) >= limit for name in sections):
+                    break
+        for section in kept.values():
+            yield from section
+    return "per_section", stage
+
+
+def ranked(language: Optional[Language] = None) -> Tuple[str, Stage]:
+    """Stage scoring every anniversary (see score_anniversary), highest score first.
+
+    Args:
+        language: Language for language-specific scoring (optional)
+    """
+    def stage(items: Iterator[Anniversary]) -> Iterator[Anniversary]:
+        anniversaries = list(items)
+        for ann in anniversaries:
+            ann.interest_score = score_anniversary(ann, language)
+        yield from sorted(anniversaries, key=lambda ann: -ann.interest_score)  # Stable for ties
+    return "ranked", stage
+
+
+def shortlist(size: int) -> Tuple[str, Stage]:
+    """Stage passing the first ``size`` anniversaries and reading no further."""
+    def stage(items: Iterator[Anniversary]) -> Iterator[Anniversary]:
+        return islice(items, size)
+    return "shortlist", stage
+
+
+@dataclass
+class StageStats:
+    """What one stage did in the last run."""
+
+    name: str
+    received: int  # Anniversaries read from the previous stage
+    passed: int  # Anniversaries yielded
+    seconds: float  # Time spent in this stage alone
+
+    def __str__(self) -> str:
+        return f"{self.name} {self.received}->{self.passed} ({self.seconds * 1000:.1f} ms)"
+
+
+class _Meter:
+    """Iterator wrapper counting items and the time spent producing them."""
+
+    def __init__(self, items: Iterable[Anniversary]):
+        self._items = iter(items)
+        self.count = 0
+        self.seconds = 0.0
+
+    def __iter__(self) -> "_Meter":
+        return self
+
+    def __next__(self) -> Anniversary:
+        started = time.perf_counter()
+        try:
+            item = next(self._items)
+        finally:
+            self.seconds += time.perf_counter() - started
+        self.count += 1
+        return item
+
+
+class CandidatePipeline:
+    """Stages that turn a source's anniversaries into selection candidates.
+
+    Sources only parse; filtering, ordering and cutting happen here, once,
+    whatever the source. Stages are generators chained lazily, so a stage
+    that has enough (per_section, shortlist) stops the stages before it
+    from reading further, e.g. the English content filter never looks at
+    events past the per-section cut. A stage that reorders (japan_first,
+    ranked) reads its whole input first, so the stages before it always
+    see every event; for Japanese, the content filter reads the whole day.
+
+    ``last_stats`` holds the counts and timings of the last run.
+    """
+
+    def __init__(self, stages: Sequence[Tuple[str, Stage]]):
+        """Initialize pipeline.
+
+        Args:
+            stages: (name, stage) pairs, in order
+        """
+        self.stages = list(stages)
+        self.last_stats: List[StageStats] = []
+
+    def run(self, anniversaries: Iterable[Anniversary], source: str = "") -> List[Anniversary]:
+        """Run the anniversaries through every stage.
+
+        Args:
+            anniversaries: Source anniversaries, in source order
+            source: Source name for the log (optional)
+
+        Returns:
+            Candidates that passed, in pipeline order
+        """
+        meters = [_Meter(anniversaries)]
+        for _, stage in self.stages:
+            meters.append(_Meter(stage(meters[-1])))
+        candidates = list(meters[-1])
+
+        self.last_stats = [
+            StageStats(name, received.count, passed.count, passed.seconds - received.seconds)
+            for (name, _), received, passed in zip(self.stages, meters, meters[1:])
+        ]
+        logger.info(f"Candidates{' from ' + source if source else ''}: "
+                    f"{', '.join(str(stats) for stats in self.last_stats)}")
+        return candidates
+
+
+def candidate_pipeline(language: Language, sections: Sequence[str] = ("events",),
+                       per_section_limit: int = 15, shortlist_size: int = 0) -> CandidatePipeline:
+    """The pipeline every run uses for a language.
+
+    Positive topics only; for Japanese, Japan-related events first; up to
+    ``per_section_limit`` per day page section; and, with a shortlist
+    size, the best ``shortlist_size`` by score.
+
+    Args:
+        language: Language the candidates are for
+        sections: Day page sections read, in output order
+        per_section_limit: Candidates kept per section
+        shortlist_size: Candidates kept after ranking (0 = all, unranked)
+
+    Returns:
+        CandidatePipeline
+    """
+    stages = [positive_only()]
+    if language == Language.JAPANESE:
+        stages.append(japan_first())
+    stages.append(per_section(per_section_limit, sections))
+    if shortlist_size > 0:
+        stages += [ranked(language), shortlist(shortlist_size)]
+    return CandidatePipeline(stages)
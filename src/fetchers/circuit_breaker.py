@@ -0,0 +1,176 @@
+"""Per-fetcher circuit breakers with state persisted between runs."""
+
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List
+
+logger = logging.getLogger("AADD")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class BreakerState:
+    """Persisted state of one breaker (times are wall-clock, so they survive restarts)."""
+
+    state: str = CLOSED
+    failures: List[float] = field(default_factory=list)  # Recent failure times
+    opened_at: float = 0.0
+    cooldown: float = 0.0  # Seconds to stay open; doubles after each failed probe
+    last_probe_at: float = 0.0
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one fetcher.
+
+    Closed: requests pass; ``failure_threshold`` failures within ``window``
+    seconds open it. Open: requests are refused until the cooldown has
+    passed, then it goes half-open. Half-open: one probe request is let
+    through per ``probe_interval``; success closes the breaker, failure
+    reopens it with a doubled cooldown (up to ``max_cooldown``).
+    """
+
+    def __init__(self, name: str, store: "BreakerStore", failure_threshold: int = 3,
+                 window: float = 3600, cooldown: float = 900, max_cooldown: float = 6 * 3600,
+                 probe_interval: float = 60):
+        """Initialize breaker.
+
+        Args:
+            name: Fetcher name, used as the key in the store
+            store: Store persisting the state
+            failure_threshold: Failures within the window that open the breaker
+            window: Seconds a failure counts towards the threshold
+            cooldown: Seconds the breaker stays open before the first probe
+            max_cooldown: Upper bound for the doubled cooldown
+            probe_interval: Minimum seconds between probes while half-open
+        """
+        self.name = name
+        self.store = store
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_interval = probe_interval
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self.store.lock:
+            return self._refresh(self.store.get(self.name), time.time()).state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, claiming the probe slot if half-open.
+
+        Returns:
+            True if the fetcher may be used now
+        """
+        now = time.time()
+        with self.store.lock:
+            entry = self._refresh(self.store.get(self.name), now)
+            if entry.state == CLOSED:
+                return True
+            if entry.state == HALF_OPEN and now - entry.last_probe_at >= self.probe_interval:
+                entry.last_probe_at = now
+                self.store.save()
+                logger.info(f"Circuit breaker for {self.name} is half-open; probing")
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        with self.store.lock:
+            entry = self.store.get(self.name)
+            if entry.state != CLOSED or entry.failures:
+                if entry.state != CLOSED:
+                    logger.info(f"Circuit breaker for {self.name} closed")
+                self.store.put(self.name, BreakerState())
+                self.store.save()
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker when the threshold is reached."""
+        now = time.time()
+        with self.store.lock:
+            entry = self._refresh(self.store.get(self.name), now)
+            if entry.state == HALF_OPEN:
+                self._open(entry, now, min(max(entry.cooldown, self.cooldown) * 2, self.max_cooldown))
+            elif entry.state == CLOSED:
+                entry.failures = [t for t in entry.failures if now - t < self.window] + [now]
+                if len(entry.failures) >= self.failure_threshold:
+                    self._open(entry, now, self.cooldown)
+            self.store.save()
+
+    def _open(self, entry: BreakerState, now: float, cooldown: float) -> None:
+        """Move to open for the given cooldown."""
+        entry.state = OPEN
+        entry.opened_at = now
+        entry.cooldown = cooldown
+        entry.failures = []
+        logger.warning(f"Circuit breaker for {self.name} opened for {cooldown:.0f}s")
+
+    def _refresh(self, entry: BreakerState, now: float) -> BreakerState:
+        """Move an open breaker whose cooldown has passed to half-open."""
+        if entry.state == OPEN and now - entry.opened_at >= entry.cooldown:
+            entry.state = HALF_OPEN
+            entry.last_probe_at = 0.0
+        return entry
+
+
+class BreakerStore:
+    """JSON file holding the state of every breaker.
+
+    Loaded once and rewritten atomically on every change, so breakers stay
+    open across scheduled runs and daemon restarts.
+    """
+
+    def __init__(self, path: Path, **breaker_settings):
+        """Initialize store.
+
+        Args:
+            path: State file
+            **breaker_settings: CircuitBreaker keyword arguments for breakers
+                created by breaker()
+        """
+        self.path = Path(path)
+        self.lock = threading.RLock()
+        self.breaker_settings = breaker_settings
+        self._states: Dict[str, BreakerState] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._states = {name: BreakerState(**state) for name, state in data.items()}
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable circuit breaker state {self.path}: {e}")
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        """The breaker for a fetcher name, created on first use."""
+        with self.lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name, self, **self.breaker_settings)
+            return self._breakers[name]
+
+    def get(self, name: str) -> BreakerState:
+        """State of a breaker (created closed if unknown)."""
+        return self._states.setdefault(name, BreakerState())
+
+    def put(self, name: str, state: BreakerState) -> None:
+        """Replace the state of a breaker."""
+        self._states[name] = state
+
+    def save(self) -> None:
+        """Atomically write every breaker's state."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            data = {name: asdict(state) for name, state in self._states.items()}
+            tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save circuit breaker state: {e}")
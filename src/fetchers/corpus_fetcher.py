@@ -0,0 +1,154 @@
+"""Offline anniversary fetcher backed by a prebuilt annual corpus."""
+
+import gzip
+import json
+import logging
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import Language
+from fetchers.base_fetcher import BaseFetcher, Anniversary
+from utils.deadline import Deadline
+
+logger = logging.getLogger("AADD")
+
+# Bump when the file layout changes; older corpora are ignored until rebuilt
+CORPUS_VERSION = 3
+
+# Order of the values in each stored event (year is None for observances)
+CORPUS_FIELDS = ["year", "title", "description", "category", "source", "section"]
+
+
+def corpus_file(data_dir: Path, language: Language) -> Path:
+    """Path of the corpus file for a language.
+
+    Args:
+        data_dir: Data directory
+        language: Corpus language
+
+    Returns:
+        Path to the gzipped corpus file
+    """
+    return Path(data_dir) / f"corpus_{language.value}.json.gz"
+
+
+def encode_events(anniversaries: List[Anniversary]) -> list:
+    """Compact value lists (see CORPUS_FIELDS) for stored events."""
+    return [[getattr(ann, field) for field in CORPUS_FIELDS] for ann in anniversaries]
+
+
+def decode_events(target_date: date, events: list) -> List[Anniversary]:
+    """Anniversaries for a date from stored value lists."""
+    return [Anniversary(date=target_date, **dict(zip(CORPUS_FIELDS, values))) for values in events]
+
+
+def save_corpus(path: Path, language: Language, days: Dict[str, list]) -> None:
+    """Write a corpus file atomically.
+
+    Args:
+        path: Destination file
+        language: Corpus language
+        days: Encoded events (see encode_events) per MM-DD key
+    """
+    data = {
+        "version": CORPUS_VERSION,
+        "language": language.value,
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+        "fields": CORPUS_FIELDS,
+        "days": {key: days[key] for key in sorted(days)},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    tmp_path.replace(path)
+
+
+def load_corpus(path: Path) -> Dict[str, list]:
+    """Read the per-day events of a corpus file.
+
+    Args:
+        path: Corpus file
+
+    Returns:
+        Encoded events per MM-DD key
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is malformed or from another corpus version
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, dict) or data.get("version") != CORPUS_VERSION:
+        raise ValueError(f"{path} is not a version {CORPUS_VERSION} corpus; rebuild it")
+    if data.get("fields") != CORPUS_FIELDS:
+        raise ValueError(f"{path} has unexpected fields: {data.get('fields')}")
+    return data["days"]
+
+
+class OfflineCorpusFetcher(BaseFetcher):
+    """Serves anniversaries from a corpus built by build_corpus.py.
+
+    The corpus holds the already parsed and filtered day pages, so a fetch
+    is a dictionary lookup and needs no network access.
+    """
+
+    REMOTE = False
+
+    def __init__(self, corpus_path: Path):
+        """Initialize corpus fetcher.
+
+        Args:
+            corpus_path: Path to the corpus file
+        """
+        self.corpus_path = Path(corpus_path)
+        self._days: Dict[str, list] = {}
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def fetch(self, target_date: date, deadline: Optional[Deadline] = None) -> List[Anniversary]:
+        """Fetch anniversaries from the corpus.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Unused; reading local data is always within budget
+
+        Returns:
+            List of Anniversary objects
+        """
+        events = self._load().get(target_date.strftime("%m-%d"), [])
+        anniversaries = decode_events(target_date, events)
+        logger.info(f"Loaded {len(anniversaries)} events from corpus {self.corpus_path.name}")
+        return anniversaries
+
+    def is_available(self) -> bool:
+        """Check if a readable corpus of the current version exists.
+
+        Returns:
+            True if the corpus can be served, False otherwise
+        """
+        return bool(self._load())
+
+    def _load(self) -> Dict[str, list]:
+        """Load the corpus, again whenever the file is rebuilt.
+
+        An unreadable corpus serves nothing until it is rebuilt.
+        """
+        try:
+            mtime = self.corpus_path.stat().st_mtime
+        except OSError:
+            return {}  # Not built yet
+
+        with self._lock:
+            if mtime != self._mtime:
+                try:
+                    self._days = load_corpus(self.corpus_path)
+                    logger.debug(f"Loaded corpus {self.corpus_path} ({len(self._days)} days)")
+                except Exception as e:
+                    logger.error(f"Failed to load corpus {self.corpus_path}: {e}")
+                    self._days = {}
+                self._mtime = mtime
+            return self._days
@@ -0,0 +1,305 @@
+"""Offline anniversary fetcher reading day pages from a local Wikipedia dump."""
+
+import bz2
+import html
+import json
+import mmap
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config import Language
+from fetchers.base_fetcher import BaseFetcher, Anniversary
+from fetchers.wikipedia_fetcher import WikipediaFetcher
+from fetchers.wikipedia_ja_fetcher import WikipediaJaFetcher
+from fetchers.wikitext import extract_wikitext_sections
+from utils.deadline import Deadline
+
+logger = logging.getLogger("AADD")
+
+# Bump when the index layout changes; older indexes are rebuilt
+DUMP_INDEX_VERSION = 1
+
+# Compressed bytes fed to the decompressor at a time while looking for a page
+DECOMPRESS_CHUNK_SIZE = 64 * 1024
+
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December"]
+DAYS_IN_MONTH = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+
+def day_page_title(language: Language, month: int, day: int) -> str:
+    """Title of a day page as it appears in the dump.
+
+    Args:
+        language: Wikipedia edition
+        month: Month (1-12)
+        day: Day of the month
+
+    Returns:
+        e.g. "January 1" or "1月1日"
+    """
+    if language == Language.JAPANESE:
+        return f"{month}月{day}日"
+    return f"{MONTH_NAMES[month - 1]} {day}"
+
+
+def day_page_titles(language: Language) -> List[str]:
+    """Titles of all 366 day pages."""
+    return [day_page_title(language, month, day)
+            for month in range(1, 13) for day in range(1, DAYS_IN_MONTH[month - 1] + 1)]
+
+
+def find_dump(dump_dir: Path, language: Language) -> Optional[Tuple[Path, Path]]:
+    """Newest multistream dump and its index file for a language in a directory.
+
+    Args:
+        dump_dir: Directory with downloaded dumps
+        language: Wikipedia edition
+
+    Returns:
+        (dump file, index file), or None if there is no complete pair
+    """
+    pattern = f"{language.value}wiki-*-pages-articles-multistream.xml.bz2"
+    for dump_file in sorted(Path(dump_dir).glob(pattern), reverse=True):
+        index_file = dump_file.with_name(dump_file.name.replace(".xml.bz2", "-index.txt.bz2"))
+        if index_file.exists():
+            return dump_file, index_file
+    return None
+
+
+def build_dump_index(dump_file: Path, multistream_index: Path, index_file: Path,
+                     language: Language) -> Dict[str, List[int]]:
+    """Find the compressed block of every day page and save the offsets.
+
+    Reads the dump's multistream index ("offset:page id:title" per line),
+    which takes a few minutes for a large edition but is done once per dump.
+
+    Args:
+        dump_file: Multistream dump (.xml.bz2)
+        multistream_index: The dump's index (-index.txt.bz2)
+        index_file: JSON file to write
+        language: Wikipedia edition of the dump
+
+    Returns:
+        [start, end) byte range of the block holding each day page title
+    """
+    wanted = set(day_page_titles(language))
+    blocks: Dict[str, List[int]] = {}
+    open_titles: List[str] = []  # Found titles whose block end is not known yet
+
+    with bz2.open(multistream_index, "rt", encoding="utf-8") as f:
+        for line in f:
+            offset_text, _, rest = line.partition(":")
+            offset = int(offset_text)
+            if open_titles and offset > blocks[open_titles[0]][0]:
+                for title in open_titles:
+                    blocks[title][1] = offset
+                open_titles = []
+                if len(blocks) == len(wanted):
+                    break
+
+            title = rest.partition(":")[2].rstrip("\n")
+            if title in wanted and title not in blocks:
+                blocks[title] = [offset, -1]
+                open_titles.append(title)
+
+    for title in open_titles:  # Last block of the dump
+        blocks[title][1] = dump_file.stat().st_size
+
+    stat = dump_file.stat()
+    data = {
+        "version": DUMP_INDEX_VERSION,
+        "dump": dump_file.name,
+        "dump_size": stat.st_size,
+        "dump_mtime": stat.st_mtime,
+        "blocks": blocks,
+    }
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_file.with_suffix(index_file.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(index_file)
+
+    logger.info(f"Indexed {len(blocks)} of {len(wanted)} day pages in {dump_file.name}")
+    return blocks
+
+
+def load_dump_index(dump_file: Path, index_file: Path) -> Optional[Dict[str, List[int]]]:
+    """Offsets saved by build_dump_index, if they belong to this dump.
+
+    Args:
+        dump_file: Multistream dump
+        index_file: JSON file written by build_dump_index
+
+    Returns:
+        Block byte ranges per title, or None if the index is missing or stale
+    """
+    try:
+        data = json.loads(index_file.read_text(encoding="utf-8"))
+        stat = dump_file.stat()
+    except (OSError, ValueError):
+        return None
+
+    if (data.get("version") != DUMP_INDEX_VERSION or data.get("dump") != dump_file.name
+            or data.get("dump_size") != stat.st_size or data.get("dump_mtime") != stat.st_mtime):
+        return None
+    return data["blocks"]
+
+
+def read_page_text(dump: mmap.mmap, start: int, end: int, title: str) -> Optional[str]:
+    """Wikitext of one page from a compressed block.
+
+    The block is decompressed in chunks only until the page's text is
+    complete, so pages early in a block cost less.
+
+    Args:
+        dump: Memory-mapped dump file
+        start: Block start offset
+        end: Block end offset
+        title: Page title
+
+    Returns:
+        Page wikitext, or None if the block has no such page
+    """
+    title_tag = f"<title>{html.escape(title, quote=False)}</title>".encode("utf-8")
+    decompressor = bz2.BZ2Decompressor()
+    xml = bytearray()
+    title_at = -1
+    position = start
+    while position < end and not decompressor.eof:
+        chunk_end = min(position + DECOMPRESS_CHUNK_SIZE, end)
+        searched = len(xml)
+        xml += decompressor.decompress(dump[position:chunk_end])
+        position = chunk_end
+
+        if title_at == -1:
+            title_at = xml.find(title_tag, max(0, searched - len(title_tag)))
+            if title_at == -1:
+                continue
+
+        text_at = xml.find(b"<text", title_at)
+        tag_end = xml.find(b">", text_at) if text_at != -1 else -1
+        if tag_end == -1:
+            continue
+        if xml[tag_end - 1:tag_end] == b"/":
+            return ""  # <text ... /> (empty page)
+        text_end = xml.find(b"</text>", tag_end)
+        if text_end != -1:
+            return html.unescape(xml[tag_end + 1:text_end].decode("utf-8"))
+    return None
+
+
+class WikipediaDumpFetcher(BaseFetcher):
+    """Reads day pages from a local multistream Wikipedia dump.
+
+    Needs no network: the block holding the day page is located through an
+    offset index built once per dump (see build_dump_index), read through
+    a memory map and decompressed only as far as the page. The page's list
+    sections, subsections included, are parsed like the live day pages, so
+    results match the Wikipedia fetcher for the language. Recently read
+    pages are kept in memory for repeated lookups.
+    """
+
+    REMOTE = False
+    MAX_CACHED_PAGES = 32
+
+    def __init__(self, language: Language, dump_file: Path, index_file: Path,
+                 sections: Sequence[str] = ("events", "births", "observances")):
+        """Initialize dump fetcher.
+
+        Args:
+            language: Wikipedia edition of the dump
+            dump_file: Multistream dump (.xml.bz2)
+            index_file: Offset index written by build_dump_index
+            sections: Names of the day page sections to read
+        """
+        self.language = language
+        self.dump_file = Path(dump_file)
+        self.index_file = Path(index_file)
+        if language == Language.JAPANESE:
+            self.page_parser = WikipediaJaFetcher(sections=sections)
+        else:
+            self.page_parser = WikipediaFetcher(sections=sections)
+
+        self._lock = threading.Lock()
+        self._blocks: Optional[Dict[str, List[int]]] = None
+        self._dump: Optional[mmap.mmap] = None
+        self._pages: "OrderedDict[str, str]" = OrderedDict()
+
+    @property
+    def name(self) -> str:
+        """Name including the language."""
+        return f"{self.__class__.__name__}[{self.language.value}]"
+
+    def fetch(self, target_date: date, deadline: Optional[Deadline] = None) -> List[Anniversary]:
+        """Fetch anniversaries from the dump.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Unused; reading local data is always within budget
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            OSError: If the dump cannot be read
+            ValueError: If the index is missing or does not match the dump
+        """
+        title = day_page_title(self.language, target_date.month, target_date.day)
+        wikitext = self._page_text(title)
+        if wikitext is None:
+            logger.warning(f"Day page {title} not found in {self.dump_file.name}")
+            return []
+
+        parser = self.page_parser
+        headings = {name: parser.SECTIONS[name][1] or parser.SECTIONS[name][0].replace("_", " ")
+                    for name in parser.sections}
+        items = extract_wikitext_sections(wikitext, list(headings.values()))
+        return parser.parse_sections({name: items[heading] for name, heading in headings.items()},
+                                     target_date)
+
+    def is_available(self) -> bool:
+        """Check if the dump exists and has a current offset index.
+
+        Returns:
+            True if the dump can be read, False otherwise
+        """
+        return self.dump_file.exists() and self._load_blocks() is not None
+
+    def _load_blocks(self) -> Optional[Dict[str, List[int]]]:
+        """Block offsets per title, loaded once."""
+        with self._lock:
+            if self._blocks is None:
+                self._blocks = load_dump_index(self.dump_file, self.index_file)
+                if self._blocks is None and self.dump_file.exists():
+                    logger.warning(f"No offset index for {self.dump_file.name}; "
+                                   f"run build_dump_index.py")
+            return self._blocks
+
+    def _page_text(self, title: str) -> Optional[str]:
+        """Wikitext of a day page, from memory or the dump."""
+        blocks = self._load_blocks()
+        if blocks is None:
+            raise ValueError(f"No offset index for {self.dump_file.name}")
+
+        with self._lock:
+            if title in self._pages:
+                self._pages.move_to_end(title)
+                return self._pages[title]
+            if title not in blocks:
+                return None
+
+            if self._dump is None:
+                with open(self.dump_file, "rb") as f:
+                    self._dump = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            start, end = blocks[title]
+            wikitext = read_page_text(self._dump, start, end, title)
+
+            if wikitext is not None:
+                self._pages[title] = wikitext
+                if len(self._pages) > self.MAX_CACHED_PAGES:
+                    self._pages.popitem(last=False)
+            return wikitext
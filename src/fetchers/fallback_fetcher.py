@@ -1,13 +1,17 @@
 """Fallback anniversary fetcher using static JSON data."""
 
 import json
+import sqlite3
 import logging
+import threading
 from datetime import date
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
+from config import Language
 from fetchers.base_fetcher import BaseFetcher, Anniversary
-from utils.content_filter import filter_positive_anniversaries
+from fetchers.fallback_index import FallbackIndex, compile_fallback_index, source_stamp
+from utils.deadline import Deadline
 
 logger = logging.getLogger("AADD")
 
@@ -17,16 +21,31 @@ class FallbackFetcher(BaseFetcher):
 
     This fetcher serves as a last resort when all API/web fetchers fail.
     It uses a pre-populated JSON file with historical events.
+
+    With an index file, the JSON is compiled into an SQLite index (see
+    fetchers.fallback_index) the first time it is needed and again, for the
+    changed days only, whenever the JSON changes; each fetch then reads one
+    day with the content filter already applied.
     """
 
-    def __init__(self, data_file: Path):
+    REMOTE = False
+
+    def __init__(self, data_file: Path, index_file: Optional[Path] = None,
+                 language: Optional[Language] = None):
         """Initialize fallback fetcher.
 
         Args:
             data_file: Path to JSON file with fallback data
+            index_file: Compiled index to read instead of the JSON (optional)
+            language: Language for the precomputed scores (optional)
         """
         self.data_file = data_file
+        self.index_file = index_file
+        self.language = language
         self._data = None
+        self._index = FallbackIndex(index_file) if index_file else None
+        self._index_lock = threading.Lock()
+        self._compiled_stamp = None
 
     def _load_data(self):
         """Load data from JSON file."""
@@ -44,15 +63,22 @@ class FallbackFetcher(BaseFetcher):
                 logger.error(f"Failed to load fallback data: {e}")
                 self._data = {}
 
-    def fetch(self, target_date: date) -> List[Anniversary]:
+    def fetch(self, target_date: date, deadline: Optional[Deadline] = None) -> List[Anniversary]:
         """Fetch anniversaries from static data.
 
         Args:
             target_date: The date to fetch anniversaries for
+            deadline: Unused; reading local data is always within budget
 
         Returns:
             List of Anniversary objects
         """
+        if self._index is not None:
+            try:
+                return self._fetch_indexed(target_date)
+            except (OSError, ValueError, sqlite3.Error) as e:
+                logger.warning(f"Fallback index unusable, reading {self.data_file.name}: {e}")
+
         self._load_data()
 
         # Format key as MM-DD
@@ -79,11 +105,28 @@ class FallbackFetcher(BaseFetcher):
                 continue
 
         logger.info(f"Loaded {len(anniversaries)} events from fallback data")
+        return anniversaries
 
-        # Filter out negative topics (war, violence, tragedy)
-        positive_events = filter_positive_anniversaries(anniversaries)
-        logger.info(f"After filtering negative topics: {len(positive_events)} positive events")
+    def _fetch_indexed(self, target_date: date) -> List[Anniversary]:
+        """Read one day from the compiled index, compiling it first if the JSON changed.
 
+        Args:
+            target_date: The date to fetch anniversaries for
+
+        Returns:
+            List of positive Anniversary objects
+        """
+        with self._index_lock:
+            stamp = source_stamp(self.data_file)
+            if stamp != self._compiled_stamp:
+                compile_fallback_index(self.data_file, self.index_file, self.language)
+                self._compiled_stamp = stamp
+
+        positive_events = self._index.events(target_date)
+        if not positive_events:
+            logger.warning(f"No positive fallback data for {target_date.strftime('%m-%d')}")
+        else:
+            logger.info(f"Loaded {len(positive_events)} positive events from fallback index")
         return positive_events
 
     def is_available(self) -> bool:
@@ -0,0 +1,216 @@
+"""Compiled SQLite index of the fallback anniversary JSON."""
+
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+
+from config import Language
+from fetchers.base_fetcher import Anniversary, content_score
+from utils.content_filter import is_positive_topic, NEGATIVE_KEYWORDS_EN, NEGATIVE_KEYWORDS_JA
+
+logger = logging.getLogger("AADD")
+
+# Bump when the schema or the precomputed columns change meaning
+INDEX_VERSION = 1
+
+# Bytes of the index mapped into memory by each reader connection
+MMAP_SIZE = 64 * 1024 * 1024
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS days (
+        day TEXT PRIMARY KEY,
+        hash TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS events (
+        day TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        year INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL,
+        category TEXT NOT NULL,
+        positive INTEGER NOT NULL,
+        score REAL NOT NULL,
+        PRIMARY KEY (day, position)
+    ) WITHOUT ROWID;
+"""
+
+
+@dataclass
+class CompileResult:
+    """What a compile changed."""
+
+    days_written: int = 0
+    days_removed: int = 0
+    days_unchanged: int = 0
+    skipped: bool = False  # JSON unchanged since the last compile; nothing was read
+
+
+def source_stamp(data_file: Path) -> str:
+    """Modification time and size of the JSON, to skip unchanged files without reading them."""
+    stat = data_file.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _rules_fingerprint(language: Optional[Language]) -> str:
+    """Fingerprint of everything the precomputed columns depend on besides the event."""
+    rules = [INDEX_VERSION, language.value if language else "",
+             NEGATIVE_KEYWORDS_EN, NEGATIVE_KEYWORDS_JA]
+    return hashlib.sha1(json.dumps(rules, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _day_hash(events: list, rules: str) -> str:
+    """Fingerprint of one day's events and the scoring rules."""
+    payload = json.dumps([rules, events], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _event_rows(day: str, events: list, language: Optional[Language]) -> List[tuple]:
+    """Rows for one day with positivity verdict and content score precomputed."""
+    rows = []
+    for position, event in enumerate(events):
+        try:
+            ann = Anniversary(
+                date=date(2000, 1, 1),  # Placeholder; only the event fields are scored
+                title=event["title"],
+                description=event["description"],
+                category=event.get("category", "historical"),
+                year=event["year"],
+                source="Fallback"
+            )
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Malformed fallback event (missing {e}): {event}")
+            continue
+
+        rows.append((day, position, ann.year, ann.title, ann.description, ann.category,
+                     int(is_positive_topic(ann)), content_score(ann, language)))
+    return rows
+
+
+def compile_fallback_index(data_file: Path, index_file: Path,
+                           language: Optional[Language] = None) -> CompileResult:
+    """Compile (or incrementally update) the index for a fallback JSON file.
+
+    The JSON is not read at all if its modification time and size match the
+    last compile. Otherwise only days whose events (or the content filter
+    keywords) changed are rewritten, in one transaction.
+
+    Args:
+        data_file: Fallback JSON ({"MM-DD": [event, ...]})
+        index_file: SQLite file to create or update
+        language: Language for language-specific scoring (optional)
+
+    Returns:
+        CompileResult
+
+    Raises:
+        OSError: If the JSON cannot be read
+        ValueError: If the JSON is invalid
+        sqlite3.Error: If the index cannot be written
+    """
+    data_file = Path(data_file)
+    index_file = Path(index_file)
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    rules = _rules_fingerprint(language)
+    stamp = source_stamp(data_file)
+
+    conn = sqlite3.connect(index_file, timeout=30)
+    try:
+        with conn:
+            conn.executescript(SCHEMA)
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+            if meta.get("source") == stamp and meta.get("rules") == rules:
+                return CompileResult(skipped=True)
+
+        with open(data_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        result = CompileResult()
+        with conn:
+            stored = dict(conn.execute("SELECT day, hash FROM days"))
+            for day, events in data.items():
+                day_hash = _day_hash(events, rules)
+                if stored.pop(day, None) == day_hash:
+                    result.days_unchanged += 1
+                    continue
+                conn.execute("DELETE FROM events WHERE day = ?", (day,))
+                conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                 _event_rows(day, events, language))
+                conn.execute("INSERT OR REPLACE INTO days VALUES (?, ?)", (day, day_hash))
+                result.days_written += 1
+
+            for day in stored:  # Days no longer in the JSON
+                conn.execute("DELETE FROM events WHERE day = ?", (day,))
+                conn.execute("DELETE FROM days WHERE day = ?", (day,))
+                result.days_removed += 1
+
+            conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                             [("source", stamp), ("rules", rules)])
+    finally:
+        conn.close()
+
+    logger.info(
+        f"Compiled fallback index {index_file.name}: {result.days_written} days written, "
+        f"{result.days_removed} removed, {result.days_unchanged} unchanged"
+    )
+    return result
+
+
+class FallbackIndex:
+    """Read side of a compiled index: one day's positive events per lookup.
+
+    Each thread keeps its own read-only connection with the file memory
+    mapped, so a lookup is a primary-key range read without parsing JSON.
+    """
+
+    def __init__(self, index_file: Path):
+        """Initialize reader.
+
+        Args:
+            index_file: Compiled index file
+        """
+        self.index_file = Path(index_file)
+        self._local = threading.local()
+
+    def events(self, target_date: date) -> List[Anniversary]:
+        """Positive events for a date, in file order.
+
+        Args:
+            target_date: The date to read
+
+        Returns:
+            List of Anniversary objects with interest_score set to the
+            precomputed content score
+
+        Raises:
+            sqlite3.Error: If the index cannot be read
+        """
+        rows = self._connection().execute(
+            "SELECT year, title, description, category, score FROM events "
+            "WHERE day = ? AND positive = 1 ORDER BY position",
+            (target_date.strftime("%m-%d"),)
+        ).fetchall()
+
+        return [
+            Anniversary(date=target_date, title=title, description=description, category=category,
+                        year=year, source="Fallback", interest_score=score)
+            for year, title, description, category, score in rows
+        ]
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's read-only connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"{self.index_file.resolve().as_uri()}?mode=ro", uri=True)
+            conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            self._local.conn = conn
+        return conn
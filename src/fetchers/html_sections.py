@@ -0,0 +1,298 @@
+"""Fast extraction of list sections from a Wikipedia page."""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import unquote
+
+from lxml import etree
+
+# Wikipedia always serves UTF-8; declaring it skips encoding detection
+_PARSER = etree.HTMLParser(encoding="utf-8", remove_comments=True, remove_pis=True)
+
+# A section to extract: heading id, and text to look for in <h2> headings
+# if no heading has the id (or None)
+Section = Tuple[str, Optional[str]]
+
+# Most linked page titles kept per list item
+MAX_LINKS_PER_ITEM = 8
+
+# Namespaces of links that are not articles (English and Japanese names)
+_NON_ARTICLE_NAMESPACES = {
+    "file", "image", "help", "wikipedia", "wp", "special", "template", "category",
+    "portal", "talk", "ファイル", "画像", "ヘルプ", "特別", "カテゴリ", "ノート",
+}
+
+# Titles of year and day pages, whose summaries say nothing about the event
+_DATE_TITLE = re.compile(r"^(AD )?-?\d+( BC| BCE|年)?$|^紀元前\d+年$|^\d+月\d+日$")
+
+
+class ItemText(str):
+    """Text of a list item, with the titles of the articles it links to.
+
+    A plain str everywhere else, so callers that only need the text are
+    unaffected; ``links`` lists the linked articles in item order.
+    """
+
+    links: Tuple[str, ...] = ()
+
+    def __new__(cls, text: str, links: Sequence[str] = ()):
+        item = super().__new__(cls, text)
+        item.links = tuple(links)
+        return item
+
+
+def article_title(target: str) -> Optional[str]:
+    """Title of a linked article, or None for links not worth following.
+
+    Args:
+        target: Link target: a "/wiki/..." href or a wikitext [[target]]
+
+    Returns:
+        Title with spaces (e.g. "Neil Armstrong"), or None for non-article
+        namespaces, section anchors, and year or day pages
+    """
+    if target.startswith("/wiki/"):
+        target = unquote(target[len("/wiki/"):])
+    elif target.startswith(("/", "#", ":", "http:", "https:")):
+        return None  # Other paths, anchors, interwiki and external links
+    title = target.split("#", 1)[0].replace("_", " ").strip()
+    if not title or _DATE_TITLE.match(title):
+        return None
+    namespace, colon, _ = title.partition(":")
+    if colon and namespace.strip().lower() in _NON_ARTICLE_NAMESPACES:
+        return None
+    return title[0].upper() + title[1:]
+
+
+def unique_titles(targets) -> List[str]:
+    """Article titles of link targets, first occurrence first, up to MAX_LINKS_PER_ITEM."""
+    titles: List[str] = []
+    for target in targets:
+        title = article_title(target)
+        if title and title not in titles:
+            titles.append(title)
+            if len(titles) == MAX_LINKS_PER_ITEM:
+                break
+    return titles
+
+
+def _ends_section(heading_tag: str, section_level: str) -> bool:
+    """Whether a heading ends a section headed by an <h2> or <h3> (section_level)."""
+    return heading_tag == "h2" or section_level == "h3"
+
+
+def _is_nested(list_element) -> bool:
+    """Whether a list sits inside another list (its items belong to the outer list's items)."""
+    return next(list_element.iterancestors("ul"), None) is not None
+
+
+def _list_items(list_element) -> List[str]:
+    """Text (with linked article titles) of each direct <li> child of a list element."""
+    return [ItemText(etree.tostring(li, method="text", encoding="unicode", with_tail=False),
+                     unique_titles(a.get("href", "") for a in li.iter("a")))
+            for li in list_element.iterchildren("li")]
+
+
+def extract_section_items(content: bytes, section_id: str,
+                          heading_text: Optional[str] = None) -> Optional[List[str]]:
+    """Text of each item in the lists of a section.
+
+    A section's lists are all those between its heading and the next
+    heading of the same or a higher level, so subsections (e.g. Pre-1600,
+    1601–1900 and 1901–present under Events) are included, as in the
+    wikitext of the page. Parses with lxml instead of building a
+    BeautifulSoup tree and reads only the section's lists. Only strings
+    leave this function, so the tree is freed as soon as it returns.
+
+    Args:
+        content: Raw HTML of the page
+        section_id: Heading id, e.g. "Events"
+        heading_text: Text to look for in <h2> headings if no heading has the id (optional)
+
+    Returns:
+        Item texts in page order ([] if the section has no list), or None
+        if the heading is not found
+    """
+    return extract_sections(content, [(section_id, heading_text)])[section_id]
+
+
+def _heading_ids(heading) -> List[str]:
+    """Ids on a heading itself (current markup) or on <span>s inside it (older markup)."""
+    ids = [span.get("id") for span in heading.iter("span") if span.get("id")]
+    if heading.get("id"):
+        ids.insert(0, heading.get("id"))
+    return ids
+
+
+def extract_sections(content: bytes, sections: Sequence[Section]) -> Dict[str, Optional[List[str]]]:
+    """extract_section_items for several sections from one parse.
+
+    The page is parsed once and its <h2>/<h3> headings are visited in a
+    single pass that matches every section at the same time; a second pass
+    over the headings and lists in page order collects each section's
+    lists, so each extra section costs only the reading of its own lists.
+
+    Args:
+        content: Raw HTML of the page
+        sections: (heading id, heading text or None) of each section
+
+    Returns:
+        Item texts per heading id ([] if the section has no list, None if
+        the heading is not found)
+    """
+    result: Dict[str, Optional[List[str]]] = {section_id: None for section_id, _ in sections}
+    root = etree.fromstring(content, _PARSER)
+    if root is None:
+        return result
+
+    by_id = {}
+    by_text = {}
+    for heading in root.iter("h2", "h3"):
+        for heading_id in _heading_ids(heading):
+            by_id.setdefault(heading_id, heading)
+        if heading.tag == "h2":
+            text = None
+            for section_id, heading_text in sections:
+                if heading_text and section_id not in by_text:
+                    if text is None:
+                        text = etree.tostring(heading, method="text", encoding="unicode",
+                                              with_tail=False)
+                    if heading_text in text:
+                        by_text[section_id] = heading
+
+    starts: Dict[object, List[str]] = {}  # Heading element -> sections it starts
+    for section_id, _ in sections:
+        heading = by_id.get(section_id, by_text.get(section_id))
+        if heading is not None:
+            starts.setdefault(heading, []).append(section_id)
+            result[section_id] = []
+
+    active: List[Tuple[str, str]] = []  # (section id, heading tag) of the open sections
+    unopened = len(starts)
+    for element in root.iter("h2", "h3", "ul"):
+        if element.tag == "ul":
+            if active and not _is_nested(element):
+                items = _list_items(element)
+                for section_id, _ in active:
+                    result[section_id].extend(items)
+            continue
+        active = [(section_id, level) for section_id, level in active
+                  if not _ends_section(element.tag, level)]
+        if element in starts:
+            active += [(section_id, element.tag) for section_id in starts[element]]
+            unopened -= 1
+        elif not active and not unopened:
+            break  # Every section has ended
+    return result
+
+
+class SectionStreamParser:
+    """Incremental extract_sections for a page that arrives in chunks.
+
+    Feed chunks as they are downloaded; ``feed`` returns True once every
+    section has ended (at the next heading of the same or a higher level),
+    and the rest of the page need not be downloaded. The first heading
+    matching each id (or heading text) wins.
+    """
+
+    def __init__(self, sections: Sequence[Section]):
+        """Initialize stream parser.
+
+        Args:
+            sections: (heading id, heading text or None) of each section
+        """
+        self.sections = list(sections)
+        self.bytes_read = 0
+        self.done = False
+
+        self._parser = etree.HTMLPullParser(events=("start", "end"), encoding="utf-8",
+                                            remove_comments=True, remove_pis=True)
+        self._active: List[Tuple[str, object]] = []  # (section id, heading element) of the open sections
+        self._list = None  # Open top-level list of the open sections
+        self._items: Dict[str, Optional[List[str]]] = {section_id: None for section_id, _ in sections}
+        self._found = set()
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse the next chunk of the page.
+
+        Args:
+            chunk: Raw bytes
+
+        Returns:
+            True once every section is complete
+        """
+        if not self.done:
+            self.bytes_read += len(chunk)
+            self._parser.feed(chunk)
+            self._handle_events()
+        return self.done
+
+    def close(self) -> Dict[str, Optional[List[str]]]:
+        """Finish parsing and return the section items.
+
+        Returns:
+            Item texts per heading id ([] if the section has no list, None if
+            the heading is not found)
+        """
+        if not self.done:
+            try:
+                self._parser.close()
+            except etree.XMLSyntaxError:
+                pass  # Empty or truncated page
+            self._handle_events()
+            if self._list is not None:
+                self._add_list(self._list)  # Page ended inside a list
+            self.done = True
+
+        self._parser = None  # Release the tree
+        self._active = []
+        self._list = None
+        return self._items
+
+    def _handle_events(self) -> None:
+        """Advance through parser events: section headings, and the lists of open sections."""
+        for event, element in self._parser.read_events():
+            if element.tag == "ul":
+                if event == "start" and self._active and self._list is None:
+                    self._list = element  # Lists inside it are read with it
+                elif event == "end" and element is self._list:
+                    self._add_list(element)
+                    self._list = None
+            elif event == "end" and element.tag in ("h2", "h3", "span"):
+                if element.tag != "span":
+                    self._active = [(section_id, heading) for section_id, heading in self._active
+                                    if heading is element or not _ends_section(element.tag, heading.tag)]
+                for section_id in self._matching_sections(element):
+                    self._found.add(section_id)
+                    self._items[section_id] = []
+                    heading = element if element.tag != "span" else next(element.iterancestors("h2", "h3"))
+                    self._active.append((section_id, heading))
+                if len(self._found) == len(self.sections) and not self._active:
+                    self.done = True
+                    return
+
+    def _add_list(self, list_element) -> None:
+        """Add a list's items to every open section."""
+        items = _list_items(list_element)
+        for section_id, _ in self._active:
+            self._items[section_id].extend(items)
+
+    def _matching_sections(self, element) -> List[str]:
+        """Sections not yet found whose heading is the just-closed element."""
+        matches = []
+        for section_id, heading_text in self.sections:
+            if section_id not in self._found and self._is_heading(element, section_id, heading_text):
+                matches.append(section_id)
+        return matches
+
+    @staticmethod
+    def _is_heading(element, section_id: str, heading_text: Optional[str]) -> bool:
+        """Whether a just-closed element is a section's heading."""
+        if element.tag in ("h2", "h3") and element.get("id") == section_id:
+            return True
+        if element.tag == "span" and element.get("id") == section_id:
+            return any(True for _ in element.iterancestors("h2", "h3"))
+        if heading_text and element.tag == "h2":
+            return heading_text in etree.tostring(element, method="text", encoding="unicode",
+                                                  with_tail=False)
+        return False
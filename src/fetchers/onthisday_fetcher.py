@@ -0,0 +1,248 @@
+"""Wikimedia REST "on this day" anniversary fetcher."""
+
+import json
+import logging
+from datetime import date
+from typing import List, Optional
+
+import httpx
+import requests
+
+from config import Language
+from fetchers.base_fetcher import BaseFetcher, Anniversary
+from fetchers.html_sections import unique_titles
+from fetchers.wikipedia_fetcher import WikipediaFetcher
+from fetchers.wikipedia_ja_fetcher import WikipediaJaFetcher
+from utils.retry import retry
+from utils.deadline import Deadline
+from utils.http_cache import HttpCache
+from utils.http_transport import HttpTransport
+from utils.rate_limit import RateLimiter, WIKIPEDIA_BUCKET
+
+logger = logging.getLogger("AADD")
+
+
+class OnThisDayFetcher(BaseFetcher):
+    """Fetches anniversaries from the Wikimedia REST "onthisday/events" feed.
+
+    The feed is structured JSON (year, text and the linked pages with their
+    extracts), so no HTML is parsed and markup changes cannot break it.
+    Titles and categories match the HTML fetchers for the same language.
+    """
+
+    BASE_URL = "https://{lang}.wikipedia.org/api/rest_v1/feed/onthisday/events"
+    TIMEOUT = 10  # seconds
+    HEADERS = {"Accept": "application/json"}
+    MAX_EXTRACT_CHARS = 400
+
+    def __init__(self, language: Language, base_url: Optional[str] = None,
+                 http_cache: Optional[HttpCache] = None,
+                 transport: Optional[HttpTransport] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        """Initialize on-this-day fetcher.
+
+        Args:
+            language: Wikipedia edition to read
+            base_url: Feed URL without the /MM/DD suffix (defaults to
+                BASE_URL for the language; point it at a local stand-in for tests)
+            http_cache: Conditional-request cache for feed responses (optional)
+            transport: Shared connection pools (optional; defaults to a private one)
+            rate_limiter: Limits applied to the wikipedia.<lang> bucket (optional)
+        """
+        self.language = language
+        self.base_url = (base_url or self.BASE_URL.format(lang=language.value)).rstrip("/")
+        self.transport = transport or HttpTransport(timeout=self.TIMEOUT)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.rate_bucket = WIKIPEDIA_BUCKET.format(lang=language.value)
+        self.http_cache = http_cache
+
+        if language == Language.JAPANESE:
+            self.source = "Wikipedia (ja)"
+            self.title_length = 50
+            self.category_keywords = WikipediaJaFetcher.CATEGORY_KEYWORDS
+        else:
+            self.source = "Wikipedia"
+            self.title_length = 100
+            self.category_keywords = WikipediaFetcher.CATEGORY_KEYWORDS
+
+    @property
+    def name(self) -> str:
+        """Name including the language, so each feed has its own circuit breaker."""
+        return f"{self.__class__.__name__}[{self.language.value}]"
+
+    @retry(max_attempts=3, delay=2, backoff=2, exceptions=(requests.RequestException,))
+    def fetch(self, target_date: date, deadline: Optional[Deadline] = None) -> List[Anniversary]:
+        """Fetch anniversaries from the feed.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget capping the request timeout (optional)
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            requests.RequestException: If request fails
+            ValueError: If the response is not valid JSON
+            DeadlineExceeded: If the run budget is spent
+        """
+        url = self._build_url(target_date)
+        logger.debug(f"Fetching from: {url}")
+        self.rate_limiter.acquire(self.rate_bucket, deadline=deadline)
+
+        if self.http_cache:
+            content = self.http_cache.get(self.transport.session, url, timeout=self._timeout(deadline),
+                                          headers=self.HEADERS)
+        else:
+            response = self.transport.session.get(url, timeout=self._timeout(deadline),
+                                                  headers=self.HEADERS)
+            response.raise_for_status()
+            content = response.content
+
+        return self._parse_feed(content, target_date)
+
+    @retry(max_attempts=3, delay=2, backoff=2, exceptions=(httpx.HTTPError,))
+    async def fetch_async(self, target_date: date,
+                          deadline: Optional[Deadline] = None) -> List[Anniversary]:
+        """Fetch anniversaries from the feed over an async HTTP client.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget capping the request timeout (optional)
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            httpx.HTTPError: If request fails
+            ValueError: If the response is not valid JSON
+            DeadlineExceeded: If the run budget is spent
+        """
+        url = self._build_url(target_date)
+        logger.debug(f"Fetching (async) from: {url}")
+        await self.rate_limiter.acquire_async(self.rate_bucket, deadline=deadline)
+
+        client = self.transport.async_client()
+        timeout = self._timeout(deadline)
+        if self.http_cache:
+            content = await self.http_cache.get_async(client, url, timeout=timeout, headers=self.HEADERS)
+        else:
+            response = await client.get(url, timeout=timeout, headers=self.HEADERS)
+            response.raise_for_status()
+            content = response.content
+
+        return self._parse_feed(content, target_date)
+
+    def _timeout(self, deadline: Optional[Deadline]) -> float:
+        """Request timeout, capped by the remaining run budget."""
+        return deadline.timeout(self.TIMEOUT) if deadline else self.TIMEOUT
+
+    def _build_url(self, target_date: date) -> str:
+        """Build the feed URL.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+
+        Returns:
+            Feed URL
+        """
+        # Format URL: https://en.wikipedia.org/api/rest_v1/feed/onthisday/events/01/01
+        return f"{self.base_url}/{target_date.month:02d}/{target_date.day:02d}"
+
+    def _parse_feed(self, content: bytes, target_date: date) -> List[Anniversary]:
+        """Map feed events into anniversaries, oldest first.
+
+        The linked page extract is appended to each description after a
+        blank line; the candidate pipeline judges the event text only (see
+        Anniversary.event_text).
+
+        Args:
+            content: Raw JSON of the feed response
+            target_date: The date this feed is for
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            ValueError: If the content is not valid JSON
+        """
+        data = json.loads(content)
+
+        anniversaries = []
+        for event in data.get("events", []):
+            try:
+                anniversary = self._parse_event(event, target_date)
+                if anniversary:
+                    extract = self._page_extract(event)
+                    if extract:
+                        anniversary.description = f"{anniversary.description}\n\n{extract}"
+                    anniversaries.append(anniversary)
+            except Exception as e:
+                logger.debug(f"Failed to parse event: {e}")
+                continue
+
+        # The feed lists newest first; the day pages (and the prompts) go oldest first
+        anniversaries.sort(key=lambda ann: ann.year)
+        logger.info(f"Parsed {len(anniversaries)} events from the {self.language.value} on-this-day feed")
+        return anniversaries
+
+    def _parse_event(self, event: dict, target_date: date) -> Anniversary | None:
+        """Map one feed event.
+
+        Args:
+            event: Feed event with "year", "text" and "pages"
+            target_date: The date this event is for
+
+        Returns:
+            Anniversary object or None if the event has no text or year
+        """
+        text = (event.get("text") or "").strip()
+        year = event.get("year")
+        if not text or not isinstance(year, int):
+            return None
+
+        title = text[:self.title_length]
+        if len(text) > self.title_length:
+            title += "..."
+
+        return Anniversary(
+            date=target_date,
+            title=title,
+            description=text,
+            category=self._categorize_event(text),
+            year=year,
+            source=self.source,
+            links=unique_titles(page.get("title", "") for page in event.get("pages", []))
+        )
+
+    def _page_extract(self, event: dict) -> str:
+        """Extract of the first linked page that is not just the year's page.
+
+        Args:
+            event: Feed event
+
+        Returns:
+            Extract (truncated to MAX_EXTRACT_CHARS), or "" if there is none
+        """
+        for page in event.get("pages", []):
+            title = page.get("normalizedtitle") or page.get("title", "")
+            extract = (page.get("extract") or "").strip()
+            if extract and not title.rstrip("年").lstrip("-").isdigit():
+                return extract[:self.MAX_EXTRACT_CHARS]
+        return ""
+
+    def _categorize_event(self, text: str) -> str:
+        """Categorize an event with the HTML fetcher's keywords for the language.
+
+        Args:
+            text: Event text
+
+        Returns:
+            Category string
+        """
+        text_lower = text.lower()
+        for category, keywords in self.category_keywords.items():
+            if any(keyword in text_lower for keyword in keywords):
+                return category
+
+        return "historical"  # Default category
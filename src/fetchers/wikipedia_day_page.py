@@ -0,0 +1,349 @@
+"""Shared base for the Wikipedia day page fetchers."""
+
+import logging
+from abc import abstractmethod
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+import requests
+
+from fetchers.base_fetcher import BaseFetcher, Anniversary
+from fetchers.html_sections import extract_sections, SectionStreamParser
+from utils.retry import retry
+from utils.deadline import Deadline
+from utils.http_cache import HttpCache
+from utils.http_transport import HttpTransport
+from utils.rate_limit import RateLimiter, WIKIPEDIA_BUCKET
+
+logger = logging.getLogger("AADD")
+
+
+class WikipediaDayPageFetcher(BaseFetcher):
+    """Fetches anniversaries from the day pages of one Wikipedia edition.
+
+    Downloads (or streams) a page, extracts the lists of its SECTIONS and
+    turns their items into anniversaries. Subclasses set the edition's
+    constants and provide the page URL and the event item parsing.
+    """
+
+    BASE_URL = ""  # e.g. "https://en.wikipedia.org/wiki"
+    LANGUAGE = ""  # Language code of the edition (for the rate limit bucket)
+    SOURCE = "Wikipedia"  # Source name on the anniversaries
+    DISPLAY_NAME = "Wikipedia"  # Edition name used in logs
+    TITLE_LENGTH = 100  # characters
+    TIMEOUT = 10  # seconds
+    STREAM_CHUNK_SIZE = 16 * 1024  # bytes
+
+    # Sections read from each day page: name -> (heading id, heading text)
+    SECTIONS: Dict[str, tuple] = {}
+
+    # Category keywords, checked in order
+    CATEGORY_KEYWORDS: Dict[str, List[str]] = {}
+
+    def __init__(self, http_cache: Optional[HttpCache] = None, streaming: bool = False,
+                 sections: Sequence[str] = ("events", "births", "observances"),
+                 transport: Optional[HttpTransport] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        """Initialize day page fetcher.
+
+        Args:
+            http_cache: Conditional-request cache for day pages (optional)
+            streaming: Download each page only until its section lists are
+                complete; bypasses the HTTP cache, which stores whole pages
+            sections: Names of the SECTIONS to read (Events always first)
+            transport: Shared connection pools (optional; defaults to a private one)
+            rate_limiter: Limits applied to the wikipedia.<lang> bucket (optional)
+
+        Raises:
+            ValueError: If a section name is unknown
+        """
+        unknown = [name for name in sections if name not in self.SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown Wikipedia sections: {unknown}")
+
+        self.transport = transport or HttpTransport(timeout=self.TIMEOUT)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.rate_bucket = WIKIPEDIA_BUCKET.format(lang=self.LANGUAGE)
+        self.http_cache = http_cache
+        self.streaming = streaming
+        self.sections = ["events"] + [name for name in sections if name != "events"]
+
+    @retry(max_attempts=3, delay=2, backoff=2, exceptions=(requests.RequestException,))
+    def fetch(self, target_date: date, deadline: Optional[Deadline] = None) -> List[Anniversary]:
+        """Fetch anniversaries from the day page.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget capping the request timeout (optional)
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            requests.RequestException: If request fails
+            DeadlineExceeded: If the run budget is spent
+        """
+        url = self._build_url(target_date)
+        logger.debug(f"Fetching from: {url}")
+        self.rate_limiter.acquire(self.rate_bucket, deadline=deadline)
+
+        # Fetch page
+        if self.streaming:
+            return self.parse_sections(self._stream_sections(url, deadline), target_date)
+        if self.http_cache:
+            content = self.http_cache.get(self.transport.session, url, timeout=self._timeout(deadline))
+        else:
+            response = self.transport.session.get(url, timeout=self._timeout(deadline))
+            response.raise_for_status()
+            content = response.content
+
+        return self._parse_page(content, target_date)
+
+    @retry(max_attempts=3, delay=2, backoff=2, exceptions=(httpx.HTTPError,))
+    async def fetch_async(self, target_date: date,
+                          deadline: Optional[Deadline] = None) -> List[Anniversary]:
+        """Fetch anniversaries from the day page over an async HTTP client.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+            deadline: Run budget capping the request timeout (optional)
+
+        Returns:
+            List of Anniversary objects
+
+        Raises:
+            httpx.HTTPError: If request fails
+            DeadlineExceeded: If the run budget is spent
+        """
+        url = self._build_url(target_date)
+        logger.debug(f"Fetching (async) from: {url}")
+        await self.rate_limiter.acquire_async(self.rate_bucket, deadline=deadline)
+
+        client = self.transport.async_client()
+        timeout = self._timeout(deadline)
+        if self.streaming:
+            section_items = await self._stream_sections_async(client, url, timeout)
+            return self.parse_sections(section_items, target_date)
+        if self.http_cache:
+            content = await self.http_cache.get_async(client, url, timeout=timeout)
+        else:
+            response = await client.get(url, timeout=timeout)
+            response.raise_for_status()
+            content = response.content
+
+        return self._parse_page(content, target_date)
+
+    def _stream_sections(self, url: str,
+                         deadline: Optional[Deadline]) -> Dict[str, Optional[List[str]]]:
+        """Download a page until its section lists are complete, then close the connection.
+
+        Args:
+            url: Page URL
+            deadline: Run budget capping the request timeout (optional)
+
+        Returns:
+            Item texts per section name (None if the page lacks the section)
+
+        Raises:
+            requests.RequestException: If request fails
+        """
+        parser = SectionStreamParser(self._section_headings())
+        session = self.transport.session
+        with session.get(url, timeout=self._timeout(deadline), stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                if parser.feed(chunk):
+                    break
+        logger.debug(f"Read {parser.bytes_read // 1024} KB of {url}")
+        return self._by_name(parser.close())
+
+    async def _stream_sections_async(self, client: httpx.AsyncClient, url: str,
+                                     timeout: float) -> Dict[str, Optional[List[str]]]:
+        """Async variant of _stream_sections over an httpx client.
+
+        Args:
+            client: Client to send the request with
+            url: Page URL
+            timeout: Request timeout in seconds
+
+        Returns:
+            Item texts per section name (None if the page lacks the section)
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        parser = SectionStreamParser(self._section_headings())
+        async with client.stream("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                if parser.feed(chunk):
+                    break
+        logger.debug(f"Read {parser.bytes_read // 1024} KB of {url}")
+        return self._by_name(parser.close())
+
+    def _section_headings(self) -> list:
+        """(heading id, heading text) of each section to read."""
+        return [self.SECTIONS[name] for name in self.sections]
+
+    def _by_name(self, items_by_id: Dict[str, Optional[List[str]]]) -> Dict[str, Optional[List[str]]]:
+        """Re-key extracted items from heading id to section name."""
+        return {name: items_by_id[self.SECTIONS[name][0]] for name in self.sections}
+
+    def _timeout(self, deadline: Optional[Deadline]) -> float:
+        """Request timeout, capped by the remaining run budget."""
+        return deadline.timeout(self.TIMEOUT) if deadline else self.TIMEOUT
+
+    @abstractmethod
+    def _build_url(self, target_date: date) -> str:
+        """Build the day page URL.
+
+        Args:
+            target_date: The date to fetch anniversaries for
+
+        Returns:
+            Page URL
+        """
+        pass
+
+    def _parse_page(self, content: bytes, target_date: date) -> List[Anniversary]:
+        """Parse a day page into anniversaries.
+
+        Args:
+            content: Raw HTML of the day page
+            target_date: The date this page is for
+
+        Returns:
+            List of Anniversary objects
+        """
+        # Extract every section list in one parse, by heading id (old markup:
+        # <h2><span id="Events">, new: <h2 id="Events">) or, failing that,
+        # heading text
+        section_items = self._by_name(extract_sections(content, self._section_headings()))
+        return self.parse_sections(section_items, target_date)
+
+    def parse_sections(self, section_items: Dict[str, Optional[List[str]]],
+                       target_date: date) -> List[Anniversary]:
+        """Turn the section list items into anniversaries, in page order.
+
+        Also used for day pages read from a dump (see WikipediaDumpFetcher).
+        Filtering and cuts are left to the candidate pipeline (see
+        fetchers.candidates).
+
+        Args:
+            section_items: Item texts per section name (None if the page lacks the section);
+                the links of ItemText items are kept on their anniversaries
+            target_date: The date this page is for
+
+        Returns:
+            List of Anniversary objects, section by section
+        """
+        if section_items["events"] is None:
+            logger.warning(f"No '{self.SECTIONS['events'][0]}' section found on {self.DISPLAY_NAME} page")
+        elif not section_items["events"]:
+            logger.warning("No events list found")
+
+        # Parse events
+        anniversaries = []
+        for section, items in section_items.items():
+            for text in items or []:
+                try:
+                    anniversary = self._parse_section_item(section, text, target_date)
+                    if anniversary:
+                        anniversary.links = list(getattr(text, "links", ()))
+                        anniversaries.append(anniversary)
+                except Exception as e:
+                    logger.debug(f"Failed to parse {section} item: {e}")
+                    continue
+
+        counts = ", ".join(f"{sum(ann.section == name for ann in anniversaries)} {name}"
+                           for name in section_items)
+        logger.info(f"Parsed {counts} from {self.DISPLAY_NAME}")
+        return anniversaries
+
+    def _parse_section_item(self, section: str, text: str, target_date: date) -> Anniversary | None:
+        """Parse a list item of any section.
+
+        Args:
+            section: Section name
+            text: Text content of the list item
+            target_date: The date this item is for
+
+        Returns:
+            Anniversary object or None if parsing fails
+        """
+        if section == "observances":
+            return self._parse_observance_item(text, target_date)
+        return self._parse_event_item(text, target_date, section=section)
+
+    def _parse_observance_item(self, text: str, target_date: date) -> Anniversary | None:
+        """Parse a holiday or observance list item.
+
+        Observances have no year (year is None). The first line is the
+        title; items that only introduce a nested list (e.g. "Christian
+        feast day:") are skipped.
+
+        Args:
+            text: Text content of the list item
+            target_date: The date this observance is on
+
+        Returns:
+            Anniversary object or None if the item has no name of its own
+        """
+        title = text.strip().split("\n", 1)[0].strip()
+        if not title or title.endswith(":"):
+            return None
+
+        description = " ".join(text.split())
+        if len(title) > self.TITLE_LENGTH:
+            title = title[:self.TITLE_LENGTH] + "..."
+
+        return Anniversary(
+            date=target_date,
+            title=title,
+            description=description,
+            category="commemorative",
+            year=None,
+            source=self.SOURCE,
+            section="observances"
+        )
+
+    @abstractmethod
+    def _parse_event_item(self, text: str, target_date: date,
+                          section: str = "events") -> Anniversary | None:
+        """Parse a single event (or birth) list item.
+
+        Args:
+            text: Text content of the list item
+            target_date: The date this event is for
+            section: Section the item is from
+
+        Returns:
+            Anniversary object or None if parsing fails
+        """
+        pass
+
+    def _make_title(self, description: str) -> str:
+        """Title for an event: the first TITLE_LENGTH characters of its description."""
+        title = description[:self.TITLE_LENGTH]
+        if len(description) > self.TITLE_LENGTH:
+            title += "..."
+        return title
+
+    def _categorize_event(self, description: str) -> str:
+        """Categorize an event based on description keywords.
+
+        Args:
+            description: Event description
+
+        Returns:
+            Category string
+        """
+        desc_lower = description.lower()
+
+        # Check for category keywords
+        for category, keywords in self.CATEGORY_KEYWORDS.items():
+            if any(keyword in desc_lower for keyword in keywords):
+                return category
+
+        return "historical"  # Default category
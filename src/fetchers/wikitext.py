@@ -0,0 +1,104 @@
+"""Minimal wikitext reading: list sections of a day page as plain text."""
+
+import re
+import html
+from typing import Dict, List, Optional, Sequence
+
+from fetchers.html_sections import ItemText, unique_titles
+
+_HEADING = re.compile(r"^(={2,6})\s*(.*?)\s*\1\s*$")
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_REF = re.compile(r"<ref[^>/]*/>|<ref[^>]*>.*?</ref>", re.DOTALL | re.IGNORECASE)
+_TEMPLATE = re.compile(r"\{\{([^{}]*)\}\}")
+_LINK = re.compile(r"\[\[(?:[^|\[\]]*\|)?([^\[\]]*)\]\]")
+_LINK_TARGET = re.compile(r"\[\[([^|\[\]]*)")
+_EXTERNAL_LINK = re.compile(r"\[(?:https?:)?//[^\s\]]+\s*([^\]]*)\]")
+_QUOTES = re.compile(r"'{2,}")
+_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+
+# Templates whose text is kept: name -> index of the parameter holding the text
+_TEXT_TEMPLATES = {
+    "仮リンク": 1,
+    "ill": 1,
+    "interlanguage link": 1,
+    "nowrap": 1,
+    "lang": 2,
+    "transl": 2,
+}
+
+
+def _expand_template(match: re.Match) -> str:
+    """Text of a template that carries visible text, or "" for any other template."""
+    parts = match.group(1).split("|")
+    index = _TEXT_TEMPLATES.get(parts[0].strip().lower())
+    if index is not None and len(parts) > index:
+        return parts[index]
+    return ""
+
+
+def strip_markup(text: str) -> str:
+    """Plain text of a wikitext fragment, close to what the rendered page shows.
+
+    Args:
+        text: Wikitext (one list item)
+
+    Returns:
+        Text without links, templates, references, emphasis and tags
+    """
+    text = _REF.sub("", _COMMENT.sub("", text))
+    previous = None
+    while previous != text:  # Innermost templates first
+        previous = text
+        text = _TEMPLATE.sub(_expand_template, text)
+    text = _LINK.sub(r"\1", text)
+    text = _EXTERNAL_LINK.sub(r"\1", text)
+    text = _TAG.sub("", _QUOTES.sub("", text))
+    return html.unescape(text).strip()
+
+
+def link_targets(text: str) -> List[str]:
+    """Targets of the internal links of a wikitext fragment, outside references."""
+    return _LINK_TARGET.findall(_REF.sub("", _COMMENT.sub("", text)))
+
+
+def extract_wikitext_sections(wikitext: str, headings: Sequence[str]) -> Dict[str, Optional[List[str]]]:
+    """Text of each list item in level-2 sections of a page.
+
+    Items of a section's sub-sections are included; nested items are
+    appended to their parent item on new lines, like the text of a
+    rendered <li>.
+
+    Args:
+        wikitext: Page source
+        headings: Level-2 heading titles, e.g. "Events" or "できごと"
+
+    Returns:
+        Item texts, with their linked article titles (see ItemText), per
+        heading ([] if the section has no list, None if the heading is not
+        found)
+    """
+    result: Dict[str, Optional[List[str]]] = {heading: None for heading in headings}
+    current = None
+    for line in _COMMENT.sub("", wikitext).splitlines():
+        heading = _HEADING.match(line)
+        if heading:
+            if len(heading.group(1)) == 2:
+                title = strip_markup(heading.group(2))
+                current = title if title in result and result[title] is None else None
+                if current is not None:
+                    result[current] = []
+            continue
+
+        if current is None or not line.startswith("*"):
+            continue
+        depth = len(line) - len(line.lstrip("*"))
+        nested = depth > 1 or line[depth:].startswith((":", "#"))  # "*:" continues an item
+        source = line[depth:].lstrip(":#")
+        text = strip_markup(source)
+        if nested and result[current]:
+            parent = result[current][-1]
+            result[current][-1] = ItemText(parent + "\n" + text,
+                                           unique_titles([*parent.links, *link_targets(source)]))
+        elif text:
+            result[current].append(ItemText(text, unique_titles(link_targets(source))))
+    return result
@@ -2,11 +2,17 @@
 
 import json
 import logging
-from typing import List
+from typing import List, Optional
+import anthropic
 from anthropic import Anthropic
 
-from fetchers.base_fetcher import Anniversary
+from fetchers.base_fetcher import Anniversary, select_best_anniversary as select_by_score
 from config import Config, Language
+from generators.async_clients import AsyncAnthropicClients
+from generators.prompt_templates import format_candidate_year
+from utils.deadline import Deadline
+from utils.rate_limit import RateLimiter
+from utils.retry import retry
 
 logger = logging.getLogger("AADD")
 
@@ -14,25 +20,78 @@ logger = logging.getLogger("AADD")
 class AnniversarySelector:
     """Uses AI to intelligently select the best anniversary."""
 
-    def __init__(self, config: Config):
+    REQUEST_TIMEOUT = 60  # seconds per selection request
+    MAX_ATTEMPTS = 3
+    RETRY_EXCEPTIONS = (anthropic.APIConnectionError, anthropic.APIStatusError)
+    # Below this much run budget, selection uses the local scoring heuristic
+    # so the remaining time goes to generation
+    AI_MIN_SECONDS = 240
+
+    def __init__(self, config: Config, client: Anthropic = None,
+                 async_clients: AsyncAnthropicClients = None, rate_limiter: RateLimiter = None):
         """Initialize selector with Claude API.
 
         Args:
             config: Application configuration
+            client: Anthropic client to share (created if not given)
+            async_clients: Per-loop AsyncAnthropic clients to share (created if not given)
+            rate_limiter: Process-wide limits for Anthropic calls (optional)
         """
-        self.client = Anthropic(api_key=config.CLAUDE_API_KEY)
+        self.client = client or Anthropic(api_key=config.CLAUDE_API_KEY)
+        self.async_clients = async_clients or AsyncAnthropicClients(config.CLAUDE_API_KEY)
+        self.rate_limiter = rate_limiter or RateLimiter()
         self.model = "claude-3-7-sonnet-20250219"
 
     def select_best_anniversary(
         self,
         anniversaries: List[Anniversary],
-        language: Language
+        language: Language,
+        deadline: Optional[Deadline] = None
     ) -> Anniversary:
         """Use AI to select the most interesting anniversary.
 
         Args:
             anniversaries: List of candidate anniversaries
             language: Target language for selection criteria
+            deadline: Run budget; when low, the scoring heuristic is used (optional)
+
+        Returns:
+            Selected anniversary
+        """
+        if not anniversaries:
+            raise ValueError("Cannot select from empty list")
+
+        if len(anniversaries) == 1:
+            return anniversaries[0]
+
+        if deadline and deadline.is_low(self.AI_MIN_SECONDS):
+            logger.warning(f"Run budget low ({deadline}), using heuristic selection")
+            return select_by_score(anniversaries, language)
+
+        logger.info(f"Using AI to select from {len(anniversaries)} anniversaries for {language.value}")
+
+        # Call Claude API
+        try:
+            params = self._build_request_params(anniversaries, language)
+            response = self._create_message(params, deadline=deadline)
+            return self._select_from_response(response, anniversaries)
+
+        except Exception as e:
+            logger.error(f"AI selection failed: {e}, falling back to first anniversary")
+            return anniversaries[0]
+
+    async def select_best_anniversary_async(
+        self,
+        anniversaries: List[Anniversary],
+        language: Language,
+        deadline: Optional[Deadline] = None
+    ) -> Anniversary:
+        """Async variant of select_best_anniversary using AsyncAnthropic.
+
+        Args:
+            anniversaries: List of candidate anniversaries
+            language: Target language for selection criteria
+            deadline: Run budget; when low, the scoring heuristic is used (optional)
 
         Returns:
             Selected anniversary
@@ -43,38 +102,122 @@ class AnniversarySelector:
         if len(anniversaries) == 1:
             return anniversaries[0]
 
+        if deadline and deadline.is_low(self.AI_MIN_SECONDS):
+            logger.warning(f"Run budget low ({deadline}), using heuristic selection")
+            return select_by_score(anniversaries, language)
+
         logger.info(f"Using AI to select from {len(anniversaries)} anniversaries for {language.value}")
 
+        # Call Claude API
+        try:
+            params = self._build_request_params(anniversaries, language)
+            response = await self._create_message_async(params, deadline=deadline)
+            return self._select_from_response(response, anniversaries)
+
+        except Exception as e:
+            logger.error(f"AI selection failed: {e}, falling back to first anniversary")
+            return anniversaries[0]
+
+    @retry(max_attempts=MAX_ATTEMPTS, delay=2, max_delay=30, exceptions=RETRY_EXCEPTIONS,
+           attempt_seconds=REQUEST_TIMEOUT)
+    def _create_message(self, params: dict, deadline: Optional[Deadline] = None):
+        """Send a selection request within the Anthropic rate limits.
+
+        Args:
+            params: messages.create parameters
+            deadline: Run budget sizing the timeout and retries (optional)
+
+        Returns:
+            API response object
+        """
+        self.rate_limiter.acquire_message(params["max_tokens"], deadline)
+        response = None
+        try:
+            client = self.client.with_options(**self._request_options(deadline))
+            response = client.messages.create(**params)
+        finally:
+            self.rate_limiter.settle_message(params["max_tokens"], response)
+        return response
+
+    @retry(max_attempts=MAX_ATTEMPTS, delay=2, max_delay=30, exceptions=RETRY_EXCEPTIONS,
+           attempt_seconds=REQUEST_TIMEOUT)
+    async def _create_message_async(self, params: dict, deadline: Optional[Deadline] = None):
+        """Async variant of _create_message.
+
+        Args:
+            params: messages.create parameters
+            deadline: Run budget sizing the timeout and retries (optional)
+
+        Returns:
+            API response object
+        """
+        await self.rate_limiter.acquire_message_async(params["max_tokens"], deadline)
+        response = None
+        try:
+            client = self.async_clients.client().with_options(**self._request_options(deadline))
+            response = await client.messages.create(**params)
+        finally:
+            self.rate_limiter.settle_message(params["max_tokens"], response)
+        return response
+
+    def _build_request_params(self, anniversaries: List[Anniversary], language: Language) -> dict:
+        """Build messages.create parameters for a selection request.
+
+        Args:
+            anniversaries: List of candidate anniversaries
+            language: Target language for selection criteria
+
+        Returns:
+            Request parameters
+        """
         # Build prompt based on language
         if language == Language.JAPANESE:
             prompt = self._build_japanese_selection_prompt(anniversaries)
         else:
             prompt = self._build_english_selection_prompt(anniversaries)
 
-        # Call Claude API
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+        return {
+            "model": self.model,
+            "max_tokens": 1000,
+            "messages": [{
+                "role": "user",
+                "content": prompt
+            }]
+        }
 
-            result_text = response.content[0].text
-            logger.debug(f"AI selection response: {result_text}")
+    def _request_options(self, deadline: Optional[Deadline]) -> dict:
+        """Size the request timeout from the run budget; retries are left to @retry.
 
-            # Parse the response
-            selected_index = self._parse_selection_response(result_text, len(anniversaries))
-            selected = anniversaries[selected_index]
+        Args:
+            deadline: Run budget (optional)
 
-            logger.info(f"AI selected: {selected.title} (index: {selected_index})")
-            return selected
+        Returns:
+            Client options for with_options()
+        """
+        options = {"max_retries": 0}
+        if deadline:
+            options["timeout"] = deadline.timeout(self.REQUEST_TIMEOUT)
+        return options
 
-        except Exception as e:
-            logger.error(f"AI selection failed: {e}, falling back to first anniversary")
-            return anniversaries[0]
+    def _select_from_response(self, response, anniversaries: List[Anniversary]) -> Anniversary:
+        """Pick the anniversary chosen in a selection response.
+
+        Args:
+            response: Claude API response
+            anniversaries: List of candidate anniversaries
+
+        Returns:
+            Selected anniversary
+        """
+        result_text = response.content[0].text
+        logger.debug(f"AI selection response: {result_text}")
+
+        # Parse the response
+        selected_index = self._parse_selection_response(result_text, len(anniversaries))
+        selected = anniversaries[selected_index]
+
+        logger.info(f"AI selected: {selected.title} (index: {selected_index})")
+        return selected
 
     def _build_japanese_selection_prompt(self, anniversaries: List[Anniversary]) -> str:
         """Build selection prompt for Japanese version (Japan-focused).
@@ -88,7 +231,7 @@ class AnniversarySelector:
         candidates = []
         for i, ann in enumerate(anniversaries):
             candidates.append(
-                f"{i}. {ann.title} ({ann.year})\n"
+                f"{i}. {ann.title}{format_candidate_year(ann, Language.JAPANESE)}\n"
                 f"   説明: {ann.description[:200]}..."
             )
 
@@ -131,7 +274,7 @@ REASON: この出来事は日本の近代化に直接影響を与え、現代の
         candidates = []
         for i, ann in enumerate(anniversaries):
             candidates.append(
-                f"{i}. {ann.title} ({ann.year})\n"
+                f"{i}. {ann.title}{format_candidate_year(ann, Language.ENGLISH)}\n"
                 f"   Description: {ann.description[:200]}..."
             )
 
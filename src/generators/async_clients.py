@@ -0,0 +1,54 @@
+"""AsyncAnthropic clients kept per event loop."""
+
+import asyncio
+import threading
+from typing import Dict
+
+from anthropic import AsyncAnthropic
+
+
+class AsyncAnthropicClients:
+    """One AsyncAnthropic client per event loop, created on first use in it.
+
+    An async client's connection pool belongs to the loop it first ran in,
+    so a client cannot be reused by the next asyncio.run (a daemon run) or
+    by a loop in another thread (multi-site runs). Clients of finished loops
+    are dropped when a new one is created; call aclose() before a loop ends
+    to close its connections.
+    """
+
+    def __init__(self, api_key: str):
+        """Initialize client pool.
+
+        Args:
+            api_key: Anthropic API key for every client
+        """
+        self.api_key = api_key
+        self._lock = threading.Lock()
+        self._clients: Dict[asyncio.AbstractEventLoop, AsyncAnthropic] = {}
+
+    def client(self) -> AsyncAnthropic:
+        """The client of the running event loop.
+
+        Returns:
+            AsyncAnthropic (do not close it; see aclose)
+
+        Raises:
+            RuntimeError: If no event loop is running
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                for old_loop in [old for old in self._clients if old.is_closed()]:
+                    del self._clients[old_loop]
+                client = AsyncAnthropic(api_key=self.api_key)
+                self._clients[loop] = client
+            return client
+
+    async def aclose(self) -> None:
+        """Close the client of the running event loop, if any."""
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
@@ -3,9 +3,8 @@
 import re
 import json
 import logging
-from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from anthropic import Anthropic
 import anthropic
@@ -19,42 +18,74 @@ from utils.validators import (
     has_external_dependencies,
     validate_file_size
 )
+from generators.async_clients import AsyncAnthropicClients
+from generators.generated_app import GeneratedApp  # Re-exported for existing imports
 from generators.prompt_templates import build_prompt
+from utils.deadline import Deadline
+from utils.rate_limit import RateLimiter
+from utils.retry import retry
 
 logger = logging.getLogger("AADD")
 
 
-@dataclass
-class GeneratedApp:
-    """Represents a generated web application."""
-
-    html: str
-    css: str
-    js: str
-    metadata: dict
-    anniversary: Anniversary
-    language: Language
-    generated_at: datetime
-    thinking: str = ""  # Claude's extended thinking (if enabled)
-
-
 class ClaudeWebAppGenerator:
     """Generates web applications using Claude API."""
 
-    def __init__(self, config: Config):
+    REQUEST_TIMEOUT = 600  # seconds per generation request (SDK default)
+    EXPECTED_SECONDS = 180  # typical generation call, used to size retries
+    MAX_ATTEMPTS = 3
+    # Retried by @retry (the SDK's own retries are off): connection errors,
+    # 429 and 5xx/529; other API errors are not retried
+    RETRY_EXCEPTIONS = (anthropic.APIConnectionError, anthropic.APIStatusError)
+    # Below this much run budget, extended thinking is disabled to shorten the call
+    THINKING_MIN_SECONDS = 420
+
+    def __init__(self, config: Config, client: Anthropic = None,
+                 async_clients: AsyncAnthropicClients = None, rate_limiter: RateLimiter = None):
         """Initialize generator.
 
         Args:
             config: Application configuration
+            client: Anthropic client to share (created if not given)
+            async_clients: Per-loop AsyncAnthropic clients to share (created if not given)
+            rate_limiter: Process-wide limits for Anthropic calls (optional)
         """
         self.config = config
-        self.client = Anthropic(api_key=config.CLAUDE_API_KEY)
+        self.client = client or Anthropic(api_key=config.CLAUDE_API_KEY)
+        self.async_clients = async_clients or AsyncAnthropicClients(config.CLAUDE_API_KEY)
+        self.rate_limiter = rate_limiter or RateLimiter()
 
-    def generate_app(self, anniversary: Anniversary, language: Language = Language.ENGLISH) -> GeneratedApp:
+    def generate_app(self, anniversary: Anniversary, language: Language = Language.ENGLISH,
+                     style: str = None, deadline: Optional[Deadline] = None) -> GeneratedApp:
         """Generate a complete web application for an anniversary.
 
         Args:
             anniversary: The anniversary to generate an app for
+            language: Target language for the web app
+            style: Style direction for the prompt (random if not specified)
+            deadline: Run budget sizing the timeout and retries (optional)
+
+        Returns:
+            GeneratedApp object with HTML, CSS, JS, and metadata
+
+        Raises:
+            ValueError: If generation fails or output is invalid
+            anthropic.APIError: If API call fails
+        """
+        text, thinking = self.request_content(anniversary, language, style, deadline)
+        return self.build_app(text, thinking, anniversary, language)
+
+    async def generate_app_async(
+        self, anniversary: Anniversary, language: Language = Language.ENGLISH, style: str = None,
+        deadline: Optional[Deadline] = None
+    ) -> GeneratedApp:
+        """Async variant of generate_app using AsyncAnthropic.
+
+        Args:
+            anniversary: The anniversary to generate an app for
+            language: Target language for the web app
+            style: Style direction for the prompt (random if not specified)
+            deadline: Run budget sizing the timeout and retries (optional)
 
         Returns:
             GeneratedApp object with HTML, CSS, JS, and metadata
@@ -63,15 +94,82 @@ class ClaudeWebAppGenerator:
             ValueError: If generation fails or output is invalid
             anthropic.APIError: If API call fails
         """
+        text, thinking = await self.request_content_async(anniversary, language, style, deadline)
+        return self.build_app(text, thinking, anniversary, language)
+
+    def request_content(self, anniversary: Anniversary, language: Language = Language.ENGLISH,
+                        style: str = None,
+                        deadline: Optional[Deadline] = None,
+                        facts: Optional[List[str]] = None) -> Tuple[str, str]:
+        """Call Claude API and return the raw response content.
+
+        This is the expensive half of generate_app; its output can be
+        persisted and turned into an app later with build_app.
+
+        Args:
+            anniversary: The anniversary to generate an app for
+            language: Target language for the web app
+            style: Style direction for the prompt (random if not specified)
+            deadline: Run budget sizing the timeout and retries (optional)
+            facts: Background facts for the prompt (see ContextEnricher; optional)
+
+        Returns:
+            Tuple of (response text, extended thinking text)
+
+        Raises:
+            ValueError: If the response has no text content
+            anthropic.APIError: If API call fails
+            DeadlineExceeded: If the run budget is spent
+        """
+        logger.info(f"Generating app for: {anniversary.title} (language: {language.value})")
+
+        # Build prompt
+        prompt = build_prompt(anniversary, language, style, facts)
+        logger.debug(f"Prompt length: {len(prompt)} characters")
+
+        # Call Claude API
+        try:
+            response = self._call_claude_api(prompt, deadline)
+        except anthropic.RateLimitError as e:
+            logger.error(f"Claude API rate limit exceeded: {e}")
+            raise
+        except anthropic.APIError as e:
+            logger.error(f"Claude API error: {e}")
+            raise
+
+        return self._extract_content(response)
+
+    async def request_content_async(self, anniversary: Anniversary,
+                                    language: Language = Language.ENGLISH,
+                                    style: str = None,
+                                    deadline: Optional[Deadline] = None,
+                                    facts: Optional[List[str]] = None) -> Tuple[str, str]:
+        """Async variant of request_content.
+
+        Args:
+            anniversary: The anniversary to generate an app for
+            language: Target language for the web app
+            style: Style direction for the prompt (random if not specified)
+            deadline: Run budget sizing the timeout and retries (optional)
+            facts: Background facts for the prompt (see ContextEnricher; optional)
+
+        Returns:
+            Tuple of (response text, extended thinking text)
+
+        Raises:
+            ValueError: If the response has no text content
+            anthropic.APIError: If API call fails
+            DeadlineExceeded: If the run budget is spent
+        """
         logger.info(f"Generating app for: {anniversary.title} (language: {language.value})")
 
         # Build prompt
-        prompt = build_prompt(anniversary, language)
+        prompt = build_prompt(anniversary, language, style, facts)
         logger.debug(f"Prompt length: {len(prompt)} characters")
 
         # Call Claude API
         try:
-            response = self._call_claude_api(prompt)
+            response = await self._call_claude_api_async(prompt, deadline)
         except anthropic.RateLimitError as e:
             logger.error(f"Claude API rate limit exceeded: {e}")
             raise
@@ -79,9 +177,27 @@ class ClaudeWebAppGenerator:
             logger.error(f"Claude API error: {e}")
             raise
 
+        return self._extract_content(response)
+
+    def build_app(self, text: str, thinking: str, anniversary: Anniversary,
+                  language: Language = Language.ENGLISH) -> GeneratedApp:
+        """Parse and validate raw response content into a GeneratedApp.
+
+        Args:
+            text: Response text containing the tagged files
+            thinking: Extended thinking text (may be empty)
+            anniversary: The anniversary this app is for
+            language: Target language for the web app
+
+        Returns:
+            Validated GeneratedApp
+
+        Raises:
+            ValueError: If the content cannot be parsed or is invalid
+        """
         # Parse response
         try:
-            app = self._parse_response(response, anniversary, language)
+            app = self._parse_content(text, thinking, anniversary, language)
         except Exception as e:
             logger.error(f"Failed to parse Claude response: {e}")
             raise ValueError(f"Failed to parse response: {e}")
@@ -94,14 +210,79 @@ class ClaudeWebAppGenerator:
         )
         return app
 
-    def _call_claude_api(self, prompt: str):
+    @retry(max_attempts=MAX_ATTEMPTS, delay=5, max_delay=120, exceptions=RETRY_EXCEPTIONS,
+           attempt_seconds=EXPECTED_SECONDS)
+    def _call_claude_api(self, prompt: str, deadline: Optional[Deadline] = None):
         """Call Claude API with extended thinking if enabled.
 
         Args:
             prompt: The prompt to send
+            deadline: Run budget sizing the timeout and retries (optional)
+
+        Returns:
+            API response object
+
+        Raises:
+            DeadlineExceeded: If the rate limit wait would outlast the run budget
+        """
+        request_params = self._build_request_params(prompt, deadline)
+        max_tokens = request_params["max_tokens"]
+        self.rate_limiter.acquire_message(max_tokens, deadline)
+
+        # Make API call
+        logger.info(f"Calling Claude API (model: {self.config.CLAUDE_MODEL})...")
+        response = None
+        try:
+            # Inside the try: a rate limit wait may have spent the budget, and then this raises
+            client = self.client.with_options(**self._request_options(deadline))
+            response = client.messages.create(**request_params)
+        finally:
+            self.rate_limiter.settle_message(max_tokens, response)
+
+        self._log_usage(response)
+        return response
+
+    @retry(max_attempts=MAX_ATTEMPTS, delay=5, max_delay=120, exceptions=RETRY_EXCEPTIONS,
+           attempt_seconds=EXPECTED_SECONDS)
+    async def _call_claude_api_async(self, prompt: str, deadline: Optional[Deadline] = None):
+        """Call Claude API asynchronously with extended thinking if enabled.
+
+        Args:
+            prompt: The prompt to send
+            deadline: Run budget sizing the timeout and retries (optional)
 
         Returns:
             API response object
+
+        Raises:
+            DeadlineExceeded: If the rate limit wait would outlast the run budget
+        """
+        request_params = self._build_request_params(prompt, deadline)
+        max_tokens = request_params["max_tokens"]
+        await self.rate_limiter.acquire_message_async(max_tokens, deadline)
+
+        # Make API call
+        logger.info(f"Calling Claude API async (model: {self.config.CLAUDE_MODEL})...")
+        response = None
+        try:
+            # Inside the try: a rate limit wait may have spent the budget, and then this raises
+            client = self.async_clients.client().with_options(**self._request_options(deadline))
+            response = await client.messages.create(**request_params)
+        finally:
+            self.rate_limiter.settle_message(max_tokens, response)
+
+        self._log_usage(response)
+        return response
+
+    def _build_request_params(self, prompt: str, deadline: Optional[Deadline] = None) -> dict:
+        """Build messages.create parameters for a generation request.
+
+        Args:
+            prompt: The prompt to send
+            deadline: Run budget; when low, extended thinking is skipped (optional)
+
+        Returns:
+            Request parameters
         """
         # Prepare messages
         messages = [
@@ -118,39 +299,58 @@ class ClaudeWebAppGenerator:
             "messages": messages
         }
 
-        # Add extended thinking if enabled
-        if self.config.ENABLE_EXTENDED_THINKING:
+        # Add extended thinking if enabled and the run budget allows it
+        thinking = self.config.ENABLE_EXTENDED_THINKING
+        if thinking and deadline and deadline.is_low(self.THINKING_MIN_SECONDS):
+            logger.warning(f"Run budget low ({deadline}), extended thinking disabled")
+            thinking = False
+
+        if thinking:
             request_params["thinking"] = {
                 "type": "enabled",
                 "budget_tokens": self.config.CLAUDE_THINKING_BUDGET
             }
             logger.info("Extended thinking enabled")
 
-        # Make API call
-        logger.info(f"Calling Claude API (model: {self.config.CLAUDE_MODEL})...")
-        response = self.client.messages.create(**request_params)
+        return request_params
+
+    def _request_options(self, deadline: Optional[Deadline]) -> dict:
+        """Size the request timeout from the run budget; retries are left to @retry.
+
+        Args:
+            deadline: Run budget (optional)
+
+        Returns:
+            Client options for with_options()
+        """
+        options = {"max_retries": 0}
+        if deadline:
+            options["timeout"] = deadline.timeout(self.REQUEST_TIMEOUT)
+        return options
 
-        # Log token usage
+    def _log_usage(self, response):
+        """Log token usage of an API response.
+
+        Args:
+            response: API response object
+        """
         usage = response.usage
         logger.info(
             f"API call completed. Tokens - Input: {usage.input_tokens}, "
             f"Output: {usage.output_tokens}"
         )
 
-        return response
-
-    def _parse_response(self, response, anniversary: Anniversary, language: Language) -> GeneratedApp:
-        """Parse Claude's response to extract files and metadata.
+    def _extract_content(self, response) -> Tuple[str, str]:
+        """Extract text and thinking from a Claude response.
 
         Args:
             response: Claude API response
-            anniversary: The anniversary this app is for
 
         Returns:
-            GeneratedApp object
+            Tuple of (response text, extended thinking text)
 
         Raises:
-            ValueError: If response format is invalid
+            ValueError: If the response has no text content
         """
         # Extract thinking (if present)
         thinking = ""
@@ -166,6 +366,27 @@ class ClaudeWebAppGenerator:
         if not text_content:
             raise ValueError("No text content in response")
 
+        return text_content, thinking
+
+    def _parse_content(self, text_content: str, thinking: str, anniversary: Anniversary,
+                       language: Language) -> GeneratedApp:
+        """Parse Claude's response text to extract files and metadata.
+
+        Args:
+            text_content: Response text
+            thinking: Extended thinking text
+            anniversary: The anniversary this app is for
+            language: Target language for the web app
+
+        Returns:
+            GeneratedApp object
+
+        Raises:
+            ValueError: If response format is invalid
+        """
+        if not text_content:
+            raise ValueError("No text content in response")
+
         # Parse using regex
         html_match = re.search(
             r'<html_file>(.*?)</html_file>',
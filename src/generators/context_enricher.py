@@ -0,0 +1,249 @@
+"""Background facts for the selected anniversary from the articles it links to."""
+
+import json
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Optional
+from urllib.parse import quote
+
+import httpx
+import requests
+
+from config import Language
+from fetchers.base_fetcher import Anniversary
+from utils.deadline import Deadline
+from utils.http_transport import HttpTransport
+from utils.rate_limit import RateLimiter, WIKIPEDIA_BUCKET
+from utils.summary_cache import PageSummary, SummaryCache
+
+logger = logging.getLogger("AADD")
+
+
+class ContextEnricher:
+    """Looks up the people, places and things an anniversary links to.
+
+    Summaries of the first ``max_pages`` linked articles come from the
+    summary cache, and the rest are requested from the Wikimedia REST API
+    at the same time. The stage ends after ``max_seconds`` (or when the
+    run budget does) and uses whatever has arrived by then. Slower
+    requests are abandoned and finish in the background, filling the
+    cache for the next run. With less than MIN_SECONDS left, only the
+    cache is used.
+    """
+
+    BASE_URL = "https://{lang}.wikipedia.org/api/rest_v1/page/summary"
+    MIN_SECONDS = 0.2  # Below this no request is started
+    MAX_EXTRACT_CHARS = 300  # Per article, cut at a sentence end where possible
+    HEADERS = {"Accept": "application/json"}
+
+    def __init__(self, language: Language, cache: Optional[SummaryCache] = None,
+                 transport: Optional[HttpTransport] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 max_pages: int = 4, max_seconds: float = 2.0, base_url: Optional[str] = None):
+        """Initialize enricher.
+
+        Args:
+            language: Wikipedia edition to read summaries from
+            cache: Persistent summary cache (optional)
+            transport: Connection pools to use (a private one by default)
+            rate_limiter: Process-wide rate limits (unlimited by default)
+            max_pages: Most linked articles to summarize
+            max_seconds: Longest the stage may take
+            base_url: Summary endpoint (defaults to BASE_URL for the language;
+                point it at a local stand-in server for testing)
+        """
+        self.language = language
+        self.cache = cache
+        self.transport = transport or HttpTransport(timeout=max_seconds)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.rate_bucket = WIKIPEDIA_BUCKET.format(lang=language.value)
+        self.max_pages = max_pages
+        self.max_seconds = max_seconds
+        self.base_url = (base_url or self.BASE_URL.format(lang=language.value)).rstrip("/")
+        self.stats = {"cached": 0, "fetched": 0, "failed": 0, "abandoned": 0}
+
+    def facts(self, anniversary: Anniversary, deadline: Optional[Deadline] = None) -> List[str]:
+        """Fact lines about the articles an anniversary links to.
+
+        Never raises; a failed or late lookup just leaves its article out.
+
+        Args:
+            anniversary: Selected anniversary
+            deadline: Run budget the stage must also fit in (optional)
+
+        Returns:
+            "Title (description): extract" lines, in link order
+        """
+        titles = anniversary.links[:self.max_pages]
+        if not titles:
+            return []
+
+        started = time.monotonic()
+        summaries, missing = self._cached(titles)
+        stage = self._stage_deadline(deadline)
+        if missing and stage:
+            pool = ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix="aadd-enrich")
+            futures = {pool.submit(self._fetch, title, stage): title for title in missing}
+            done, not_done = wait(futures, timeout=stage.remaining())
+            pool.shutdown(wait=False, cancel_futures=True)  # Late requests finish on their own
+            for future in done:
+                self._collect(summaries, futures[future], future)
+            self._abandon(not_done)
+
+        return self._lines(titles, summaries, started)
+
+    async def facts_async(self, anniversary: Anniversary,
+                          deadline: Optional[Deadline] = None) -> List[str]:
+        """Async variant of facts; late requests are cancelled.
+
+        Args:
+            anniversary: Selected anniversary
+            deadline: Run budget the stage must also fit in (optional)
+
+        Returns:
+            "Title (description): extract" lines, in link order
+        """
+        titles = anniversary.links[:self.max_pages]
+        if not titles:
+            return []
+
+        started = time.monotonic()
+        summaries, missing = self._cached(titles)
+        stage = self._stage_deadline(deadline)
+        if missing and stage:
+            client = self.transport.async_client()
+            tasks = {asyncio.ensure_future(self._fetch_async(client, title, stage)): title
+                     for title in missing}
+            done, pending = await asyncio.wait(tasks, timeout=stage.remaining())
+            for task in pending:
+                task.cancel()
+            for task in done:
+                self._collect(summaries, tasks[task], task)
+            self._abandon(pending)
+
+        return self._lines(titles, summaries, started)
+
+    def _fetch(self, title: str, stage: Deadline) -> PageSummary:
+        """Request one summary and cache it.
+
+        Raises:
+            requests.RequestException: If the request fails
+            DeadlineExceeded: If the stage ends first
+        """
+        self.rate_limiter.acquire(self.rate_bucket, deadline=stage)
+        response = self.transport.session.get(self._url(title), headers=self.HEADERS,
+                                              timeout=stage.timeout(self.max_seconds))
+        if response.status_code != 404:
+            response.raise_for_status()
+        return self._store(title, response.status_code, response.content)
+
+    async def _fetch_async(self, client: httpx.AsyncClient, title: str, stage: Deadline) -> PageSummary:
+        """Async variant of _fetch.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            DeadlineExceeded: If the stage ends first
+        """
+        await self.rate_limiter.acquire_async(self.rate_bucket, deadline=stage)
+        response = await client.get(self._url(title), headers=self.HEADERS,
+                                    timeout=stage.timeout(self.max_seconds))
+        if response.status_code != 404:
+            response.raise_for_status()
+        return self._store(title, response.status_code, response.content)
+
+    def _store(self, title: str, status: int, content: bytes) -> PageSummary:
+        """Parse a summary response and put it in the cache.
+
+        Args:
+            title: Requested title (the cache key, even if the page redirects)
+            status: HTTP status
+            content: Response body
+
+        Returns:
+            PageSummary (missing for 404s and disambiguation pages)
+        """
+        if status == 404:
+            summary = PageSummary(title=title, missing=True)
+        else:
+            data = self._json(content)
+            summary = PageSummary(
+                title=title,
+                description=(data.get("description") or "").strip(),
+                extract=" ".join((data.get("extract") or "").split()),
+                missing=data.get("type") == "disambiguation",
+            )
+        if self.cache:
+            self.cache.put(self.language.value, summary)
+        return summary
+
+    @staticmethod
+    def _json(content: bytes) -> dict:
+        """Decode a summary body, raising ValueError unless it is a JSON object."""
+        data = json.loads(content)
+        if not isinstance(data, dict):
+            raise ValueError("Summary response is not a JSON object")
+        return data
+
+    def _cached(self, titles: List[str]):
+        """Split titles into cached summaries and titles still to fetch."""
+        summaries = {}
+        missing = []
+        for title in titles:
+            summary = self.cache.get(self.language.value, title) if self.cache else None
+            if summary is None:
+                missing.append(title)
+            else:
+                summaries[title] = summary
+                self.stats["cached"] += 1
+        return summaries, missing
+
+    def _stage_deadline(self, deadline: Optional[Deadline]) -> Optional[Deadline]:
+        """Budget for the requests, or None if there is too little time to start any."""
+        seconds = min(self.max_seconds, deadline.remaining()) if deadline else self.max_seconds
+        if seconds < self.MIN_SECONDS:
+            logger.info(f"Skipping summary requests: {seconds:.1f}s left, using cached summaries only")
+            return None
+        return Deadline(seconds)
+
+    def _collect(self, summaries: dict, title: str, future) -> None:
+        """Add the result of a finished request, logging a failed one."""
+        try:
+            summaries[title] = future.result()
+            self.stats["fetched"] += 1
+        except Exception as e:  # Connection errors, bad responses, the rate limit wait
+            logger.debug(f"No summary of {title}: {e}")
+            self.stats["failed"] += 1
+
+    def _abandon(self, unfinished) -> None:
+        """Count the requests given up at the end of the stage."""
+        if unfinished:
+            self.stats["abandoned"] += len(unfinished)
+            logger.info(f"Stopped waiting for {len(unfinished)} page summaries at the deadline")
+
+    def _lines(self, titles: List[str], summaries: dict, started: float) -> List[str]:
+        """Fact lines for the summaries that are usable, in link order."""
+        lines = []
+        for title in titles:
+            summary = summaries.get(title)
+            if summary is None or summary.missing or not summary.extract:
+                continue
+            label = f"{title} ({summary.description})" if summary.description else title
+            lines.append(f"{label}: {self._shorten(summary.extract)}")
+
+        logger.info(f"Context: {len(lines)} of {len(titles)} linked articles summarized "
+                    f"in {time.monotonic() - started:.2f}s")
+        return lines
+
+    def _shorten(self, extract: str) -> str:
+        """Cut an extract to MAX_EXTRACT_CHARS, at the last sentence end if there is one."""
+        if len(extract) <= self.MAX_EXTRACT_CHARS:
+            return extract
+        cut = extract[:self.MAX_EXTRACT_CHARS]
+        end = max(cut.rfind(". "), cut.rfind("。"))
+        return cut[:end + 1] if end > 0 else cut.rstrip() + "…"
+
+    def _url(self, title: str) -> str:
+        """Summary URL of a title ("/" and other reserved characters escaped)."""
+        return f"{self.base_url}/{quote(title.replace(' ', '_'), safe='')}"
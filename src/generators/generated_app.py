@@ -0,0 +1,52 @@
+"""Generated web app data structure.
+
+Kept free of SDK imports so the file system side (FileManager, index
+regeneration) can load it without importing the Anthropic client.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from config import Language
+from fetchers.base_fetcher import Anniversary
+
+
+@dataclass
+class GeneratedApp:
+    """Represents a generated web application."""
+
+    html: str
+    css: str
+    js: str
+    metadata: dict
+    anniversary: Anniversary
+    language: Language
+    generated_at: datetime
+    thinking: str = ""  # Claude's extended thinking (if enabled)
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "html": self.html,
+            "css": self.css,
+            "js": self.js,
+            "metadata": self.metadata,
+            "anniversary": self.anniversary.to_dict(),
+            "language": self.language.value,
+            "generated_at": self.generated_at.isoformat(),
+            "thinking": self.thinking,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GeneratedApp":
+        """Create a GeneratedApp from a to_dict() dictionary."""
+        return cls(
+            html=data["html"],
+            css=data["css"],
+            js=data["js"],
+            metadata=data.get("metadata", {}),
+            anniversary=Anniversary.from_dict(data["anniversary"]),
+            language=Language(data["language"]),
+            generated_at=datetime.fromisoformat(data["generated_at"]),
+            thinking=data.get("thinking", ""),
+        )
@@ -1,7 +1,7 @@
 """Prompt templates for Claude API web app generation."""
 
 import random
-from datetime import date
+from typing import List, Optional
 from fetchers.base_fetcher import Anniversary
 from config import Language
 
@@ -28,10 +28,9 @@ WEBAPP_GENERATION_PROMPT = """You are a creative web developer tasked with creat
 # Anniversary Details
 - **Event**: {title}
 - **Date**: {date_formatted}
-- **Years Ago**: {years_ago} years
-- **Description**: {description}
+{timing}- **Description**: {description}
 - **Category**: {category}
-
+{facts}
 # Your Mission: Create Something MEMORABLE
 
 Build a web experience that makes people say "Wow, I never knew that!" or "This is amazing!"
@@ -247,13 +246,95 @@ Now create an amazing web app that brings this anniversary to life!
 """
 
 
-def build_prompt(anniversary: Anniversary, language: Language = Language.ENGLISH, style_preference: str = None) -> str:
+# Heading of the background facts block, per language
+FACTS_HEADINGS = {
+    Language.ENGLISH: "# Background (summaries of linked Wikipedia articles)",
+    Language.JAPANESE: "# 背景情報（関連するWikipedia記事の概要）",
+}
+
+
+# Anniversary details line giving the year, per language and day page
+# section; observances have no year and get no line
+TIMING_LINES = {
+    Language.ENGLISH: {
+        "events": "- **Years Ago**: {years_ago} years",
+        "births": "- **Born**: {year} ({years_ago} years ago)",
+    },
+    Language.JAPANESE: {
+        "events": "- **経過年数**: {years_ago}年",
+        "births": "- **生年**: {year}年（{years_ago}年前に誕生）",
+    },
+}
+
+# Year shown after each candidate in the selection prompts, per language
+# and day page section
+CANDIDATE_YEARS = {
+    Language.ENGLISH: {"events": " ({year})", "births": " (born {year})", "observances": " (observance)"},
+    Language.JAPANESE: {"events": "（{year}年）", "births": "（{year}年生まれ）", "observances": "（記念日）"},
+}
+
+
+def format_timing(anniversary: Anniversary, language: Language = Language.ENGLISH) -> str:
+    """Anniversary details line with the year and how long ago it was.
+
+    Counts from the anniversary's date, not today, so backfilled apps stay
+    accurate.
+
+    Args:
+        anniversary: The anniversary
+        language: Language of the prompt
+
+    Returns:
+        The line with a trailing newline, or "" for observances (no year)
+    """
+    if anniversary.year is None:
+        return ""
+    lines = TIMING_LINES.get(language, TIMING_LINES[Language.ENGLISH])
+    line = lines.get(anniversary.section, lines["events"])
+    return line.format(year=anniversary.year, years_ago=anniversary.date.year - anniversary.year) + "\n"
+
+
+def format_candidate_year(anniversary: Anniversary, language: Language = Language.ENGLISH) -> str:
+    """Year suffix for a candidate in the selection prompts.
+
+    Args:
+        anniversary: The candidate
+        language: Language of the prompt
+
+    Returns:
+        E.g. " (1969)", " (born 1969)" or " (observance)"
+    """
+    labels = CANDIDATE_YEARS.get(language, CANDIDATE_YEARS[Language.ENGLISH])
+    if anniversary.year is None:
+        return labels["observances"]
+    return labels.get(anniversary.section, labels["events"]).format(year=anniversary.year)
+
+
+def format_facts(facts: Optional[List[str]], language: Language = Language.ENGLISH) -> str:
+    """Background facts block placed after the anniversary details.
+
+    Args:
+        facts: Fact lines (see ContextEnricher)
+        language: Language of the prompt
+
+    Returns:
+        Block with a heading and one bullet per fact, or "" without facts
+    """
+    if not facts:
+        return ""
+    bullets = "\n".join(f"- {fact}" for fact in facts)
+    return f"\n{FACTS_HEADINGS.get(language, FACTS_HEADINGS[Language.ENGLISH])}\n{bullets}\n"
+
+
+def build_prompt(anniversary: Anniversary, language: Language = Language.ENGLISH, style_preference: str = None,
+                 facts: Optional[List[str]] = None) -> str:
     """Build complete prompt with anniversary data.
 
     Args:
         anniversary: The anniversary to generate an app for
         language: Target language for the web app
         style_preference: Optional style direction (random if not specified)
+        facts: Background facts about the linked articles (optional)
 
     Returns:
         Complete prompt string
@@ -261,8 +342,6 @@ def build_prompt(anniversary: Anniversary, language: Language = Language.ENGLISH
     if style_preference is None:
         style_preference = random.choice(APP_STYLES)
 
-    years_ago = date.today().year - anniversary.year
-
     if language == Language.JAPANESE:
         date_formatted = anniversary.date.strftime("%Y年%m月%d日")
         prompt_template = _get_japanese_prompt_template()
@@ -273,9 +352,10 @@ def build_prompt(anniversary: Anniversary, language: Language = Language.ENGLISH
     prompt = prompt_template.format(
         title=anniversary.title,
         date_formatted=date_formatted,
-        years_ago=years_ago,
+        timing=format_timing(anniversary, language),
         description=anniversary.description,
         category=anniversary.category,
+        facts=format_facts(facts, language),
         style_preference=style_preference
     )
 
@@ -289,10 +369,9 @@ def _get_japanese_prompt_template() -> str:
 # 記念日の詳細
 - **出来事**: {title}
 - **日付**: {date_formatted}
-- **経過年数**: {years_ago}年
-- **説明**: {description}
+{timing}- **説明**: {description}
 - **カテゴリ**: {category}
-
+{facts}
 # あなたのミッション：心に残る体験を創る
 
 「えっ、知らなかった！」「これすごい！」と言わせるWebアプリを作ってください。
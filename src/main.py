@@ -1,21 +1,45 @@
 """Main orchestrator for AADD (Automated Anniversary-Driven Development)."""
 
 import sys
+import json
+import asyncio
+import argparse
 import logging
-from datetime import date
+import threading
+from datetime import date, timedelta
 from pathlib import Path
+from functools import partial
+from typing import TYPE_CHECKING, Optional
 
 from config import Config, Language
 from utils.logger import setup_logger
-from fetchers.base_fetcher import FetcherManager
-from fetchers.wikipedia_fetcher import WikipediaFetcher
-from fetchers.wikipedia_ja_fetcher import WikipediaJaFetcher
+from utils.deadline import Deadline
+from utils.retry import retry_budget, start_retry_budget
+from fetchers.base_fetcher import BaseFetcher, FetcherManager
 from fetchers.fallback_fetcher import FallbackFetcher
-from generators.claude_generator import ClaudeWebAppGenerator
-from generators.anniversary_selector import AnniversarySelector
+from fetchers.caching_fetcher import CachingFetcher
+from fetchers.circuit_breaker import BreakerStore
+from fetchers.corpus_fetcher import OfflineCorpusFetcher, corpus_file
 from publishers.file_manager import FileManager
 from publishers.index_generator import IndexGenerator
-from publishers.git_manager import GitManager
+from pipeline.backfill import plan_backfill, run_backfill
+from pipeline.checkpoint import CheckpointStore
+from pipeline.job_store import JobStore
+from pipeline.pregenerate import plan_pregeneration, make_stage_worker, promote_staged_app
+from pipeline.daemon import Daemon, send_command, COMMANDS
+from pipeline.service import GenerationService, PreviewServer
+from pipeline.multisite import Site, load_sites, run_sites, repo_lock
+
+# Modules backed by heavy SDKs (anthropic, GitPython, bs4/lxml, requests/httpx)
+# are imported where first used, so --help and --control start fast
+if TYPE_CHECKING:
+    from generators.claude_generator import ClaudeWebAppGenerator
+    from generators.anniversary_selector import AnniversarySelector
+    from generators.context_enricher import ContextEnricher
+    from fetchers.candidates import CandidatePipeline
+    from publishers.git_manager import GitManager
+    from utils.http_transport import HttpTransport
+    from utils.rate_limit import RateLimiter
 
 # Exit codes
 EXIT_SUCCESS = 0
@@ -24,18 +48,179 @@ EXIT_APP_GENERATION_FAILED = 2
 EXIT_FILE_OPERATIONS_FAILED = 3
 EXIT_GIT_OPERATIONS_FAILED = 4
 
+# Pre-generation job store, inside Config.STAGING_DIR
+JOB_STORE_FILE = "jobs.sqlite3"
+
 # Logger will be initialized in main()
 logger = None
 
+# Fetchers are cached per source (language and Wikipedia settings, dump or
+# data file) so sessions, fetched pages and parsed fallback data are shared
+# by every run and site in the same process
+_fetchers = {}
+_fetchers_lock = threading.Lock()
+
+# Compiled fallback data, inside Config.CACHE_DIR
+FALLBACK_INDEX_DIR = "fallback"
+
+# Wikipedia dump offset indexes, inside Config.CACHE_DIR
+DUMP_INDEX_DIR = "dump"
+
+# Circuit breaker state file, inside Config.CACHE_DIR
+BREAKER_STATE_FILE = "breakers.json"
+_breaker_store = None
+
+# Page summaries for context enrichment, inside Config.CACHE_DIR
+SUMMARY_CACHE_DIR = "summaries"
+
+# Connection pools, rate limits and enrichers shared by every caller in the process
+_http_transport = None
+_rate_limiter = None
+_summary_cache = None
+_context_enrichers = {}
+_shared_lock = threading.Lock()
+
+
+class Runtime:
+    """Clients and managers reused across runs.
+
+    A one-shot run builds one of these; the daemon keeps it warm between
+    scheduled runs and rebuilds it when the configuration is reloaded.
+    In multi-site mode every site gets its own runtime, sharing the
+    Anthropic clients (and their connection pools) of the first one; async
+    clients are kept per event loop, so each asyncio.run and each site
+    thread gets its own.
+    Anthropic rate limits are process-wide, so all sites share them.
+    """
+
+    def __init__(self, config: Config, shared: "Runtime" = None):
+        """Build the runtime.
+
+        Args:
+            config: Application configuration
+            shared: Runtime whose Anthropic clients to reuse (optional)
+        """
+        from anthropic import Anthropic
+        from generators.async_clients import AsyncAnthropicClients
+        from generators.claude_generator import ClaudeWebAppGenerator
+        from generators.anniversary_selector import AnniversarySelector
 
-def main() -> int:
+        if shared:
+            self.client, self.async_clients = shared.client, shared.async_clients
+        else:
+            self.client = Anthropic(api_key=config.CLAUDE_API_KEY)
+            self.async_clients = AsyncAnthropicClients(config.CLAUDE_API_KEY)
+
+        self.config = config
+        self.file_manager = FileManager(config.DOCS_DIR)
+        rate_limiter = get_rate_limiter(config)
+        self.generator = ClaudeWebAppGenerator(config, self.client, self.async_clients, rate_limiter)
+        self.selector = AnniversarySelector(config, self.client, self.async_clients, rate_limiter)
+        self._git_manager = None
+
+    @property
+    def git_manager(self) -> "GitManager":
+        """GitManager, opened on first use."""
+        if self._git_manager is None:
+            from publishers.git_manager import GitManager
+            self._git_manager = GitManager(self.config.PROJECT_ROOT, self.config)
+        return self._git_manager
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="AADD - Automated Anniversary-Driven Development"
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="Generate the Japanese and English apps concurrently"
+    )
+    parser.add_argument(
+        "--from",
+        dest="from_date",
+        type=date.fromisoformat,
+        metavar="YYYY-MM-DD",
+        help="Backfill mode: first date to generate (skips dates already published)"
+    )
+    parser.add_argument(
+        "--to",
+        dest="to_date",
+        type=date.fromisoformat,
+        metavar="YYYY-MM-DD",
+        help="Backfill mode: last date to generate (default: today)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Backfill/pre-generation: maximum number of (date, language) jobs in flight "
+             "(default: 2)"
+    )
+    parser.add_argument(
+        "--pregenerate",
+        type=int,
+        metavar="DAYS",
+        help="Generate apps for the next DAYS days into the staging area; "
+             "the daily run then only promotes them"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run as a long-lived daemon on the DAEMON_SCHEDULE cron schedule"
+    )
+    parser.add_argument(
+        "--control",
+        choices=COMMANDS,
+        help="Send a command to a running daemon's control socket and exit"
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run the local HTTP preview service on SERVICE_PORT"
+    )
+    parser.add_argument(
+        "--sites",
+        type=Path,
+        metavar="FILE",
+        help="Multi-site mode: run every site listed in a JSON sites file in one process"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from the first incomplete stage of a previous failed run"
+    )
+    args = parser.parse_args(argv)
+    if args.to_date and not args.from_date:
+        parser.error("--to requires --from")
+    if args.from_date and args.from_date > (args.to_date or date.today()):
+        parser.error("--from must not be after --to")
+    return args
+
+
+def main(argv=None) -> int:
     """Main entry point for AADD.
 
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
     Returns:
         Exit code (0 for success, non-zero for failure)
     """
     global logger
 
+    args = parse_args(argv)
+
     # Load configuration
     try:
         config = Config.load()
@@ -47,70 +232,117 @@ def main() -> int:
 
     # Set up logging
     logger = setup_logger(config.LOGS_DIR)
+    start_retry_budget(config.RETRY_BUDGET_RATIO, config.RETRY_BUDGET_MIN)
+
+    if args.control:
+        return run_control_command(config, args.control)
+
+    if args.serve:
+        return run_serve_mode(config)
+
+    if args.daemon:
+        return run_daemon_mode(config, args.async_mode)
+
+    if args.sites:
+        return run_multisite_mode(config, args.sites, args.async_mode, args.concurrency, args.resume)
+
+    if args.pregenerate:
+        return run_pregenerate_mode(config, args.pregenerate, args.concurrency)
+
+    checkpoints = CheckpointStore(config.RUNS_DIR, resume=args.resume)
+
+    if args.from_date:
+        return run_backfill_mode(config, args.from_date, args.to_date or date.today(),
+                                 args.concurrency, checkpoints)
+
+    # Bound the whole run; stages size timeouts from it and degrade when it runs low
+    deadline = Deadline(config.RUN_BUDGET_SECONDS)
+
+    try:
+        runtime = Runtime(config)
+    except Exception as e:
+        logger.critical(f"Failed to initialize: {e}", exc_info=True)
+        return EXIT_APP_GENERATION_FAILED
+
+    return run_daily(runtime, date.today(), args.async_mode, checkpoints, deadline)
+
+
+def run_daily(runtime: Runtime, target_date: date, async_mode: bool = False,
+              checkpoints: CheckpointStore = None, deadline: Deadline = None) -> int:
+    """Generate and publish the apps for one date.
+
+    Args:
+        runtime: Clients and managers to use
+        target_date: Date to generate for
+        async_mode: Generate the languages concurrently
+        checkpoints: Stage checkpoint store (optional)
+        deadline: Run budget shared by all stages (optional)
+
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
+    config = runtime.config
+    file_manager = runtime.file_manager
+    generator = runtime.generator
+    selector = runtime.selector
 
     logger.info("=" * 60)
     logger.info("AADD Daily Run Starting")
     logger.info("=" * 60)
+    if deadline:
+        logger.info(f"Run budget: {deadline}")
 
     try:
-        target_date = date.today()
-        file_manager = FileManager(config.DOCS_DIR)
-        generator = ClaudeWebAppGenerator(config)
-        selector = AnniversarySelector(config)
+        if checkpoints and checkpoints.is_published(target_date):
+            logger.info(f"Run for {target_date.isoformat()} already published, nothing to resume")
+            return EXIT_SUCCESS
 
-        # Generate Japanese app
-        logger.info("=" * 60)
-        logger.info("Generating Japanese App")
-        logger.info("=" * 60)
-        ja_anniversary = generate_language_app(
-            config, generator, selector, file_manager, target_date, Language.JAPANESE
-        )
+        languages = config.LANGUAGES
 
-        # Generate English app
-        logger.info("=" * 60)
-        logger.info("Generating English App")
-        logger.info("=" * 60)
-        en_anniversary = generate_language_app(
-            config, generator, selector, file_manager, target_date, Language.ENGLISH
-        )
+        # Publish apps staged ahead of time by --pregenerate, if still current
+        selected = promote_staged_apps(config, file_manager, target_date, languages)
+        pending = [language for language in languages if not selected.get(language)]
 
-        # Step 5: Update index pages
-        logger.info("=" * 60)
-        logger.info("Updating index pages...")
-        logger.info("=" * 60)
-        try:
-            apps_ja = file_manager.get_all_apps(Language.JAPANESE)
-            apps_en = file_manager.get_all_apps(Language.ENGLISH)
-            index_generator = IndexGenerator(
-                config.DOCS_DIR,
-                config.DATA_DIR / "templates"
+        if pending and async_mode:
+            # Run languages concurrently; wall time is the slowest language
+            logger.info("=" * 60)
+            logger.info(f"Generating {', '.join(l.name.title() for l in pending)} Apps (async)")
+            logger.info("=" * 60)
+            results = asyncio.run(
+                generate_language_apps_async(
+                    config, generator, selector, file_manager, target_date,
+                    pending, checkpoints, deadline
+                )
             )
-            index_generator.update_all_indexes(apps_ja, apps_en)
-            logger.info(f"Updated indexes (ja: {len(apps_ja)}, en: {len(apps_en)})")
-        except Exception as e:
-            logger.error(f"Failed to update indexes: {e}", exc_info=True)
-            return EXIT_FILE_OPERATIONS_FAILED
+            selected.update(zip(pending, results))
+        else:
+            for language in pending:
+                logger.info("=" * 60)
+                logger.info(f"Generating {language.name.title()} App")
+                logger.info("=" * 60)
+                selected[language] = generate_language_app(
+                    config, generator, selector, file_manager, target_date, language,
+                    checkpoints, deadline=deadline
+                )
 
-        # Step 6: Git commit and push
-        logger.info("=" * 60)
-        logger.info("Committing and pushing to Git...")
-        logger.info("=" * 60)
+        generated = [selected.get(language) for language in languages]
+        get_http_transport(config).log_stats()
+        get_rate_limiter(config).log_stats()
+        retry_budget().log_stats()
 
-        # Check if we have any anniversary to use for commit message
-        anniversary_for_commit = ja_anniversary if ja_anniversary else en_anniversary
-        if not anniversary_for_commit:
-            logger.warning("No anniversary generated, skipping git operations")
-        else:
-            try:
-                git_manager = GitManager(config.PROJECT_ROOT, config)
-                success = git_manager.commit_and_push(anniversary_for_commit)
-                if not success:
-                    logger.error("Git operations failed")
-                    return EXIT_GIT_OPERATIONS_FAILED
-                logger.info("Git operations completed successfully")
-            except Exception as e:
-                logger.error(f"Git operations failed: {e}", exc_info=True)
-                return EXIT_GIT_OPERATIONS_FAILED
+        anniversary_for_commit = next((ann for ann in generated if ann), None)
+        exit_code = publish(
+            runtime, [anniversary_for_commit] if anniversary_for_commit else []
+        )
+        if exit_code != EXIT_SUCCESS:
+            logger.info("Stage checkpoints kept; rerun with --resume to retry publishing")
+            return exit_code
+
+        # A language that failed stays unpublished so --resume retries it
+        if checkpoints:
+            if all(generated):
+                checkpoints.mark_published(target_date)
+            checkpoints.prune()
 
         # Success!
         logger.info("=" * 60)
@@ -123,67 +355,915 @@ def main() -> int:
         return EXIT_ANNIVERSARY_FETCH_FAILED
 
 
-def generate_language_app(config: Config, generator: ClaudeWebAppGenerator,
-                          selector: AnniversarySelector, file_manager: FileManager,
-                          target_date: date, language: Language):
+def promote_staged_apps(config: Config, file_manager: FileManager, target_date: date,
+                        languages: list) -> dict:
+    """Promote apps staged by --pregenerate into the docs tree.
+
+    Args:
+        config: Application configuration
+        file_manager: File manager
+        target_date: Date being published
+        languages: Languages to promote
+
+    Returns:
+        Mapping of language to promoted anniversary (None where nothing
+        usable was staged)
+    """
+    promoted = {}
+    job_store_path = config.STAGING_DIR / JOB_STORE_FILE
+    if not job_store_path.exists():
+        return promoted
+
+    job_store = JobStore(job_store_path)
+    staging = CheckpointStore(config.STAGING_DIR, resume=True)
+    for language in languages:
+        try:
+            promoted[language] = promote_staged_app(
+                job_store, staging, file_manager, target_date, language,
+                partial(fetch_anniversaries, config)
+            )
+        except Exception as e:
+            logger.error(f"Failed to promote staged {language.value} app: {e}", exc_info=True)
+            promoted[language] = None
+    return promoted
+
+
+def run_pregenerate_mode(config: Config, days: int, concurrency: int) -> int:
+    """Generate apps for upcoming days into the staging area.
+
+    Args:
+        config: Application configuration
+        days: Number of days ahead to stage, starting tomorrow
+        concurrency: Maximum number of (date, language) jobs in flight
+
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
+    logger.info("=" * 60)
+    logger.info(f"AADD Pre-generation for the next {days} days")
+    logger.info("=" * 60)
+
+    try:
+        runtime = Runtime(config)
+        job_store = JobStore(config.STAGING_DIR / JOB_STORE_FILE)
+        staging = CheckpointStore(config.STAGING_DIR, resume=True)
+
+        jobs = plan_pregeneration(
+            job_store, config.DOCS_DIR, date.today() + timedelta(days=1), days,
+            config.LANGUAGES, config.MAX_RETRIES
+        )
+
+        # Stage only: no file manager, so generation stops before saving to docs/
+        stage = partial(
+            generate_language_app, config, runtime.generator, runtime.selector, None,
+            checkpoints=staging
+        )
+        results = run_backfill(jobs, make_stage_worker(job_store, staging, stage), concurrency)
+    except Exception as e:
+        logger.critical(f"Unexpected error in pre-generation: {e}", exc_info=True)
+        return EXIT_APP_GENERATION_FAILED
+
+    failed = [job for job, ann in results.items() if not ann]
+    logger.info(f"Staged {len(results) - len(failed)} apps, {len(failed)} failed")
+    retry_budget().log_stats()
+    return EXIT_APP_GENERATION_FAILED if failed else EXIT_SUCCESS
+
+
+def run_daemon_mode(config: Config, async_mode: bool = False) -> int:
+    """Run the long-lived daemon with warm clients.
+
+    Args:
+        config: Application configuration
+        async_mode: Generate the languages concurrently on each run
+
+    Returns:
+        Exit code of the last run
+    """
+    def run(runtime: Runtime) -> int:
+        # Resume so a failed scheduled run can be retried without re-paying
+        checkpoints = CheckpointStore(runtime.config.RUNS_DIR, resume=True)
+        deadline = Deadline(runtime.config.RUN_BUDGET_SECONDS)
+        start_retry_budget(runtime.config.RETRY_BUDGET_RATIO, runtime.config.RETRY_BUDGET_MIN)
+        return run_daily(runtime, date.today(), async_mode, checkpoints, deadline)
+
+    try:
+        daemon = Daemon(config, config.PROJECT_ROOT / ".env", Runtime, run,
+                        on_reload=reset_shared_state)
+        return daemon.serve_forever()
+    except Exception as e:
+        logger.critical(f"Daemon failed: {e}", exc_info=True)
+        return EXIT_ANNIVERSARY_FETCH_FAILED
+
+
+def run_serve_mode(config: Config) -> int:
+    """Run the local HTTP preview service until interrupted.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Exit code
+    """
+    try:
+        runtime = Runtime(config)
+    except Exception as e:
+        logger.critical(f"Failed to initialize: {e}", exc_info=True)
+        return EXIT_APP_GENERATION_FAILED
+
+    def generate(target_date: date, language: Language, style: str, cache: CheckpointStore):
+        # Generate into the cache only: previews are never saved to docs/
+        return generate_language_app(
+            config, runtime.generator, runtime.selector, None, target_date, language,
+            checkpoints=cache, style=style
+        )
+
+    service = GenerationService(
+        config.CACHE_DIR, generate,
+        config.SERVICE_MAX_CONCURRENCY, config.SERVICE_MAX_QUEUE
+    )
+    try:
+        server = PreviewServer(config.SERVICE_PORT, service)
+    except OSError as e:
+        logger.critical(f"Could not bind preview service to port {config.SERVICE_PORT}: {e}")
+        return EXIT_APP_GENERATION_FAILED
+
+    logger.info(f"Preview service listening on http://127.0.0.1:{config.SERVICE_PORT}/apps/<lang>/<date>/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Preview service interrupted")
+    finally:
+        server.server_close()
+    return EXIT_SUCCESS
+
+
+def run_multisite_mode(config: Config, sites_file: Path, async_mode: bool = False,
+                       concurrency: int = 2, resume: bool = False) -> int:
+    """Run the daily generation for several sites in one process.
+
+    Sites share the fetchers (so each source is fetched and parsed once per
+    date) and the Anthropic clients (async ones per site thread's event
+    loop); file, index and git managers stay per site, and sites in the
+    same repository publish one at a time.
+
+    Args:
+        config: Base application configuration
+        sites_file: JSON file listing the sites
+        async_mode: Generate each site's languages concurrently
+        concurrency: Maximum number of sites in flight
+        resume: Resume each site from its checkpoints
+
+    Returns:
+        Exit code (0 if every site succeeded, otherwise the first failure's code)
+    """
+    try:
+        sites = load_sites(sites_file, config)
+        for site in sites:
+            site.config.ensure_directories()
+    except (OSError, ValueError) as e:
+        logger.critical(f"Failed to load sites from {sites_file}: {e}")
+        return EXIT_ANNIVERSARY_FETCH_FAILED
+
+    try:
+        runtimes = {}
+        for site in sites:
+            shared = next(iter(runtimes.values()), None)
+            runtimes[site.name] = Runtime(site.config, shared)
+    except Exception as e:
+        logger.critical(f"Failed to initialize: {e}", exc_info=True)
+        return EXIT_APP_GENERATION_FAILED
+
+    def run_site(site: Site) -> int:
+        checkpoints = CheckpointStore(site.config.RUNS_DIR, resume=resume)
+        deadline = Deadline(site.config.RUN_BUDGET_SECONDS)
+        return run_daily(runtimes[site.name], date.today(), async_mode, checkpoints, deadline)
+
+    results = run_sites(sites, run_site, concurrency)
+    return next((code for code in results.values() if code != EXIT_SUCCESS), EXIT_SUCCESS)
+
+
+def run_control_command(config: Config, command: str) -> int:
+    """Send a command to a running daemon and print its reply.
+
+    Args:
+        config: Application configuration
+        command: Control command
+
+    Returns:
+        Exit code (0 if the daemon accepted the command)
+    """
+    try:
+        reply = send_command(config.DAEMON_CONTROL_PORT, command)
+    except OSError as e:
+        print(f"ERROR: Could not reach the AADD daemon on port {config.DAEMON_CONTROL_PORT}: {e}")
+        return EXIT_ANNIVERSARY_FETCH_FAILED
+
+    print(json.dumps(reply, indent=2))
+    return EXIT_SUCCESS if reply.get("ok") else EXIT_ANNIVERSARY_FETCH_FAILED
+
+
+def run_backfill_mode(config: Config, start: date, end: date, concurrency: int,
+                      checkpoints: CheckpointStore = None) -> int:
+    """Generate missing apps for a date range, then publish once.
+
+    Args:
+        config: Application configuration
+        start: First date of the range
+        end: Last date of the range
+        concurrency: Maximum number of (date, language) jobs in flight
+        checkpoints: Stage checkpoint store (optional)
+
+    Returns:
+        Exit code (0 only if every job succeeded and publishing did; apps
+        that were generated are published even if other jobs failed)
+    """
+    logger.info("=" * 60)
+    logger.info(f"AADD Backfill {start.isoformat()} - {end.isoformat()}")
+    logger.info("=" * 60)
+
+    try:
+        runtime = Runtime(config)
+
+        jobs = plan_backfill(
+            config.DOCS_DIR, start, end, config.LANGUAGES
+        )
+        if not jobs:
+            logger.info("Nothing to backfill")
+            return EXIT_SUCCESS
+
+        worker = partial(
+            generate_language_app, config, runtime.generator, runtime.selector,
+            runtime.file_manager, checkpoints=checkpoints
+        )
+        results = run_backfill(jobs, worker, concurrency)
+    except Exception as e:
+        logger.critical(f"Unexpected error in backfill: {e}", exc_info=True)
+        return EXIT_ANNIVERSARY_FETCH_FAILED
+
+    generated = [ann for ann in results.values() if ann]
+    failed = [job for job, ann in results.items() if not ann]
+    logger.info(f"Backfill generated {len(generated)} apps, {len(failed)} failed")
+    retry_budget().log_stats()
+    for target_date, language in sorted(failed, key=lambda job: (job[0], job[1].value)):
+        logger.warning(f"Backfill failed for {target_date.isoformat()} ({language.value})")
+
+    if not generated:
+        return EXIT_APP_GENERATION_FAILED
+
+    # Indexes and git once for the whole range instead of once per date
+    exit_code = publish(runtime, generated)
+    if exit_code == EXIT_SUCCESS and failed:
+        return EXIT_APP_GENERATION_FAILED
+    return exit_code
+
+
+def publish(runtime: Runtime, anniversaries: list) -> int:
+    """Update index pages, then commit and push the docs tree.
+
+    Runs under the repository's repo_lock(), so sites sharing a repository
+    never stage into each other's commits.
+
+    Args:
+        runtime: Clients and managers to use
+        anniversaries: Anniversaries for the commit message
+            (git operations are skipped if empty)
+
+    Returns:
+        Exit code (EXIT_SUCCESS on success)
+    """
+    with repo_lock(runtime.config.PROJECT_ROOT):
+        return _publish(runtime, anniversaries)
+
+
+def _publish(runtime: Runtime, anniversaries: list) -> int:
+    """publish() without the repository lock."""
+    config = runtime.config
+    file_manager = runtime.file_manager
+
+    # Step 5: Update index pages
+    logger.info("=" * 60)
+    logger.info("Updating index pages...")
+    logger.info("=" * 60)
+    try:
+        apps_ja = file_manager.get_all_apps(Language.JAPANESE)
+        apps_en = file_manager.get_all_apps(Language.ENGLISH)
+        index_generator = IndexGenerator(
+            config.DOCS_DIR,
+            config.DATA_DIR / "templates"
+        )
+        index_generator.update_all_indexes(apps_ja, apps_en)
+        logger.info(f"Updated indexes (ja: {len(apps_ja)}, en: {len(apps_en)})")
+    except Exception as e:
+        logger.error(f"Failed to update indexes: {e}", exc_info=True)
+        return EXIT_FILE_OPERATIONS_FAILED
+
+    # Step 6: Git commit and push
+    logger.info("=" * 60)
+    logger.info("Committing and pushing to Git...")
+    logger.info("=" * 60)
+
+    # Check if we have any anniversary to use for commit message
+    if not anniversaries:
+        logger.warning("No anniversary generated, skipping git operations")
+        return EXIT_SUCCESS
+
+    try:
+        success = runtime.git_manager.commit_and_push_batch(anniversaries)
+        if not success:
+            logger.error("Git operations failed")
+            return EXIT_GIT_OPERATIONS_FAILED
+        logger.info("Git operations completed successfully")
+    except Exception as e:
+        logger.error(f"Git operations failed: {e}", exc_info=True)
+        return EXIT_GIT_OPERATIONS_FAILED
+
+    return EXIT_SUCCESS
+
+
+def generate_language_app(config: Config, generator: "ClaudeWebAppGenerator",
+                          selector: "AnniversarySelector", file_manager: FileManager,
+                          target_date: date, language: Language,
+                          checkpoints: CheckpointStore = None, style: str = None,
+                          deadline: Deadline = None):
     """Generate app for a specific language.
 
+    When a checkpoint store is given, each stage's output is persisted and
+    stages already completed by a previous run are loaded instead of re-run.
+
     Args:
         config: Application configuration
         generator: Claude web app generator
-        file_manager: File manager
+        selector: Anniversary selector
+        file_manager: File manager (None to stop after generation, e.g. when staging)
         target_date: Target date
         language: Language to generate
+        checkpoints: Stage checkpoint store (optional)
+        style: Style direction for the generated app (random if not specified)
+        deadline: Run budget; stages degrade when it runs low (optional)
 
     Returns:
         Selected anniversary (or None if failed)
     """
+    checkpoint = checkpoints.job(target_date, language) if checkpoints else None
+
     logger.info(f"Step 1: Fetching {language.value} anniversaries...")
     logger.info(f"Target date: {target_date.strftime('%B %d, %Y')}")
 
-    try:
-        anniversaries = fetch_anniversaries(config, target_date, language)
-        if not anniversaries:
-            logger.error(f"No {language.value} anniversaries found")
+    anniversaries = checkpoint.load_anniversaries() if checkpoint else None
+    if anniversaries:
+        logger.info(f"Resumed {len(anniversaries)} {language.value} anniversaries from checkpoint")
+    else:
+        try:
+            anniversaries = fetch_anniversaries(config, target_date, language, deadline)
+            if not anniversaries:
+                logger.error(f"No {language.value} anniversaries found")
+                return None
+        except Exception as e:
+            logger.error(f"Failed to fetch {language.value} anniversaries: {e}", exc_info=True)
             return None
-    except Exception as e:
-        logger.error(f"Failed to fetch {language.value} anniversaries: {e}", exc_info=True)
-        return None
+        if checkpoint:
+            checkpoint.save_anniversaries(anniversaries)
 
     logger.info(f"Step 2: Using AI to select best {language.value} anniversary...")
+    selected = _resume_selection(checkpoint, anniversaries)
+    if selected:
+        logger.info(f"Resumed selection from checkpoint: {selected}")
+    else:
+        try:
+            selected = selector.select_best_anniversary(anniversaries, language, deadline)
+            logger.info(f"AI selected: {selected}")
+        except Exception as e:
+            logger.error(f"Failed to select {language.value} anniversary: {e}", exc_info=True)
+            return None
+        if checkpoint:
+            checkpoint.save_selection(anniversaries.index(selected))
+
+    logger.info(f"Step 3: Generating {language.value} web app...")
+    app = _resume_app(checkpoint, generator, selected, language)
+    if app is None:
+        try:
+            enricher = get_context_enricher(config, language)
+            facts = enricher.facts(selected, deadline) if enricher else None
+            content = generator.request_content(selected, language, style, deadline, facts)
+            if checkpoint:
+                checkpoint.save_response(*content)
+            app = generator.build_app(*content, selected, language)
+            logger.info(f"Generated app: {app.metadata.get('app_title', 'Untitled')}")
+        except Exception as e:
+            logger.error(f"Failed to generate {language.value} app: {e}", exc_info=True)
+            return None
+        if checkpoint:
+            checkpoint.save_app(app)
+
+    if file_manager is None:
+        return selected
+
+    logger.info(f"Step 4: Saving {language.value} app files...")
+    if checkpoint and checkpoint.is_saved():
+        logger.info(f"{language.value} app already saved by a previous run")
+        return selected
     try:
-        selected = selector.select_best_anniversary(anniversaries, language)
-        logger.info(f"AI selected: {selected}")
+        app_dir = file_manager.save_app(app, target_date)
+        logger.info(f"Saved {language.value} app to: {app_dir}")
     except Exception as e:
-        logger.error(f"Failed to select {language.value} anniversary: {e}", exc_info=True)
+        logger.error(f"Failed to save {language.value} app: {e}", exc_info=True)
         return None
+    if checkpoint:
+        checkpoint.mark_saved(app_dir)
 
-    logger.info(f"Step 3: Generating {language.value} web app...")
+    return selected
+
+
+def _resume_selection(checkpoint, anniversaries: list):
+    """Load a checkpointed selection.
+
+    Args:
+        checkpoint: JobCheckpoint or None
+        anniversaries: Candidate anniversaries the selection indexes into
+
+    Returns:
+        Selected anniversary, or None if there is no usable checkpoint
+    """
+    if not checkpoint:
+        return None
+    index = checkpoint.load_selection()
+    if index is None or not 0 <= index < len(anniversaries):
+        return None
+    return anniversaries[index]
+
+
+def _resume_app(checkpoint, generator: "ClaudeWebAppGenerator", selected, language: Language):
+    """Load a checkpointed app, rebuilding it from a saved raw response if needed.
+
+    Args:
+        checkpoint: JobCheckpoint or None
+        generator: Claude web app generator (used to parse a saved response)
+        selected: Selected anniversary
+        language: Language of the app
+
+    Returns:
+        GeneratedApp, or None if generation has to run
+    """
+    if not checkpoint:
+        return None
+
+    app = checkpoint.load_app()
+    if app:
+        logger.info(f"Resumed generated {language.value} app from checkpoint")
+        return app
+
+    content = checkpoint.load_response()
+    if not content:
+        return None
     try:
-        app = generator.generate_app(selected, language)
-        logger.info(f"Generated app: {app.metadata.get('app_title', 'Untitled')}")
-    except Exception as e:
-        logger.error(f"Failed to generate {language.value} app: {e}", exc_info=True)
+        app = generator.build_app(*content, selected, language)
+    except ValueError as e:
+        logger.warning(f"Checkpointed {language.value} response is unusable ({e}), regenerating")
         return None
 
+    logger.info(f"Rebuilt {language.value} app from checkpointed response")
+    checkpoint.save_app(app)
+    return app
+
+
+async def generate_language_apps_async(config: Config, generator: "ClaudeWebAppGenerator",
+                                      selector: "AnniversarySelector", file_manager: FileManager,
+                                      target_date: date, languages: list,
+                                      checkpoints: CheckpointStore = None,
+                                      deadline: Deadline = None) -> list:
+    """Run fetch -> select -> generate -> save for several languages concurrently.
+
+    Args:
+        config: Application configuration
+        generator: Claude web app generator
+        selector: Anniversary selector
+        file_manager: File manager
+        target_date: Target date
+        languages: Languages to generate
+        checkpoints: Stage checkpoint store (optional)
+        deadline: Run budget shared by the languages (optional)
+
+    Returns:
+        Selected anniversaries (None for failed languages), in language order
+    """
+    try:
+        return await asyncio.gather(*(
+            generate_language_app_async(
+                config, generator, selector, file_manager, target_date, language,
+                checkpoints, deadline
+            )
+            for language in languages
+        ))
+    finally:
+        # The async connection pools belong to this event loop
+        await get_http_transport(config).aclose()
+        await generator.async_clients.aclose()
+        await selector.async_clients.aclose()
+
+
+async def generate_language_app_async(config: Config, generator: "ClaudeWebAppGenerator",
+                                       selector: "AnniversarySelector", file_manager: FileManager,
+                                       target_date: date, language: Language,
+                                       checkpoints: CheckpointStore = None,
+                                       deadline: Deadline = None):
+    """Async variant of generate_language_app.
+
+    Args:
+        config: Application configuration
+        generator: Claude web app generator
+        selector: Anniversary selector
+        file_manager: File manager (None to stop after generation, e.g. when staging)
+        target_date: Target date
+        language: Language to generate
+        checkpoints: Stage checkpoint store (optional)
+        deadline: Run budget; stages degrade when it runs low (optional)
+
+    Returns:
+        Selected anniversary (or None if failed)
+    """
+    checkpoint = checkpoints.job(target_date, language) if checkpoints else None
+
+    logger.info(f"Step 1: Fetching {language.value} anniversaries...")
+
+    anniversaries = checkpoint.load_anniversaries() if checkpoint else None
+    if anniversaries:
+        logger.info(f"Resumed {len(anniversaries)} {language.value} anniversaries from checkpoint")
+    else:
+        try:
+            manager = build_fetcher_manager(config, language)
+            anniversaries = await manager.fetch_anniversaries_async(target_date, deadline)
+            if not anniversaries:
+                logger.error(f"No {language.value} anniversaries found")
+                return None
+        except Exception as e:
+            logger.error(f"Failed to fetch {language.value} anniversaries: {e}", exc_info=True)
+            return None
+        if checkpoint:
+            checkpoint.save_anniversaries(anniversaries)
+
+    logger.info(f"Step 2: Using AI to select best {language.value} anniversary...")
+    selected = _resume_selection(checkpoint, anniversaries)
+    if selected:
+        logger.info(f"Resumed selection from checkpoint: {selected}")
+    else:
+        try:
+            selected = await selector.select_best_anniversary_async(
+                anniversaries, language, deadline
+            )
+            logger.info(f"AI selected: {selected}")
+        except Exception as e:
+            logger.error(f"Failed to select {language.value} anniversary: {e}", exc_info=True)
+            return None
+        if checkpoint:
+            checkpoint.save_selection(anniversaries.index(selected))
+
+    logger.info(f"Step 3: Generating {language.value} web app...")
+    app = _resume_app(checkpoint, generator, selected, language)
+    if app is None:
+        try:
+            enricher = get_context_enricher(config, language)
+            facts = await enricher.facts_async(selected, deadline) if enricher else None
+            content = await generator.request_content_async(
+                selected, language, deadline=deadline, facts=facts
+            )
+            if checkpoint:
+                checkpoint.save_response(*content)
+            app = generator.build_app(*content, selected, language)
+            logger.info(f"Generated app: {app.metadata.get('app_title', 'Untitled')}")
+        except Exception as e:
+            logger.error(f"Failed to generate {language.value} app: {e}", exc_info=True)
+            return None
+        if checkpoint:
+            checkpoint.save_app(app)
+
+    if file_manager is None:
+        return selected
+
     logger.info(f"Step 4: Saving {language.value} app files...")
+    if checkpoint and checkpoint.is_saved():
+        logger.info(f"{language.value} app already saved by a previous run")
+        return selected
     try:
-        app_dir = file_manager.save_app(app, target_date)
+        app_dir = await asyncio.to_thread(file_manager.save_app, app, target_date)
         logger.info(f"Saved {language.value} app to: {app_dir}")
     except Exception as e:
         logger.error(f"Failed to save {language.value} app: {e}", exc_info=True)
         return None
+    if checkpoint:
+        checkpoint.mark_saved(app_dir)
 
     return selected
 
 
-def fetch_anniversaries(config: Config, target_date: date, language: Language):
+def build_wikipedia_fetcher(config: Config, language: Language, streaming: bool = None,
+                            transport: "HttpTransport" = None) -> BaseFetcher:
+    """Build the live Wikipedia fetcher for a language.
+
+    Args:
+        config: Application configuration
+        language: Language to fetch
+        streaming: Stop each download once the section lists are read
+            (defaults to config.WIKIPEDIA_STREAMING; day pages only)
+        transport: Connection pools to use (defaults to get_http_transport())
+
+    Returns:
+        Day page or on-this-day feed fetcher (per config.WIKIPEDIA_SOURCE)
+        using the on-disk HTTP cache (if enabled), the shared transport and
+        the wikipedia.<lang> rate limit
+    """
+    from fetchers.wikipedia_fetcher import WikipediaFetcher
+    from fetchers.wikipedia_ja_fetcher import WikipediaJaFetcher
+    from fetchers.onthisday_fetcher import OnThisDayFetcher
+    from utils.http_cache import HttpCache
+
+    http_cache = None
+    if config.HTTP_CACHE_MAX_MB > 0:
+        http_cache = HttpCache(
+            config.CACHE_DIR / "http",
+            max_bytes=config.HTTP_CACHE_MAX_MB * 1024 * 1024,
+            max_stale=config.HTTP_CACHE_MAX_STALE_HOURS * 3600,
+        )
+
+    transport = transport or get_http_transport(config)
+    rate_limiter = get_rate_limiter(config)
+    if config.WIKIPEDIA_SOURCE == "rest":
+        return OnThisDayFetcher(language, http_cache=http_cache, transport=transport,
+                                rate_limiter=rate_limiter)
+
+    if streaming is None:
+        streaming = config.WIKIPEDIA_STREAMING
+
+    fetcher_class = WikipediaJaFetcher if language == Language.JAPANESE else WikipediaFetcher
+    return fetcher_class(http_cache, streaming=streaming, sections=config.WIKIPEDIA_SECTIONS,
+                         transport=transport, rate_limiter=rate_limiter)
+
+
+def build_fetchers(config: Config, language: Language) -> list:
+    """Build the ordered fetcher list for a language.
+
+    Fetchers are shared process-wide by source rather than by site: one
+    cached Wikipedia fetcher per language and set of Wikipedia settings
+    (source, sections, streaming, HTTP cache) and one FallbackFetcher per
+    data file, so several sites (or daemon runs) fetch and parse each
+    source once.
+    All Wikipedia fetchers send their requests through one HttpTransport.
+    The offline corpus goes ahead of or behind Wikipedia per CORPUS_MODE,
+    and a local Wikipedia dump (WIKIPEDIA_DUMP_DIR), if there is one for
+    the language, goes first.
+
+    Args:
+        config: Application configuration
+        language: Language to fetch
+
+    Returns:
+        List of fetchers, primary source first
+    """
+    fallback_file = config.DATA_DIR / f"fallback_anniversaries_{language.value}.json"
+    from fetchers.dump_fetcher import WikipediaDumpFetcher, find_dump
+
+    corpus_path = corpus_file(config.DATA_DIR, language)
+    dump = find_dump(config.WIKIPEDIA_DUMP_DIR, language) if config.WIKIPEDIA_DUMP_DIR else None
+    transport = get_http_transport(config)
+    sections = tuple(config.WIKIPEDIA_SECTIONS)
+    dump_key = (dump[0], sections) if dump else None
+    # Everything build_wikipedia_fetcher() reads, so sites with other settings get their own
+    wikipedia_key = (language, config.WIKIPEDIA_SOURCE, sections, config.WIKIPEDIA_STREAMING,
+                     config.CACHE_DIR, config.HTTP_CACHE_MAX_MB, config.HTTP_CACHE_MAX_STALE_HOURS)
+    with _fetchers_lock:
+        if dump and dump_key not in _fetchers:
+            _fetchers[dump_key] = WikipediaDumpFetcher(
+                language, dump[0], dump_index_file(config, dump[0]), sections=config.WIKIPEDIA_SECTIONS
+            )
+        if wikipedia_key not in _fetchers:
+            _fetchers[wikipedia_key] = CachingFetcher(build_wikipedia_fetcher(config, language,
+                                                                              transport=transport))
+        if corpus_path not in _fetchers:
+            _fetchers[corpus_path] = OfflineCorpusFetcher(corpus_path)
+        if fallback_file not in _fetchers:
+            _fetchers[fallback_file] = FallbackFetcher(
+                fallback_file, index_file=fallback_index_file(config, language), language=language
+            )
+
+        fetchers = [_fetchers[wikipedia_key]]
+        if config.CORPUS_MODE == "first":
+            fetchers.insert(0, _fetchers[corpus_path])
+        elif config.CORPUS_MODE == "last":
+            fetchers.append(_fetchers[corpus_path])
+        if dump:
+            fetchers.insert(0, _fetchers[dump_key])
+        return fetchers + [_fetchers[fallback_file]]
+
+
+def dump_index_file(config: Config, dump_file: Path) -> Path:
+    """Offset index of a Wikipedia dump (written by build_dump_index.py).
+
+    Args:
+        config: Application configuration
+        dump_file: Multistream dump
+
+    Returns:
+        Path of the index file
+    """
+    return config.CACHE_DIR / DUMP_INDEX_DIR / f"{dump_file.name}.index.json"
+
+
+def fallback_index_file(config: Config, language: Language) -> Path:
+    """Compiled SQLite index of a language's fallback JSON.
+
+    Args:
+        config: Application configuration
+        language: Language of the fallback data
+
+    Returns:
+        Path of the index file (created on first use)
+    """
+    return config.CACHE_DIR / FALLBACK_INDEX_DIR / f"fallback_anniversaries_{language.value}.sqlite3"
+
+
+def build_fetcher_manager(config: Config, language: Language) -> FetcherManager:
+    """Build the fetcher manager for a language.
+
+    With FETCH_MODE=merge every source is fetched and the results are
+    merged; otherwise sources are raced when FETCH_HEDGE_SECONDS is set,
+    and tried one after another if not. Remote sources get circuit
+    breakers unless BREAKER_FAILURES is 0, and every source's
+    anniversaries go through build_candidate_pipeline().
+
+    Args:
+        config: Application configuration
+        language: Language to fetch
+
+    Returns:
+        FetcherManager over build_fetchers()
+    """
+    hedge_delay = config.FETCH_HEDGE_SECONDS if config.FETCH_HEDGE_SECONDS > 0 else None
+    return FetcherManager(build_fetchers(config, language), hedge_delay=hedge_delay,
+                          max_seconds=config.FETCH_MAX_SECONDS,
+                          breakers=get_breaker_store(config),
+                          merge=config.FETCH_MODE == "merge",
+                          pipeline=build_candidate_pipeline(config, language))
+
+
+def build_candidate_pipeline(config: Config, language: Language,
+                             shortlist: bool = True) -> "CandidatePipeline":
+    """Build the candidate pipeline every source's anniversaries pass through.
+
+    Args:
+        config: Application configuration
+        language: Language of the candidates
+        shortlist: Whether to rank and cut to CANDIDATE_SHORTLIST (off for
+            stored data such as the corpus)
+
+    Returns:
+        CandidatePipeline
+    """
+    from fetchers.candidates import candidate_pipeline
+
+    return candidate_pipeline(language, config.WIKIPEDIA_SECTIONS,
+                              per_section_limit=config.CANDIDATES_PER_SECTION,
+                              shortlist_size=config.CANDIDATE_SHORTLIST if shortlist else 0)
+
+
+def get_breaker_store(config: Config) -> Optional[BreakerStore]:
+    """Process-wide circuit breaker store, persisted in CACHE_DIR.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        BreakerStore, or None if BREAKER_FAILURES is 0
+    """
+    global _breaker_store
+
+    if config.BREAKER_FAILURES <= 0:
+        return None
+
+    with _fetchers_lock:
+        if _breaker_store is None:
+            _breaker_store = BreakerStore(
+                config.CACHE_DIR / BREAKER_STATE_FILE,
+                failure_threshold=config.BREAKER_FAILURES,
+                cooldown=config.BREAKER_COOLDOWN_SECONDS,
+            )
+        return _breaker_store
+
+
+def get_http_transport(config: Config) -> "HttpTransport":
+    """Process-wide HTTP transport, sized by the HTTP_* settings.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        HttpTransport (clients are created on first request)
+    """
+    global _http_transport
+    from utils.http_transport import HttpTransport
+
+    with _shared_lock:
+        if _http_transport is None:
+            _http_transport = HttpTransport(
+                pool_connections=config.HTTP_POOL_HOSTS,
+                max_per_host=config.HTTP_MAX_PER_HOST,
+                user_agent=config.HTTP_USER_AGENT,
+            )
+        return _http_transport
+
+
+def get_rate_limiter(config: Config) -> "RateLimiter":
+    """Process-wide rate limiter with the buckets set by the rate limit settings.
+
+    Buckets: wikipedia.<lang> per edition, anthropic.requests and
+    anthropic.output_tokens. A setting of 0 leaves its bucket unlimited.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        RateLimiter
+    """
+    global _rate_limiter
+    from utils.rate_limit import (
+        RateLimiter, WIKIPEDIA_BUCKET, ANTHROPIC_REQUESTS, ANTHROPIC_OUTPUT_TOKENS
+    )
+
+    with _shared_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+            for language in Language:
+                _rate_limiter.configure(WIKIPEDIA_BUCKET.format(lang=language.value),
+                                        config.WIKIPEDIA_REQUESTS_PER_SECOND)
+            # Per-minute limits refill continuously; a full minute may be used at once
+            _rate_limiter.configure(ANTHROPIC_REQUESTS, config.ANTHROPIC_REQUESTS_PER_MINUTE / 60,
+                                    capacity=config.ANTHROPIC_REQUESTS_PER_MINUTE)
+            _rate_limiter.configure(ANTHROPIC_OUTPUT_TOKENS,
+                                    config.ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE / 60,
+                                    capacity=config.ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE)
+        return _rate_limiter
+
+
+def get_context_enricher(config: Config, language: Language) -> Optional["ContextEnricher"]:
+    """Process-wide context enricher for a language, sized by the ENRICHMENT_* settings.
+
+    The summary cache is shared by all languages and pruned of expired
+    summaries when the first enricher is built.
+
+    Args:
+        config: Application configuration
+        language: Wikipedia edition to read summaries from
+
+    Returns:
+        ContextEnricher, or None if enrichment is disabled
+    """
+    global _summary_cache
+    if config.ENRICHMENT_PAGES <= 0:
+        return None
+    from generators.context_enricher import ContextEnricher
+    from utils.summary_cache import SummaryCache
+
+    transport = get_http_transport(config)
+    rate_limiter = get_rate_limiter(config)
+    with _shared_lock:
+        if _summary_cache is None:
+            _summary_cache = SummaryCache(config.CACHE_DIR / SUMMARY_CACHE_DIR,
+                                          ttl=config.SUMMARY_CACHE_TTL_HOURS * 3600)
+            _summary_cache.prune()
+        if language not in _context_enrichers:
+            _context_enrichers[language] = ContextEnricher(
+                language, _summary_cache, transport, rate_limiter,
+                max_pages=config.ENRICHMENT_PAGES, max_seconds=config.ENRICHMENT_SECONDS,
+            )
+        return _context_enrichers[language]
+
+
+def reset_shared_state() -> None:
+    """Drop the process-wide fetchers, breakers, pools, rate limits and enrichers.
+
+    They are built from the configuration of their first caller, so the
+    daemon calls this on reload; the next run builds them again from the
+    new configuration. Callers still holding the old objects keep working.
+    """
+    global _breaker_store, _http_transport, _rate_limiter, _summary_cache
+
+    with _fetchers_lock:
+        _fetchers.clear()
+        _breaker_store = None
+    with _shared_lock:
+        _http_transport = None
+        _rate_limiter = None
+        _summary_cache = None
+        _context_enrichers.clear()
+
+
+def fetch_anniversaries(config: Config, target_date: date, language: Language,
+                        deadline: Deadline = None):
     """Fetch anniversaries with fallback strategy for a specific language.
 
     Args:
         config: Application configuration
         target_date: Date to fetch anniversaries for
         language: Language to fetch
+        deadline: Run budget; when low, only local fetchers are tried (optional)
 
     Returns:
         List of Anniversary objects
@@ -191,23 +1271,11 @@ def fetch_anniversaries(config: Config, target_date: date, language: Language):
     Raises:
         Exception: If all fetchers fail
     """
-    # Create fetchers based on language
-    if language == Language.JAPANESE:
-        fetchers = [
-            WikipediaJaFetcher(),
-            FallbackFetcher(config.DATA_DIR / "fallback_anniversaries_ja.json")
-        ]
-    else:
-        fetchers = [
-            WikipediaFetcher(),
-            FallbackFetcher(config.DATA_DIR / "fallback_anniversaries_en.json")
-        ]
-
     # Create fetcher manager
-    manager = FetcherManager(fetchers)
+    manager = build_fetcher_manager(config, language)
 
     # Fetch anniversaries
-    return manager.fetch_anniversaries(target_date)
+    return manager.fetch_anniversaries(target_date, deadline)
 
 
 if __name__ == "__main__":
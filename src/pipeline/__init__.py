@@ -0,0 +1 @@
+# Batch and long-running pipeline modes
@@ -0,0 +1,115 @@
+"""Date-range backfill with bounded concurrency across dates and languages."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import Language
+from fetchers.base_fetcher import Anniversary
+
+logger = logging.getLogger("AADD")
+
+# A backfill job is one (date, language) pair
+BackfillJob = Tuple[date, Language]
+
+
+def iter_dates(start: date, end: date):
+    """Yield every date from start to end, inclusive.
+
+    Args:
+        start: First date
+        end: Last date
+
+    Yields:
+        Dates in ascending order
+    """
+    current = start
+    while current <= end:
+        yield current
+        current += timedelta(days=1)
+
+
+def app_exists(docs_root: Path, target_date: date, language: Language) -> bool:
+    """Check whether an app has already been published for a date.
+
+    Args:
+        docs_root: Root directory for published docs
+        target_date: Date of the app
+        language: Language of the app
+
+    Returns:
+        True if docs/LANG/YYYY/MM-DD/metadata.json exists
+    """
+    app_dir = docs_root / language.value / str(target_date.year) / target_date.strftime("%m-%d")
+    return (app_dir / "metadata.json").exists()
+
+
+def plan_backfill(docs_root: Path, start: date, end: date,
+                  languages: List[Language]) -> List[BackfillJob]:
+    """List the (date, language) jobs needed to fill gaps in a date range.
+
+    Args:
+        docs_root: Root directory for published docs
+        start: First date of the range
+        end: Last date of the range
+        languages: Languages to backfill
+
+    Returns:
+        Jobs for dates that have no metadata.json yet, oldest first
+
+    Raises:
+        ValueError: If start is after end
+    """
+    if start > end:
+        raise ValueError(f"Backfill start {start} is after end {end}")
+
+    jobs = []
+    skipped = 0
+    for target_date in iter_dates(start, end):
+        for language in languages:
+            if app_exists(docs_root, target_date, language):
+                skipped += 1
+                continue
+            jobs.append((target_date, language))
+
+    logger.info(f"Backfill plan: {len(jobs)} jobs, {skipped} already published")
+    return jobs
+
+
+def run_backfill(jobs: List[BackfillJob],
+                 worker: Callable[[date, Language], Optional[Anniversary]],
+                 concurrency: int = 2) -> Dict[BackfillJob, Optional[Anniversary]]:
+    """Run backfill jobs over a bounded worker pool.
+
+    Args:
+        jobs: (date, language) jobs to run
+        worker: Callable generating and saving one app, returning the
+            selected anniversary or None on failure
+        concurrency: Maximum number of jobs in flight
+
+    Returns:
+        Mapping of job to selected anniversary (None for failed jobs)
+    """
+    results = {}
+    if not jobs:
+        return results
+
+    concurrency = max(1, concurrency)
+    logger.info(f"Running {len(jobs)} backfill jobs with concurrency {concurrency}")
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="backfill") as pool:
+        futures = {pool.submit(worker, d, lang): (d, lang) for d, lang in jobs}
+        for done, future in enumerate(as_completed(futures), start=1):
+            job = futures[future]
+            try:
+                results[job] = future.result()
+            except Exception as e:
+                logger.error(f"Backfill job {job[0]} ({job[1].value}) failed: {e}", exc_info=True)
+                results[job] = None
+
+            status = "ok" if results[job] else "failed"
+            logger.info(f"Backfill progress {done}/{len(jobs)}: {job[0]} ({job[1].value}) {status}")
+
+    return results
@@ -0,0 +1,209 @@
+"""Per-stage checkpoints so a failed run can resume without re-paying for generation."""
+
+import json
+import time
+import shutil
+import logging
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from config import Language
+from fetchers.base_fetcher import Anniversary
+from generators.generated_app import GeneratedApp
+
+logger = logging.getLogger("AADD")
+
+
+def _write_json(path: Path, data) -> None:
+    """Atomically write JSON so an interrupted run never leaves a torn checkpoint.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _read_json(path: Path):
+    """Read a JSON checkpoint file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Parsed data, or None if missing or unreadable
+    """
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+
+
+class JobCheckpoint:
+    """Stage outputs for one (date, language) job.
+
+    Stages, in order: fetched anniversaries, selected index, raw Claude
+    response, parsed app, saved app directory.
+    """
+
+    ANNIVERSARIES_FILE = "anniversaries.json"
+    SELECTION_FILE = "selection.json"
+    RESPONSE_FILE = "response.json"
+    APP_FILE = "app.json"
+    SAVED_FILE = "saved.json"
+
+    def __init__(self, job_dir: Path):
+        """Initialize job checkpoint.
+
+        Args:
+            job_dir: Directory holding this job's stage files
+        """
+        self.job_dir = Path(job_dir)
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+
+    def save_anniversaries(self, anniversaries: List[Anniversary]) -> None:
+        """Persist the fetched candidate list."""
+        _write_json(self.job_dir / self.ANNIVERSARIES_FILE, [a.to_dict() for a in anniversaries])
+
+    def load_anniversaries(self) -> Optional[List[Anniversary]]:
+        """Load the fetched candidate list, or None if not checkpointed."""
+        data = _read_json(self.job_dir / self.ANNIVERSARIES_FILE)
+        if data is None:
+            return None
+        return [Anniversary.from_dict(item) for item in data]
+
+    def save_selection(self, index: int) -> None:
+        """Persist the index of the selected candidate."""
+        _write_json(self.job_dir / self.SELECTION_FILE, {"index": index})
+
+    def load_selection(self) -> Optional[int]:
+        """Load the selected index, or None if not checkpointed."""
+        data = _read_json(self.job_dir / self.SELECTION_FILE)
+        return None if data is None else data["index"]
+
+    def save_response(self, text: str, thinking: str) -> None:
+        """Persist the raw Claude response text and thinking."""
+        _write_json(self.job_dir / self.RESPONSE_FILE, {"text": text, "thinking": thinking})
+
+    def load_response(self) -> Optional[Tuple[str, str]]:
+        """Load the raw Claude response as (text, thinking), or None."""
+        data = _read_json(self.job_dir / self.RESPONSE_FILE)
+        return None if data is None else (data["text"], data.get("thinking", ""))
+
+    def save_app(self, app: GeneratedApp) -> None:
+        """Persist the parsed, validated app."""
+        _write_json(self.job_dir / self.APP_FILE, app.to_dict())
+
+    def load_app(self) -> Optional[GeneratedApp]:
+        """Load the parsed app, or None if not checkpointed."""
+        data = _read_json(self.job_dir / self.APP_FILE)
+        return None if data is None else GeneratedApp.from_dict(data)
+
+    def mark_saved(self, app_dir: Path) -> None:
+        """Record that the app has been written to the docs tree."""
+        _write_json(self.job_dir / self.SAVED_FILE, {"app_dir": str(app_dir)})
+
+    def is_saved(self) -> bool:
+        """Check whether the app has been written to the docs tree."""
+        return (self.job_dir / self.SAVED_FILE).exists()
+
+    def clear(self) -> None:
+        """Remove all stage files for this job."""
+        for name in (self.ANNIVERSARIES_FILE, self.SELECTION_FILE, self.RESPONSE_FILE,
+                     self.APP_FILE, self.SAVED_FILE):
+            (self.job_dir / name).unlink(missing_ok=True)
+
+
+class CheckpointStore:
+    """Run directory holding per-(date, language) stage checkpoints.
+
+    Layout: RUNS_DIR/YYYY-MM-DD/LANG/<stage>.json plus a run-level
+    published.json once indexes and git have succeeded.
+    """
+
+    PUBLISHED_FILE = "published.json"
+
+    def __init__(self, runs_dir: Path, resume: bool = False):
+        """Initialize checkpoint store.
+
+        Args:
+            runs_dir: Root directory for run checkpoints
+            resume: Reuse existing checkpoints; if False, each job's
+                checkpoints are cleared the first time it is opened
+        """
+        self.runs_dir = Path(runs_dir)
+        self.resume = resume
+        self._cleared = set()  # Job directories already cleared (resume=False)
+        self._lock = threading.Lock()
+
+    def job(self, target_date: date, language: Language) -> JobCheckpoint:
+        """Open the checkpoint for a (date, language) job.
+
+        Args:
+            target_date: Date of the app
+            language: Language of the app
+
+        Returns:
+            JobCheckpoint for the job
+        """
+        checkpoint = JobCheckpoint(self._run_dir(target_date) / language.value)
+        if not self.resume:
+            with self._lock:
+                first_open = checkpoint.job_dir not in self._cleared
+                self._cleared.add(checkpoint.job_dir)
+            if first_open:
+                checkpoint.clear()
+        return checkpoint
+
+    def is_published(self, target_date: date) -> bool:
+        """Check whether indexes and git completed for a date's run."""
+        return self.resume and (self._run_dir(target_date) / self.PUBLISHED_FILE).exists()
+
+    def mark_published(self, target_date: date) -> None:
+        """Record that indexes and git completed for a date's run."""
+        run_dir = self._run_dir(target_date)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(run_dir / self.PUBLISHED_FILE, {"published_at": datetime.now().isoformat()})
+
+    def prune(self, keep_days: int = 14) -> None:
+        """Delete run directories not written to for keep_days.
+
+        Age is the last time a checkpoint of the run was written, not the
+        date the run is for, so a failed backfill of old dates keeps its
+        checkpoints for --resume.
+
+        Args:
+            keep_days: Number of days of checkpoints to keep
+        """
+        if not self.runs_dir.exists():
+            return
+
+        cutoff = time.time() - keep_days * 24 * 3600
+        for run_dir in self.runs_dir.iterdir():
+            try:
+                date.fromisoformat(run_dir.name)
+            except ValueError:
+                continue
+            if run_dir.is_dir() and self._last_written(run_dir) < cutoff:
+                shutil.rmtree(run_dir, ignore_errors=True)
+                logger.debug(f"Pruned old checkpoints: {run_dir}")
+
+    @staticmethod
+    def _last_written(run_dir: Path) -> float:
+        """Latest mtime of a run directory and its job directories (stage files are replaced in those)."""
+        try:
+            return max([run_dir.stat().st_mtime] +
+                       [job_dir.stat().st_mtime for job_dir in run_dir.iterdir() if job_dir.is_dir()])
+        except OSError:
+            return time.time()  # Being written or removed; leave it for the next prune
+
+    def _run_dir(self, target_date: date) -> Path:
+        """Directory holding all checkpoints for a date."""
+        return self.runs_dir / target_date.isoformat()
@@ -0,0 +1,92 @@
+"""Annual corpus builder: every day page of a year, fetched and parsed once."""
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import Language
+from fetchers.base_fetcher import BaseFetcher, Anniversary
+from fetchers.candidates import CandidatePipeline
+from fetchers.corpus_fetcher import load_corpus, save_corpus, encode_events
+
+logger = logging.getLogger("AADD")
+
+# A leap year, so February 29 is included
+CORPUS_YEAR = 2024
+
+
+def corpus_days(year: int = CORPUS_YEAR) -> List[date]:
+    """Every date of a year.
+
+    Args:
+        year: Year to enumerate
+
+    Returns:
+        List of dates, January 1 first
+    """
+    first = date(year, 1, 1)
+    count = (date(year + 1, 1, 1) - first).days
+    return [first + timedelta(days=offset) for offset in range(count)]
+
+
+def build_corpus(fetcher: BaseFetcher, language: Language, output_file: Path,
+                 concurrency: int = 4, days: Optional[List[date]] = None,
+                 pipeline: Optional[CandidatePipeline] = None) -> List[date]:
+    """Fetch and parse every day page and write the corpus file.
+
+    Days that fail, or are not in ``days``, keep their entry from the
+    existing corpus file (if any), so a partial rebuild never loses data.
+    The request rate is the fetcher's: its wikipedia.<lang> rate limit
+    bucket, shared with every other fetcher of the edition.
+
+    Args:
+        fetcher: Live fetcher for the language (e.g. WikipediaFetcher)
+        language: Corpus language
+        output_file: Corpus file to write
+        concurrency: Maximum requests in flight
+        days: Dates to fetch (defaults to all 366 days)
+        pipeline: Candidate pipeline each day is stored through (defaults to
+            the day as parsed)
+
+    Returns:
+        Dates that could not be fetched
+    """
+    days = days or corpus_days()
+
+    stored: Dict[str, list] = {}
+    if output_file.exists():
+        try:
+            stored = load_corpus(output_file)
+        except Exception as e:
+            logger.warning(f"Rebuilding {output_file} from scratch: {e}")
+
+    def fetch_day(target_date: date) -> Optional[List[Anniversary]]:
+        try:
+            anniversaries = fetcher.fetch(target_date)
+            return pipeline.run(anniversaries, target_date.strftime("%m-%d")) if pipeline else anniversaries
+        except Exception as e:
+            logger.warning(f"{language.value} {target_date.strftime('%m-%d')} failed: {e}")
+            return None
+
+    logger.info(f"Building {language.value} corpus: {len(days)} days, concurrency {concurrency}")
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="aadd-corpus") as pool:
+        results = list(pool.map(fetch_day, days))
+
+    # Start from the stored corpus so failed days keep their previous entry
+    corpus = dict(stored)
+    failed = []
+    for target_date, anniversaries in zip(days, results):
+        if anniversaries is None:
+            failed.append(target_date)
+        else:
+            corpus[target_date.strftime("%m-%d")] = encode_events(anniversaries)
+
+    save_corpus(output_file, language, corpus)
+    events = sum(len(day_events) for day_events in corpus.values())
+    logger.info(f"Wrote {output_file}: {len(corpus)} days, {events} events "
+                f"in {time.monotonic() - started:.1f}s ({len(failed)} days failed)")
+    return failed
@@ -0,0 +1,267 @@
+"""Long-running daemon that runs AADD on a cron schedule with warm clients."""
+
+import json
+import socket
+import logging
+import threading
+import socketserver
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from config import Config
+from utils.cron import CronSchedule
+
+logger = logging.getLogger("AADD")
+
+# Control socket commands
+COMMAND_RUN = "run"
+COMMAND_STATUS = "status"
+COMMAND_RELOAD = "reload"
+COMMAND_STOP = "stop"
+COMMANDS = (COMMAND_RUN, COMMAND_STATUS, COMMAND_RELOAD, COMMAND_STOP)
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    """Handles one line-oriented command on the control socket."""
+
+    def handle(self):
+        command = self.rfile.readline(1024).decode("utf-8", errors="replace").strip().lower()
+        reply = self.server.daemon.handle_command(command)
+        self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+
+
+class _ControlServer(socketserver.ThreadingTCPServer):
+    """Local TCP control server bound to the loopback interface."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port: int, daemon: "Daemon"):
+        super().__init__(("127.0.0.1", port), _ControlHandler)
+        self.daemon = daemon
+
+
+class Daemon:
+    """Runs a job on a cron schedule, keeping its runtime objects warm.
+
+    The runtime (API clients, fetchers, git repo...) is built once and
+    reused for every run. It is rebuilt when the .env file changes, after
+    ``on_reload`` has dropped whatever else was built from the previous
+    configuration.
+    A loopback control socket accepts "run", "status", "reload" and "stop".
+    """
+
+    ENV_POLL_SECONDS = 30  # How often to check .env for changes while idle
+
+    def __init__(self, config: Config, env_file: Path,
+                 build_runtime: Callable[[Config], Any], run: Callable[[Any], int],
+                 on_reload: Optional[Callable[[], None]] = None):
+        """Initialize daemon.
+
+        Args:
+            config: Initial configuration
+            env_file: .env file to watch for changes
+            build_runtime: Builds the warm runtime from a configuration
+            run: Runs one job with the runtime, returning an exit code
+            on_reload: Called before the runtime is rebuilt from a reloaded
+                configuration, e.g. to drop process-wide caches (optional)
+        """
+        self.config = config
+        self.env_file = Path(env_file)
+        self.build_runtime = build_runtime
+        self.run = run
+        self.on_reload = on_reload
+
+        self.runtime = build_runtime(config)
+        self.schedule = CronSchedule(config.DAEMON_SCHEDULE)
+        self._env_mtime = self._read_env_mtime()
+
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._run_requested = False
+        self._reload_requested = False
+        self._stopping = False
+        self._running = False
+
+        self.next_run = self.schedule.next_after(datetime.now())
+        self.started_at = datetime.now()
+        self.last_run_started = None
+        self.last_run_finished = None
+        self.last_exit_code = None
+        self.run_count = 0
+
+    def serve_forever(self) -> int:
+        """Run the scheduler loop until a stop command is received.
+
+        Returns:
+            Exit code of the last run (0 if no run happened)
+        """
+        server = _ControlServer(self.config.DAEMON_CONTROL_PORT, self)
+        server_thread = threading.Thread(target=server.serve_forever, name="aadd-control", daemon=True)
+        server_thread.start()
+        logger.info(
+            f"AADD daemon started (schedule: '{self.schedule.expression}', "
+            f"control: 127.0.0.1:{self.config.DAEMON_CONTROL_PORT})"
+        )
+        logger.info(f"Next scheduled run: {self.next_run.isoformat(sep=' ')}")
+
+        try:
+            while True:
+                wait = (self.next_run - datetime.now()).total_seconds()
+                self._wakeup.wait(timeout=max(0.0, min(wait, self.ENV_POLL_SECONDS)))
+                self._wakeup.clear()
+
+                with self._lock:
+                    if self._stopping:
+                        break
+                    run_requested, self._run_requested = self._run_requested, False
+                    reload_requested, self._reload_requested = self._reload_requested, False
+
+                self._reload_if_changed(force=reload_requested)
+
+                if run_requested:
+                    self._run_job("control request")
+                elif datetime.now() >= self.next_run:
+                    self._run_job("schedule")
+                    self.next_run = self.schedule.next_after(datetime.now())
+                    logger.info(f"Next scheduled run: {self.next_run.isoformat(sep=' ')}")
+        except KeyboardInterrupt:
+            logger.info("AADD daemon interrupted")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        logger.info("AADD daemon stopped")
+        return self.last_exit_code or 0
+
+    def handle_command(self, command: str) -> dict:
+        """Handle a control socket command.
+
+        Args:
+            command: One of COMMANDS
+
+        Returns:
+            JSON-serializable reply
+        """
+        if command == COMMAND_STATUS:
+            return self.status()
+
+        with self._lock:
+            if command == COMMAND_RUN:
+                if self._running or self._run_requested:
+                    return {"ok": False, "message": "A run is already in progress or queued"}
+                self._run_requested = True
+                message = "Run queued"
+            elif command == COMMAND_RELOAD:
+                self._reload_requested = True
+                message = "Reload queued"
+            elif command == COMMAND_STOP:
+                self._stopping = True
+                message = "Stopping after the current run"
+            else:
+                return {"ok": False, "message": f"Unknown command: {command!r}"}
+
+        self._wakeup.set()
+        return {"ok": True, "message": message}
+
+    def status(self) -> dict:
+        """Get daemon status.
+
+        Returns:
+            Status dictionary
+        """
+        def fmt(moment):
+            return moment.isoformat(timespec="seconds") if moment else None
+
+        return {
+            "ok": True,
+            "running": self._running,
+            "schedule": self.schedule.expression,
+            "next_run": fmt(self.next_run),
+            "started_at": fmt(self.started_at),
+            "last_run_started": fmt(self.last_run_started),
+            "last_run_finished": fmt(self.last_run_finished),
+            "last_exit_code": self.last_exit_code,
+            "run_count": self.run_count,
+        }
+
+    def _run_job(self, reason: str) -> None:
+        """Run one job with the warm runtime.
+
+        Args:
+            reason: Why the run was started (for logging)
+        """
+        logger.info(f"Daemon run starting ({reason})")
+        self._running = True
+        self.last_run_started = datetime.now()
+        try:
+            self.last_exit_code = self.run(self.runtime)
+        except Exception as e:
+            logger.critical(f"Daemon run crashed: {e}", exc_info=True)
+            self.last_exit_code = -1
+        finally:
+            self._running = False
+            self.last_run_finished = datetime.now()
+            self.run_count += 1
+
+        elapsed = (self.last_run_finished - self.last_run_started).total_seconds()
+        logger.info(f"Daemon run finished with exit code {self.last_exit_code} in {elapsed:.1f}s")
+
+    def _read_env_mtime(self) -> float:
+        """Modification time of the .env file (0 if missing)."""
+        try:
+            return self.env_file.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def _reload_if_changed(self, force: bool = False) -> None:
+        """Reload configuration and rebuild the runtime if .env changed.
+
+        Args:
+            force: Reload even if the file did not change
+        """
+        mtime = self._read_env_mtime()
+        if not force and mtime == self._env_mtime:
+            return
+        self._env_mtime = mtime
+
+        try:
+            config = Config.load(self.env_file, override=True)
+            config.ensure_directories()
+            schedule = CronSchedule(config.DAEMON_SCHEDULE)
+            if self.on_reload:
+                self.on_reload()
+            runtime = self.build_runtime(config)
+        except Exception as e:
+            logger.error(f"Failed to reload configuration, keeping the previous one: {e}")
+            return
+
+        if config.DAEMON_CONTROL_PORT != self.config.DAEMON_CONTROL_PORT:
+            logger.warning("DAEMON_CONTROL_PORT changed; restart the daemon to apply it")
+
+        self.config = config
+        self.runtime = runtime
+        self.schedule = schedule
+        self.next_run = self.schedule.next_after(datetime.now())
+        logger.info(f"Configuration reloaded; next scheduled run: {self.next_run.isoformat(sep=' ')}")
+
+
+def send_command(port: int, command: str, timeout: float = 10.0) -> dict:
+    """Send a command to a running daemon's control socket.
+
+    Args:
+        port: Control port on 127.0.0.1
+        command: One of COMMANDS
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Parsed reply
+
+    Raises:
+        OSError: If the daemon is not reachable
+    """
+    with socket.create_connection(("127.0.0.1", port), timeout=timeout) as conn:
+        conn.sendall((command + "\n").encode("utf-8"))
+        reply = conn.makefile("r", encoding="utf-8").readline()
+    return json.loads(reply)
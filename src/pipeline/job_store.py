@@ -0,0 +1,189 @@
+"""SQLite-backed job store for ahead-of-time app generation."""
+
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional
+
+from config import Language
+
+logger = logging.getLogger("AADD")
+
+# Job states
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_PUBLISHED = "published"
+
+
+@dataclass
+class JobRecord:
+    """State of one (date, language) pre-generation job."""
+
+    target_date: date
+    language: Language
+    status: str
+    attempts: int = 0
+    last_error: str = ""
+    content_hash: str = ""  # Fingerprint of the candidates the app was generated from
+    updated_at: str = ""
+
+
+class JobStore:
+    """Persistent pending/running/done/failed state for pre-generation jobs."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            target_date TEXT NOT NULL,
+            language TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT NOT NULL DEFAULT '',
+            content_hash TEXT NOT NULL DEFAULT '',
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (target_date, language)
+        )
+    """
+
+    def __init__(self, db_path: Path):
+        """Initialize job store, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(self.SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection for one transaction.
+
+        A connection per operation lets worker threads share the store.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, target_date: date, language: Language) -> Optional[JobRecord]:
+        """Get a job's record.
+
+        Args:
+            target_date: Date of the app
+            language: Language of the app
+
+        Returns:
+            JobRecord, or None if the job was never enqueued
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT target_date, language, status, attempts, last_error, content_hash, "
+                "updated_at FROM jobs WHERE target_date = ? AND language = ?",
+                (target_date.isoformat(), language.value)
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    def list_jobs(self, status: str = None) -> List[JobRecord]:
+        """List jobs, oldest date first.
+
+        Args:
+            status: Only return jobs in this state (None for all)
+
+        Returns:
+            List of JobRecord
+        """
+        query = ("SELECT target_date, language, status, attempts, last_error, content_hash, "
+                 "updated_at FROM jobs")
+        params = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY target_date, language"
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def enqueue(self, target_date: date, language: Language) -> JobRecord:
+        """Add a pending job if it does not exist yet.
+
+        Args:
+            target_date: Date of the app
+            language: Language of the app
+
+        Returns:
+            The job's current record
+        """
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO jobs (target_date, language, status, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (target_date.isoformat(), language.value, STATUS_PENDING, self._now())
+            )
+        return self.get(target_date, language)
+
+    def claim(self, target_date: date, language: Language) -> None:
+        """Mark a job as running and count the attempt."""
+        self._update(
+            target_date, language,
+            "status = ?, attempts = attempts + 1", (STATUS_RUNNING,)
+        )
+
+    def mark_done(self, target_date: date, language: Language, content_hash: str) -> None:
+        """Mark a job as staged, recording the candidate fingerprint it was built from."""
+        self._update(
+            target_date, language,
+            "status = ?, last_error = '', content_hash = ?", (STATUS_DONE, content_hash)
+        )
+
+    def mark_failed(self, target_date: date, language: Language, error: str) -> None:
+        """Mark a job as failed with its last error."""
+        self._update(target_date, language, "status = ?, last_error = ?", (STATUS_FAILED, error))
+
+    def mark_stale(self, target_date: date, language: Language, reason: str) -> None:
+        """Send a staged job back to pending (e.g. its source content changed)."""
+        self._update(
+            target_date, language,
+            "status = ?, attempts = 0, last_error = ?, content_hash = ''", (STATUS_PENDING, reason)
+        )
+
+    def mark_published(self, target_date: date, language: Language) -> None:
+        """Mark a staged job as promoted into the docs tree."""
+        self._update(target_date, language, "status = ?", (STATUS_PUBLISHED,))
+
+    def _update(self, target_date: date, language: Language, assignments: str, params: tuple):
+        """Apply an UPDATE to one job row and bump updated_at."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? "
+                "WHERE target_date = ? AND language = ?",
+                params + (self._now(), target_date.isoformat(), language.value)
+            )
+
+    @staticmethod
+    def _now() -> str:
+        """Current timestamp for updated_at."""
+        return datetime.now().isoformat(timespec="seconds")
+
+    @staticmethod
+    def _to_record(row) -> JobRecord:
+        """Convert a database row into a JobRecord."""
+        return JobRecord(
+            target_date=date.fromisoformat(row[0]),
+            language=Language(row[1]),
+            status=row[2],
+            attempts=row[3],
+            last_error=row[4],
+            content_hash=row[5],
+            updated_at=row[6],
+        )
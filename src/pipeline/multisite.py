@@ -0,0 +1,169 @@
+"""Multi-site mode: several AADD sites generated from one process."""
+
+import re
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from config import Config, Language
+
+logger = logging.getLogger("AADD")
+
+# Site file keys that map onto Config fields
+PATH_FIELDS = {
+    "docs_dir": "DOCS_DIR",
+    "repo_dir": "PROJECT_ROOT",
+    "data_dir": "DATA_DIR",
+}
+VALUE_FIELDS = {
+    "git_remote": "GIT_REMOTE",
+    "git_branch": "GIT_BRANCH",
+    "git_user_name": "GIT_USER_NAME",
+    "git_user_email": "GIT_USER_EMAIL",
+    "enable_git_push": "ENABLE_GIT_PUSH",
+}
+SITE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+# One lock per repository, so sites sharing a repo publish one at a time
+_repo_locks: Dict[Path, threading.Lock] = {}
+_repo_locks_lock = threading.Lock()
+
+
+@dataclass
+class Site:
+    """One site: a name and its configuration."""
+
+    name: str
+    config: Config
+
+
+def load_sites(sites_file: Path, base_config: Config) -> List[Site]:
+    """Load site definitions and derive each site's configuration.
+
+    The file is a JSON list of objects. Every object needs a "name" and may
+    set docs_dir, repo_dir, data_dir (relative to the sites file), git_remote,
+    git_branch, git_user_name, git_user_email, enable_git_push and languages
+    (e.g. ["en"]). Anything not set is taken from the base configuration.
+    repo_dir defaults to the parent of docs_dir, and docs_dir to
+    repo_dir/docs; docs_dir must be inside repo_dir. Checkpoints and staged
+    apps go to a per-site subdirectory of RUNS_DIR and STAGING_DIR.
+
+    Args:
+        sites_file: Path to the sites JSON file
+        base_config: Configuration loaded from .env
+
+    Returns:
+        List of sites, in file order
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is malformed
+    """
+    sites_file = Path(sites_file)
+    with open(sites_file, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{sites_file} must contain a non-empty JSON list of sites")
+
+    sites = []
+    for entry in entries:
+        site = _build_site(entry, base_config, sites_file.parent)
+        if any(existing.name == site.name for existing in sites):
+            raise ValueError(f"Duplicate site name: {site.name}")
+        sites.append(site)
+
+    logger.info(f"Loaded {len(sites)} sites from {sites_file}: {', '.join(s.name for s in sites)}")
+    return sites
+
+
+def _build_site(entry: dict, base_config: Config, base_dir: Path) -> Site:
+    """Derive one site's Config from its entry in the sites file."""
+    name = entry.get("name", "") if isinstance(entry, dict) else ""
+    if not SITE_NAME_PATTERN.match(name):
+        raise ValueError(f"Every site needs a name made of letters, digits, '-' or '_': {entry}")
+
+    unknown = set(entry) - {"name", "languages"} - set(PATH_FIELDS) - set(VALUE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown keys for site {name}: {', '.join(sorted(unknown))}")
+
+    changes = {
+        "RUNS_DIR": base_config.RUNS_DIR / name,
+        "STAGING_DIR": base_config.STAGING_DIR / name,
+    }
+    for key, field in PATH_FIELDS.items():
+        if key in entry:
+            changes[field] = (base_dir / entry[key]).resolve()
+    if "docs_dir" in entry and "repo_dir" not in entry:
+        changes["PROJECT_ROOT"] = changes["DOCS_DIR"].parent
+    elif "repo_dir" in entry and "docs_dir" not in entry:
+        changes["DOCS_DIR"] = changes["PROJECT_ROOT"] / "docs"
+    for key, field in VALUE_FIELDS.items():
+        if key in entry:
+            changes[field] = entry[key]
+    if "languages" in entry:
+        try:
+            changes["LANGUAGES"] = [Language(code) for code in entry["languages"]]
+        except ValueError:
+            raise ValueError(f"Site {name} has unknown languages: {entry['languages']}")
+
+    config = replace(base_config, **changes)
+    if not Path(config.DOCS_DIR).resolve().is_relative_to(Path(config.PROJECT_ROOT).resolve()):
+        raise ValueError(f"Site {name}: docs_dir {config.DOCS_DIR} is not inside repo_dir {config.PROJECT_ROOT}")
+    return Site(name=name, config=config)
+
+
+def repo_lock(repo_dir: Path) -> threading.Lock:
+    """Lock serializing index and git updates of one repository.
+
+    Sites in the same repository run in parallel threads; without it they
+    race on git's index lock, and one site's commit can pick up the files
+    another has staged.
+
+    Args:
+        repo_dir: Repository root
+
+    Returns:
+        The repository's lock (the same object for every caller)
+    """
+    key = Path(repo_dir).resolve()
+    with _repo_locks_lock:
+        return _repo_locks.setdefault(key, threading.Lock())
+
+
+def run_sites(sites: List[Site], run_site: Callable[[Site], int], concurrency: int = 1) -> Dict[str, int]:
+    """Run every site, at most `concurrency` at a time.
+
+    Sites publish through main.publish, which holds repo_lock() of the
+    site's repository, so sites sharing a repository commit one at a time.
+
+    Args:
+        sites: Sites to run
+        run_site: Runs one site and returns its exit code
+        concurrency: Maximum number of sites in flight
+
+    Returns:
+        Mapping of site name to exit code
+    """
+    def run(site: Site) -> int:
+        logger.info(f"[{site.name}] Site run starting")
+        try:
+            exit_code = run_site(site)
+        except Exception as e:
+            logger.critical(f"[{site.name}] Site run crashed: {e}", exc_info=True)
+            exit_code = -1
+        logger.info(f"[{site.name}] Site run finished with exit code {exit_code}")
+        return exit_code
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="aadd-site") as pool:
+        results = dict(zip((site.name for site in sites), pool.map(run, sites)))
+
+    failed = [name for name, code in results.items() if code != 0]
+    logger.info(f"Multi-site run: {len(results) - len(failed)} sites succeeded, {len(failed)} failed")
+    for name in failed:
+        logger.warning(f"Site {name} failed with exit code {results[name]}")
+    return results
@@ -0,0 +1,171 @@
+"""Ahead-of-time generation into a staging area, and promotion at publish time."""
+
+import hashlib
+import logging
+from datetime import date, timedelta
+from typing import Callable, List, Optional
+
+from config import Language
+from fetchers.base_fetcher import Anniversary
+from pipeline.backfill import BackfillJob, app_exists
+from pipeline.checkpoint import CheckpointStore
+from pipeline.job_store import (
+    JobStore,
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_PUBLISHED,
+)
+from publishers.file_manager import FileManager
+
+logger = logging.getLogger("AADD")
+
+
+def candidates_fingerprint(anniversaries: List[Anniversary]) -> str:
+    """Fingerprint a candidate list so content changes can be detected.
+
+    Args:
+        anniversaries: Fetched candidate anniversaries
+
+    Returns:
+        Hex digest over (source, year, description) of every candidate
+    """
+    digest = hashlib.sha256()
+    for ann in anniversaries:
+        digest.update(f"{ann.source}\x1f{ann.year}\x1f{ann.description}\x1e".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def plan_pregeneration(job_store: JobStore, docs_root, start: date, days: int,
+                       languages: List[Language], max_attempts: int) -> List[BackfillJob]:
+    """Enqueue upcoming dates and list the jobs that still need staging.
+
+    Args:
+        job_store: Pre-generation job store
+        docs_root: Root directory for published docs
+        start: First date to stage
+        days: Number of consecutive days to stage
+        languages: Languages to stage
+        max_attempts: Failed jobs with this many attempts are not retried
+
+    Returns:
+        Jobs to run, oldest first
+    """
+    jobs = []
+    for offset in range(days):
+        target_date = start + timedelta(days=offset)
+        for language in languages:
+            if app_exists(docs_root, target_date, language):
+                continue
+
+            record = job_store.enqueue(target_date, language)
+            if record.status in (STATUS_DONE, STATUS_PUBLISHED):
+                continue
+            if record.status == STATUS_FAILED and record.attempts >= max_attempts:
+                logger.warning(
+                    f"Giving up on staging {target_date.isoformat()} ({language.value}) "
+                    f"after {record.attempts} attempts: {record.last_error}"
+                )
+                continue
+            jobs.append((target_date, language))
+
+    logger.info(f"Pre-generation plan: {len(jobs)} jobs over the next {days} days")
+    return jobs
+
+
+def make_stage_worker(job_store: JobStore, staging: CheckpointStore,
+                      stage: Callable[[date, Language], Optional[Anniversary]]):
+    """Wrap a staging callable so every attempt is tracked in the job store.
+
+    Args:
+        job_store: Pre-generation job store
+        staging: Checkpoint store holding staged apps
+        stage: Callable that fetches, selects and generates into staging,
+            returning the selected anniversary or None on failure
+
+    Returns:
+        Worker callable taking (date, language)
+    """
+    def worker(target_date: date, language: Language) -> Optional[Anniversary]:
+        job_store.claim(target_date, language)
+        try:
+            selected = stage(target_date, language)
+        except Exception as e:
+            job_store.mark_failed(target_date, language, str(e))
+            raise
+
+        if not selected:
+            job_store.mark_failed(target_date, language, "Staging failed, see logs")
+            return None
+
+        anniversaries = staging.job(target_date, language).load_anniversaries() or []
+        job_store.mark_done(target_date, language, candidates_fingerprint(anniversaries))
+        return selected
+
+    return worker
+
+
+def promote_staged_app(job_store: JobStore, staging: CheckpointStore, file_manager: FileManager,
+                       target_date: date, language: Language,
+                       fetch: Callable[[date, Language], List[Anniversary]]) -> Optional[Anniversary]:
+    """Publish a staged app into the docs tree if it is still current.
+
+    The candidates are re-fetched and compared with the fingerprint taken
+    at staging time. If they changed and the staged anniversary is no
+    longer listed, the job goes back to pending and None is returned so
+    the caller generates inline. If the live source is unreachable or a
+    different source answered, the staged app is promoted as is.
+
+    Args:
+        job_store: Pre-generation job store
+        staging: Checkpoint store holding staged apps
+        file_manager: File manager for the docs tree
+        target_date: Date to publish
+        language: Language to publish
+        fetch: Callable returning the current candidates for (date, language)
+
+    Returns:
+        The staged app's anniversary, or None if nothing was promoted
+    """
+    record = job_store.get(target_date, language)
+    if not record or record.status != STATUS_DONE:
+        return None
+
+    checkpoint = staging.job(target_date, language)
+    app = checkpoint.load_app()
+    if app is None:
+        job_store.mark_stale(target_date, language, "Staged app missing")
+        return None
+
+    try:
+        current = fetch(target_date, language)
+    except Exception as e:
+        logger.warning(f"Could not re-check {language.value} candidates ({e}), promoting staged app")
+        current = None
+
+    staged_source = app.anniversary.source
+    if current and current[0].source == staged_source \
+            and candidates_fingerprint(current) != record.content_hash:
+        if not _still_listed(app.anniversary, current):
+            logger.warning(
+                f"{language.value} candidates changed since staging and the staged "
+                f"anniversary is gone; regenerating"
+            )
+            job_store.mark_stale(target_date, language, "Source content changed")
+            checkpoint.clear()
+            return None
+        logger.info(f"{language.value} candidates changed, but the staged anniversary is still listed")
+
+    app_dir = file_manager.save_app(app, target_date)
+    job_store.mark_published(target_date, language)
+    checkpoint.clear()
+    logger.info(f"Promoted staged {language.value} app to: {app_dir}")
+    return app.anniversary
+
+
+def _still_listed(anniversary: Anniversary, candidates: List[Anniversary]) -> bool:
+    """Check whether an anniversary is still among the current candidates."""
+    return any(
+        c.year == anniversary.year
+        and (c.description == anniversary.description or c.title == anniversary.title)
+        for c in candidates
+    )
@@ -0,0 +1,267 @@
+"""Local on-demand generation HTTP service for editor previews and re-rolls."""
+
+import json
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from config import Language
+from generators.generated_app import GeneratedApp
+from generators.prompt_templates import APP_STYLES
+from pipeline.checkpoint import CheckpointStore
+
+logger = logging.getLogger("AADD")
+
+# (date, language, style key) identifying one preview
+PreviewKey = Tuple[date, Language, str]
+
+# Files served for a preview, mapped to (GeneratedApp attribute, content type)
+PREVIEW_FILES = {
+    "index.html": ("html", "text/html; charset=utf-8"),
+    "style.css": ("css", "text/css; charset=utf-8"),
+    "app.js": ("js", "application/javascript; charset=utf-8"),
+}
+
+
+class ServiceBusy(Exception):
+    """Raised when the admission queue is full."""
+
+
+def resolve_style(style: Optional[str]) -> Tuple[Optional[str], str]:
+    """Resolve a style request parameter.
+
+    Args:
+        style: None, an index into APP_STYLES, or free-form style text
+
+    Returns:
+        Tuple of (style text for the prompt or None for random, cache key)
+
+    Raises:
+        ValueError: If a numeric style is out of range
+    """
+    if not style:
+        return None, "random"
+    if style.isdigit():
+        index = int(style)
+        if not 0 <= index < len(APP_STYLES):
+            raise ValueError(f"Style index must be 0-{len(APP_STYLES) - 1}")
+        return APP_STYLES[index], f"style-{index}"
+    return style, "custom-" + hashlib.sha1(style.encode("utf-8")).hexdigest()[:12]
+
+
+class GenerationService:
+    """Generates preview apps with single-flight coalescing, a disk cache and admission control.
+
+    Identical in-flight requests for the same (date, language, style) share
+    one Claude call. Finished apps are served from disk. At most
+    max_concurrency generations run at once and at most max_queue more may
+    wait; further requests are rejected with ServiceBusy.
+    """
+
+    def __init__(self, cache_dir: Path,
+                 generate: Callable[[date, Language, Optional[str], CheckpointStore], object],
+                 max_concurrency: int = 2, max_queue: int = 8):
+        """Initialize service.
+
+        Args:
+            cache_dir: Root directory for cached previews
+            generate: Callable running fetch -> select -> generate into the
+                given checkpoint store, returning a truthy value on success
+            max_concurrency: Maximum generations running at once
+            max_queue: Maximum generations waiting for a slot
+        """
+        self.cache_dir = Path(cache_dir)
+        self.generate = generate
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        self._inflight: Dict[PreviewKey, Future] = {}
+        self._waiting = 0
+        self._running = 0
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "generated": 0, "rejected": 0}
+
+    def get_app(self, target_date: date, language: Language, style: Optional[str] = None,
+                refresh: bool = False) -> GeneratedApp:
+        """Get a preview app, generating it if it is not cached.
+
+        Args:
+            target_date: Date of the app
+            language: Language of the app
+            style: None, an index into APP_STYLES, or free-form style text
+            refresh: Ignore the cached app and generate a new one (re-roll)
+
+        Returns:
+            GeneratedApp
+
+        Raises:
+            ServiceBusy: If the admission queue is full
+            ValueError: If the style is invalid
+            RuntimeError: If generation fails
+        """
+        style_text, style_key = resolve_style(style)
+        key = (target_date, language, style_key)
+        store = self._store(style_key)
+
+        with self._lock:
+            self.stats["requests"] += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                # Single-flight: wait for the request already generating this key
+                self.stats["coalesced"] += 1
+                leader = False
+            else:
+                if not refresh:
+                    app = store.job(target_date, language).load_app()
+                    if app is not None:
+                        self.stats["cache_hits"] += 1
+                        return app
+                if self._waiting + self._running >= self.max_concurrency + self.max_queue:
+                    self.stats["rejected"] += 1
+                    raise ServiceBusy("Too many preview requests in progress, try again later")
+                future = Future()
+                self._inflight[key] = future
+                self._waiting += 1
+                leader = True
+
+        if leader:
+            self._run(key, store, style_text, future)
+        return future.result()
+
+    def status(self) -> dict:
+        """Get service counters.
+
+        Returns:
+            Status dictionary
+        """
+        with self._lock:
+            return {
+                "running": self._running,
+                "waiting": self._waiting,
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                **self.stats,
+            }
+
+    def _run(self, key: PreviewKey, store: CheckpointStore, style_text: Optional[str],
+             future: Future) -> None:
+        """Generate one preview under the concurrency budget and resolve its future."""
+        target_date, language, style_key = key
+        try:
+            with self._slots:
+                with self._lock:
+                    self._waiting -= 1
+                    self._running += 1
+                try:
+                    checkpoint = store.job(target_date, language)
+                    checkpoint.clear()
+                    logger.info(f"Generating preview {target_date.isoformat()} ({language.value}, {style_key})")
+                    if not self.generate(target_date, language, style_text, store):
+                        raise RuntimeError("Generation failed, see logs")
+                    app = checkpoint.load_app()
+                    if app is None:
+                        raise RuntimeError("Generation finished without an app")
+                finally:
+                    with self._lock:
+                        self._running -= 1
+            with self._lock:
+                self.stats["generated"] += 1
+            future.set_result(app)
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _store(self, style_key: str) -> CheckpointStore:
+        """Checkpoint store holding cached previews for one style."""
+        return CheckpointStore(self.cache_dir / style_key, resume=True)
+
+
+class _PreviewHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the preview service.
+
+    Routes:
+        GET /health
+        GET /apps/{lang}/{YYYY-MM-DD}[/index.html|/style.css|/app.js|/app.json]
+            ?style=<index or text>&refresh=1
+    """
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        query = parse_qs(url.query)
+
+        if parts == ["health"]:
+            self._send_json(200, self.server.service.status())
+            return
+
+        if len(parts) not in (3, 4) or parts[0] != "apps":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        try:
+            language = Language(parts[1])
+            target_date = date.fromisoformat(parts[2])
+        except ValueError:
+            self._send_json(400, {"error": "Expected /apps/{ja|en}/{YYYY-MM-DD}"})
+            return
+
+        filename = parts[3] if len(parts) == 4 else "index.html"
+        if filename != "app.json" and filename not in PREVIEW_FILES:
+            self._send_json(404, {"error": f"Unknown file: {filename}"})
+            return
+
+        style = query.get("style", [None])[0]
+        refresh = query.get("refresh", ["0"])[0] in ("1", "true", "yes")
+        try:
+            app = self.server.service.get_app(target_date, language, style, refresh)
+        except ServiceBusy as e:
+            self._send_json(503, {"error": str(e)}, {"Retry-After": "30"})
+            return
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            logger.error(f"Preview generation failed: {e}", exc_info=True)
+            self._send_json(500, {"error": str(e)})
+            return
+
+        if filename == "app.json":
+            self._send_json(200, app.to_dict())
+            return
+        attribute, content_type = PREVIEW_FILES[filename]
+        self._send(200, getattr(app, attribute).encode("utf-8"), content_type)
+
+    def _send_json(self, status: int, data: dict, headers: dict = None):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self._send(status, body, "application/json; charset=utf-8", headers)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"Preview service: {format % args}")
+
+
+class PreviewServer(ThreadingHTTPServer):
+    """Threaded HTTP server exposing a GenerationService on the loopback interface."""
+
+    daemon_threads = True
+
+    def __init__(self, port: int, service: GenerationService, host: str = "127.0.0.1"):
+        super().__init__((host, port), _PreviewHandler)
+        self.service = service
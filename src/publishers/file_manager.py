@@ -5,7 +5,7 @@ import logging
 from pathlib import Path
 from datetime import date
 
-from generators.claude_generator import GeneratedApp
+from generators.generated_app import GeneratedApp
 from config import Language
 
 logger = logging.getLogger("AADD")
@@ -2,6 +2,7 @@
 
 import logging
 from pathlib import Path
+from typing import List
 from git import Repo
 from git.exc import GitCommandError
 
@@ -25,12 +26,42 @@ class GitManager:
         self.config = config
         self.repo = Repo(repo_path)
 
+        # docs/ path inside the repository (sites may keep it elsewhere)
+        self.docs_path = Path(config.DOCS_DIR).resolve().relative_to(
+            self.repo_path.resolve()
+        ).as_posix() + "/"
+
     def commit_and_push(self, anniversary: Anniversary) -> bool:
         """Commit new app and push to remote.
 
         Args:
             anniversary: The anniversary for the commit message
 
+        Returns:
+            True if successful, False otherwise
+        """
+        date_str = anniversary.date.strftime("%B %d, %Y")
+        return self._commit_and_push(self._create_commit_message(anniversary, date_str))
+
+    def commit_and_push_batch(self, anniversaries: List[Anniversary]) -> bool:
+        """Commit several new apps in a single commit and push to remote.
+
+        Args:
+            anniversaries: The anniversaries for the commit message
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if len(anniversaries) == 1:
+            return self.commit_and_push(anniversaries[0])
+        return self._commit_and_push(self._create_batch_commit_message(anniversaries))
+
+    def _commit_and_push(self, commit_message: str) -> bool:
+        """Stage the docs tree, commit with the given message and push.
+
+        Args:
+            commit_message: Commit message
+
         Returns:
             True if successful, False otherwise
         """
@@ -41,18 +72,14 @@ class GitManager:
                 git_config.set_value("user", "email", self.config.GIT_USER_EMAIL)
 
             # Stage all files in docs/
-            self.repo.index.add(["docs/"])
-            logger.info("Staged changes in docs/")
+            self.repo.index.add([self.docs_path])
+            logger.info(f"Staged changes in {self.docs_path}")
 
             # Check if there are changes to commit
             if not self.repo.index.diff("HEAD"):
                 logger.info("No changes to commit")
                 return True
 
-            # Create commit message
-            date_str = anniversary.date.strftime("%B %d, %Y")
-            commit_message = self._create_commit_message(anniversary, date_str)
-
             # Commit
             self.repo.index.commit(commit_message)
             logger.info("Created commit successfully")
@@ -90,16 +117,38 @@ class GitManager:
         Returns:
             Commit message string
         """
+        year = anniversary.year if anniversary.year is not None else "-"  # Observances have none
         message = f"""Add web app for {date_str}
 
 Anniversary: {anniversary.title}
-Year: {anniversary.year}
+Year: {year}
 Category: {anniversary.category}
 
 Generated automatically by AADD system.
 """
         return message
 
+    def _create_batch_commit_message(self, anniversaries: List[Anniversary]) -> str:
+        """Create a commit message covering several apps.
+
+        Args:
+            anniversaries: The anniversaries included in the commit
+
+        Returns:
+            Commit message string
+        """
+        ordered = sorted(anniversaries, key=lambda a: a.date)
+        first = ordered[0].date.strftime("%B %d, %Y")
+        last = ordered[-1].date.strftime("%B %d, %Y")
+        lines = [f"- {a.date.isoformat()}: {a.title}" + (f" ({a.year})" if a.year is not None else "")
+                 for a in ordered]
+
+        return (
+            f"Add {len(ordered)} web apps for {first} - {last}\n\n"
+            + "\n".join(lines)
+            + "\n\nGenerated automatically by AADD system.\n"
+        )
+
     def get_status(self) -> str:
         """Get git status.
 
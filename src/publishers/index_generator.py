@@ -293,7 +293,7 @@ class IndexGenerator:
         category = anniversary.get("category", "historical")
 
         # Get year
-        year = anniversary.get("year", "")
+        year = anniversary.get("year") or ""  # None for observances
 
         # Get app title
         app_title = app_meta.get("app_title", anniversary.get("title", "Untitled"))
@@ -31,8 +31,8 @@ def is_positive_topic(anniversary: Anniversary) -> bool:
     Returns:
         True if positive, False if negative/violent
     """
-    # Combine title and description for checking
-    text = f"{anniversary.title} {anniversary.description}".lower()
+    # Combine title and event text (not any appended article extract) for checking
+    text = f"{anniversary.title} {anniversary.event_text}".lower()
 
     # Check English keywords
     for keyword in NEGATIVE_KEYWORDS_EN:
@@ -0,0 +1,128 @@
+"""Minimal cron expression support for the daemon scheduler."""
+
+from datetime import datetime, timedelta
+from typing import Set
+
+
+# (name, minimum, maximum) for the five cron fields
+CRON_FIELDS = [
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),  # 0 and 7 are both Sunday
+]
+
+
+def _parse_field(spec: str, name: str, minimum: int, maximum: int) -> Set[int]:
+    """Parse one cron field into the set of values it matches.
+
+    Supports "*", single values, ranges "a-b", lists "a,b" and steps "*/n", "a-b/n".
+
+    Args:
+        spec: Field text
+        name: Field name (for error messages)
+        minimum: Smallest allowed value
+        maximum: Largest allowed value
+
+    Returns:
+        Set of matching values
+
+    Raises:
+        ValueError: If the field is malformed or out of range
+    """
+    values = set()
+    for part in spec.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"Invalid step in cron {name} field: {spec}")
+
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = end = int(part)
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"Cron {name} field out of range: {spec}")
+
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """A five-field cron expression ("minute hour day-of-month month day-of-week")."""
+
+    def __init__(self, expression: str):
+        """Parse a cron expression.
+
+        Args:
+            expression: Cron expression, e.g. "0 9 * * *" for every day at 9:00
+
+        Raises:
+            ValueError: If the expression is malformed
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {len(fields)}: {expression!r}")
+
+        self.expression = expression
+        parsed = [
+            _parse_field(spec, name, minimum, maximum)
+            for spec, (name, minimum, maximum) in zip(fields, CRON_FIELDS)
+        ]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {day % 7 for day in weekdays}
+
+        # Standard cron: when both day fields are restricted, either may match
+        self._days_restricted = fields[2] != "*"
+        self._weekdays_restricted = fields[4] != "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Check the day-of-month / day-of-week fields for a date."""
+        cron_weekday = (moment.weekday() + 1) % 7  # Python: Monday=0; cron: Sunday=0
+        day_ok = moment.day in self.days
+        weekday_ok = cron_weekday in self.weekdays
+        if self._days_restricted and self._weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Get the first matching time strictly after a moment.
+
+        Args:
+            moment: Reference time
+
+        Returns:
+            Next matching time (seconds and microseconds are zero)
+
+        Raises:
+            ValueError: If nothing matches within the next five years
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                # Jump to the first minute of next month
+                year = candidate.year + (candidate.month // 12)
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
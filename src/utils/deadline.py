@@ -0,0 +1,77 @@
+"""Run-level time budget shared by the pipeline stages."""
+
+import math
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a stage cannot start because the run budget is spent."""
+
+
+class Deadline:
+    """A time budget for one run, measured on the monotonic clock.
+
+    Stages size their timeouts and retries from ``remaining()`` and use
+    ``is_low()`` to switch to cheaper strategies when little time is left.
+    A deadline created with ``seconds=None`` never expires.
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        """Start the budget.
+
+        Args:
+            seconds: Total budget in seconds (None or <= 0 for unlimited)
+        """
+        self.seconds = seconds if seconds and seconds > 0 else None
+        self.started = time.monotonic()
+        self.expires = self.started + self.seconds if self.seconds else math.inf
+
+    def remaining(self) -> float:
+        """Seconds left in the budget (inf if unlimited, never negative)."""
+        return max(0.0, self.expires - time.monotonic())
+
+    def elapsed(self) -> float:
+        """Seconds since the budget started."""
+        return time.monotonic() - self.started
+
+    def expired(self) -> bool:
+        """Check whether the budget is spent."""
+        return self.remaining() <= 0
+
+    def is_low(self, threshold: float) -> bool:
+        """Check whether fewer than threshold seconds remain.
+
+        Args:
+            threshold: Seconds a stage needs for its full-quality strategy
+
+        Returns:
+            True if the stage should degrade
+        """
+        return self.remaining() < threshold
+
+    def timeout(self, default: float) -> float:
+        """Size a timeout from the remaining budget.
+
+        Args:
+            default: Timeout to use when the budget allows it
+
+        Returns:
+            min(default, remaining)
+
+        Raises:
+            DeadlineExceeded: If the budget is already spent
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Run budget of {self.seconds:.0f}s exhausted")
+        return min(default, remaining)
+
+    def allows(self, seconds: float) -> bool:
+        """Check whether waiting this many seconds still leaves budget."""
+        return self.remaining() > seconds
+
+    def __str__(self) -> str:
+        if self.seconds is None:
+            return "unlimited"
+        return f"{self.remaining():.0f}s of {self.seconds:.0f}s left"
@@ -0,0 +1,243 @@
+"""Persistent conditional-request HTTP cache for fetched pages."""
+
+import json
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import requests
+
+logger = logging.getLogger("AADD")
+
+
+@dataclass
+class CacheEntry:
+    """Validators and bookkeeping for one cached body."""
+
+    url: str
+    etag: str = ""
+    last_modified: str = ""
+    stored_at: float = 0.0  # When the body was last confirmed by the server
+    size: int = 0
+
+
+class HttpCache:
+    """On-disk HTTP cache with ETag/Last-Modified revalidation.
+
+    Every reuse is revalidated with If-None-Match / If-Modified-Since, so a
+    304 replaces the download. If the server is unreachable or answers with
+    a 5xx, a cached body up to ``max_stale`` seconds old is served instead
+    of failing. The directory is kept under ``max_bytes`` by evicting the
+    least recently used bodies.
+
+    Layout: <cache_dir>/<sha1(url)>.body and <sha1(url)>.json
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 50 * 1024 * 1024,
+                 max_stale: float = 7 * 24 * 3600):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for cached bodies
+            max_bytes: Size bound for all cached bodies
+            max_stale: Oldest body (seconds since last confirmed) served when offline
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_stale = max_stale
+        self._lock = threading.Lock()
+        self.stats = {"revalidated": 0, "misses": 0, "stale": 0, "bytes_downloaded": 0}
+
+    def get(self, session: requests.Session, url: str, timeout: float,
+            headers: Optional[dict] = None) -> bytes:
+        """GET a URL through the cache with a requests session.
+
+        Args:
+            session: Session to send the request with
+            url: URL to fetch
+            timeout: Request timeout in seconds
+            headers: Extra request headers (optional)
+
+        Returns:
+            Response body
+
+        Raises:
+            requests.RequestException: If the request fails and no usable cached copy exists
+        """
+        entry = self._load_entry(url)
+        try:
+            response = session.get(url, timeout=timeout,
+                                   headers={**(headers or {}), **self._conditional_headers(entry)})
+            if response.status_code == 304 and entry:
+                body = self._revalidated(url, entry)
+                if body is not None:
+                    return body
+                # The body was evicted after the entry was read: fetch it whole
+                response = session.get(url, timeout=timeout, headers=headers)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            stale = self._stale_body(url, entry, e)
+            if stale is None:
+                raise
+            return stale
+
+        return self._store(url, response.content, response.headers)
+
+    async def get_async(self, client: httpx.AsyncClient, url: str, timeout: Optional[float] = None,
+                        headers: Optional[dict] = None) -> bytes:
+        """GET a URL through the cache with an async httpx client.
+
+        Args:
+            client: Client to send the request with
+            url: URL to fetch
+            timeout: Request timeout in seconds (defaults to the client's)
+            headers: Extra request headers (optional)
+
+        Returns:
+            Response body
+
+        Raises:
+            httpx.HTTPError: If the request fails and no usable cached copy exists
+        """
+        entry = self._load_entry(url)
+        try:
+            response = await client.get(
+                url, headers={**(headers or {}), **self._conditional_headers(entry)},
+                timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+            )
+            if response.status_code == 304 and entry:
+                body = self._revalidated(url, entry)
+                if body is not None:
+                    return body
+                # The body was evicted after the entry was read: fetch it whole
+                response = await client.get(
+                    url, headers=headers, timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            stale = self._stale_body(url, entry, e)
+            if stale is None:
+                raise
+            return stale
+
+        return self._store(url, response.content, response.headers)
+
+    def _conditional_headers(self, entry: Optional[CacheEntry]) -> dict:
+        """Validator headers for revalidating a cached entry."""
+        headers = {}
+        if entry:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _revalidated(self, url: str, entry: CacheEntry) -> Optional[bytes]:
+        """Serve a body the server confirmed with 304 Not Modified, or None if it is gone."""
+        body = self._read_body(url)
+        if body is None:
+            logger.debug(f"HTTP cache body for {url} vanished after 304, refetching")
+            return None
+        entry.stored_at = time.time()
+        self._write_entry(url, entry)
+        self.stats["revalidated"] += 1
+        logger.debug(f"HTTP cache revalidated: {url}")
+        return body
+
+    def _stale_body(self, url: str, entry: Optional[CacheEntry], error: Exception) -> Optional[bytes]:
+        """Cached body to serve when the server failed, or None if too old or missing."""
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        if status is not None and status < 500:
+            return None  # 4xx is an answer, not an outage
+        if not entry or time.time() - entry.stored_at > self.max_stale:
+            return None
+        body = self._read_body(url)
+        if body is None:
+            return None
+
+        age_hours = (time.time() - entry.stored_at) / 3600
+        logger.warning(f"Serving cached copy of {url} ({age_hours:.1f}h old) after error: {error}")
+        self.stats["stale"] += 1
+        return body
+
+    def _store(self, url: str, body: bytes, headers) -> bytes:
+        """Store a fresh 200 response and enforce the size bound."""
+        self.stats["misses"] += 1
+        self.stats["bytes_downloaded"] += len(body)
+        entry = CacheEntry(
+            url=url,
+            etag=headers.get("ETag", ""),
+            last_modified=headers.get("Last-Modified", ""),
+            stored_at=time.time(),
+            size=len(body),
+        )
+        if self.max_bytes <= 0 or len(body) > self.max_bytes:
+            return body
+
+        body_path, _ = self._paths(url)
+        tmp_path = body_path.with_suffix(f".{threading.get_ident()}.tmp")  # Unique per writer
+        tmp_path.write_bytes(body)
+        tmp_path.replace(body_path)
+        self._write_entry(url, entry)
+        self._evict()
+        return body
+
+    def _read_body(self, url: str) -> Optional[bytes]:
+        """Read a cached body and mark it as recently used."""
+        body_path, _ = self._paths(url)
+        try:
+            body = body_path.read_bytes()
+            body_path.touch()  # mtime is the LRU clock
+        except OSError:
+            return None
+        return body
+
+    def _load_entry(self, url: str) -> Optional[CacheEntry]:
+        """Load the entry for a URL, or None if not cached."""
+        body_path, meta_path = self._paths(url)
+        if not body_path.exists():
+            return None
+        try:
+            entry = CacheEntry(**json.loads(meta_path.read_text(encoding="utf-8")))
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable HTTP cache entry {meta_path}: {e}")
+            return None
+        return entry if entry.url == url else None
+
+    def _write_entry(self, url: str, entry: CacheEntry) -> None:
+        """Atomically write the entry for a URL."""
+        _, meta_path = self._paths(url)
+        tmp_path = meta_path.with_suffix(f".json.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+        tmp_path.replace(meta_path)
+
+    def _evict(self) -> None:
+        """Delete least recently used bodies until the cache fits max_bytes."""
+        with self._lock:
+            bodies = []
+            for body_path in self.cache_dir.glob("*.body"):
+                try:
+                    stat = body_path.stat()
+                except OSError:
+                    continue
+                bodies.append((stat.st_mtime, stat.st_size, body_path))
+
+            total = sum(size for _, size, _ in bodies)
+            for _, size, body_path in sorted(bodies):
+                if total <= self.max_bytes:
+                    break
+                body_path.unlink(missing_ok=True)
+                body_path.with_suffix(".json").unlink(missing_ok=True)
+                total -= size
+                logger.debug(f"HTTP cache evicted {body_path.name}")
+
+    def _paths(self, url: str):
+        """Body and metadata paths for a URL."""
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.body", self.cache_dir / f"{key}.json"
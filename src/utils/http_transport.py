@@ -0,0 +1,243 @@
+"""Shared HTTP transport: pooled keep-alive connections for every outbound fetch."""
+
+import asyncio
+import logging
+import threading
+import importlib.util
+from typing import Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger("AADD")
+
+# Sent with every request (Wikimedia asks clients to identify themselves)
+USER_AGENT = "AADD Bot/1.0 (Anniversary App Generator)"
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding for the encodings both HTTP clients can decode here.
+
+    Brotli needs the optional brotli (or brotlicffi) package; without it
+    only gzip and deflate are offered, so servers never send a body that
+    cannot be decoded.
+
+    Returns:
+        Accept-Encoding header value
+    """
+    encodings = ["gzip", "deflate"]
+    if any(importlib.util.find_spec(module) for module in ("brotli", "brotlicffi")):
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """Response body that counts wire bytes and frees its host slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, transport: "HttpTransport",
+                 slot: asyncio.Semaphore):
+        self._stream = stream
+        self._transport = transport
+        self._slot = slot
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._transport._count(bytes_received=len(chunk))
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._slot.release()
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport allowing a bounded number of open requests per host.
+
+    A request holds its host's slot until its response body is closed,
+    like a connection checked out of a per-host pool.
+    """
+
+    def __init__(self, transport: "HttpTransport"):
+        self._transport = transport
+        self._inner = httpx.AsyncHTTPTransport(limits=httpx.Limits(
+            max_connections=transport.pool_connections * transport.max_per_host,
+            max_keepalive_connections=transport.pool_connections * transport.max_per_host,
+        ))
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slots.setdefault(request.url.host, asyncio.Semaphore(self._transport.max_per_host))
+        await slot.acquire()
+
+        async def trace(event: str, info: dict) -> None:
+            if event == "connection.connect_tcp.complete":
+                self._transport._count(connections=1)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+
+        self._transport._count(requests=1, compressed=int("Content-Encoding" in response.headers))
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountingStream(response.stream, self._transport, slot),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class HttpTransport:
+    """Keep-alive connection pools shared by all fetchers in a process.
+
+    The requests session keeps up to ``max_per_host`` connections for
+    each of ``pool_connections`` hosts and makes further requests to a
+    host wait for a free connection, which caps per-host concurrency. The
+    async side gets the same caps from one httpx client per event loop
+    (clients cannot move between loops). Both send the same User-Agent
+    and Accept-Encoding.
+
+    ``stats`` counts requests, new connections (the rest reused one), wire
+    bytes of finished responses and how many came compressed.
+    """
+
+    def __init__(self, pool_connections: int = 10, max_per_host: int = 4,
+                 user_agent: str = USER_AGENT, timeout: float = 10.0):
+        """Initialize transport; clients are created on first use.
+
+        Args:
+            pool_connections: Hosts to keep connection pools for
+            max_per_host: Connections (and concurrent requests) per host
+            user_agent: User-Agent header for every request
+            timeout: Default request timeout in seconds
+        """
+        self.pool_connections = max(1, pool_connections)
+        self.max_per_host = max(1, max_per_host)
+        self.headers = {"User-Agent": user_agent, "Accept-Encoding": accept_encoding()}
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._adapter: Optional[HTTPAdapter] = None
+        self._async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._open_responses = []  # Streamed urllib3 responses not counted yet
+        self._counts = {"requests": 0, "connections": 0, "bytes_received": 0, "compressed": 0}
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared requests session."""
+        with self._lock:
+            if self._session is None:
+                self._adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                                            pool_maxsize=self.max_per_host, pool_block=True)
+                session = requests.Session()
+                session.headers.update(self.headers)
+                session.mount("https://", self._adapter)
+                session.mount("http://", self._adapter)
+                session.hooks["response"].append(self._on_response)
+                self._session = session
+            return self._session
+
+    def async_client(self) -> httpx.AsyncClient:
+        """The shared httpx client of the running event loop.
+
+        Returns:
+            AsyncClient (do not close it; see aclose)
+
+        Raises:
+            RuntimeError: If called outside an event loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                # Clients of finished loops cannot be closed any more; drop them
+                for old_loop in [old for old in self._async_clients if old.is_closed()]:
+                    del self._async_clients[old_loop]
+                client = httpx.AsyncClient(
+                    headers=self.headers, timeout=self.timeout, follow_redirects=True,
+                    transport=_HostLimitedTransport(self),
+                )
+                self._async_clients[loop] = client
+            return client
+
+    async def aclose(self) -> None:
+        """Close the httpx client of the running event loop, if any."""
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self) -> None:
+        """Close the requests session's connections."""
+        with self._lock:
+            session, self._session, self._adapter = self._session, None, None
+        if session is not None:
+            session.close()
+
+    @property
+    def stats(self) -> dict:
+        """Counters so far, with connection reuse.
+
+        Returns:
+            {"requests", "connections" (newly opened), "reused",
+            "bytes_received" (on the wire), "compressed" (responses)}
+        """
+        with self._lock:
+            self._count_finished()
+            counts = dict(self._counts)
+            adapter = self._adapter
+
+        if adapter is not None:  # urllib3 counts its own connections per host pool
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    counts["connections"] += pool.num_connections
+
+        counts["reused"] = max(0, counts["requests"] - counts["connections"])
+        return counts
+
+    def log_stats(self) -> None:
+        """Log the counters at info level."""
+        stats = self.stats
+        if stats["requests"]:
+            logger.info(
+                f"HTTP: {stats['requests']} requests, {stats['reused']} on reused connections, "
+                f"{stats['bytes_received'] / 1024:.0f} KB received, {stats['compressed']} compressed"
+            )
+
+    def _on_response(self, response: requests.Response, *args, **kwargs) -> None:
+        """Response hook of the requests session."""
+        with self._lock:
+            self._counts["requests"] += 1
+            self._counts["compressed"] += int("Content-Encoding" in response.headers)
+            self._open_responses.append(response.raw)
+            self._count_finished()
+
+    def _count_finished(self) -> None:
+        """Add the wire bytes of requests responses whose body is done (lock held)."""
+        still_open = []
+        for raw in self._open_responses:
+            if raw.closed:
+                self._counts["bytes_received"] += raw.tell()
+            else:
+                still_open.append(raw)
+        self._open_responses = still_open
+
+    def _count(self, **amounts: int) -> None:
+        """Add to the counters (httpx side)."""
+        with self._lock:
+            for key, amount in amounts.items():
+                self._counts[key] += amount
@@ -0,0 +1,126 @@
+"""Near-duplicate detection for short event texts (MinHash with LSH banding)."""
+
+import re
+import zlib
+import unicodedata
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+# Anything that is not a letter, digit or whitespace (works for CJK text too)
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+_WHITESPACE = re.compile(r"\s+")
+
+# Signature value of a bin no shingle hashed into
+_EMPTY_BIN = 1 << 32
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for comparison: NFKC, lowercase, no punctuation, single spaces.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def shingles(text: str, size: int = 3) -> Set[int]:
+    """Hashed character shingles of normalized text.
+
+    Character shingles work for languages without spaces between words.
+
+    Args:
+        text: Normalized text
+        size: Characters per shingle
+
+    Returns:
+        Set of 32-bit shingle hashes
+    """
+    if len(text) <= size:
+        return {zlib.crc32(text.encode("utf-8"))} if text else set()
+    return {zlib.crc32(text[i:i + size].encode("utf-8")) for i in range(len(text) - size + 1)}
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """Finds near-identical texts with the same year.
+
+    Each text gets a MinHash signature split into bands; texts sharing a
+    band (and the year) are candidates, and a candidate is a duplicate if
+    the exact Jaccard similarity of the shingle sets reaches the threshold.
+    Only candidates are compared, so adding n texts stays close to linear.
+
+    Signatures use one-permutation hashing: the shingle hashes are split
+    into bins and each bin keeps its minimum, so a signature costs one pass
+    over the shingles instead of one pass per hash function.
+    """
+
+    def __init__(self, threshold: float = 0.6, bands: int = 8, rows: int = 2):
+        """Initialize index.
+
+        Args:
+            threshold: Jaccard similarity at which texts are duplicates
+            bands: Signature bands (more bands find more candidates)
+            rows: Signature values per band (more rows find fewer candidates)
+        """
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self._buckets: Dict[Tuple, List[Hashable]] = {}
+        self._shingles: Dict[Hashable, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def add(self, key: Hashable, year: Optional[int], text: str) -> Optional[Hashable]:
+        """Add a text unless it duplicates one already in the index.
+
+        Args:
+            key: Identifier for the text (unique per index)
+            year: Year the text is about (None for observances); only texts
+                with the same year can match
+            text: Raw text (normalized here)
+
+        Returns:
+            Key of the earlier near-duplicate, or None if the text was added
+        """
+        text_shingles = shingles(normalize_text(text))
+        band_keys = self._band_keys(year, text_shingles)
+
+        seen = set()
+        for band_key in band_keys:
+            for other in self._buckets.get(band_key, ()):
+                if other not in seen:
+                    seen.add(other)
+                    if jaccard(text_shingles, self._shingles[other]) >= self.threshold:
+                        return other
+
+        self._shingles[key] = text_shingles
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, []).append(key)
+        return None
+
+    def _band_keys(self, year: Optional[int], text_shingles: Set[int]) -> List[Tuple]:
+        """Bucket keys (year, band number, band values) for a shingle set."""
+        if not text_shingles:
+            return []  # Empty texts are never duplicates
+
+        bins = self.bands * self.rows
+        signature = [_EMPTY_BIN] * bins
+        for h in text_shingles:
+            slot, value = h % bins, h // bins
+            if value < signature[slot]:
+                signature[slot] = value
+
+        rows = self.rows
+        return [(year, band, tuple(signature[band * rows:(band + 1) * rows]))
+                for band in range(self.bands)]
@@ -0,0 +1,246 @@
+"""Process-wide token-bucket rate limits for outbound API calls."""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+
+from utils.deadline import Deadline, DeadlineExceeded
+
+logger = logging.getLogger("AADD")
+
+# Bucket names used by the fetchers and generators
+WIKIPEDIA_BUCKET = "wikipedia.{lang}"
+ANTHROPIC_REQUESTS = "anthropic.requests"
+ANTHROPIC_OUTPUT_TOKENS = "anthropic.output_tokens"
+
+
+class TokenBucket:
+    """Refills at ``rate`` tokens per second up to ``capacity``.
+
+    A caller reserves its tokens up front and is told how long to wait
+    for them; the balance may go negative, so later callers queue behind
+    earlier ones in arrival order instead of polling. A request larger
+    than the capacity waits until the bucket would have held it.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Most tokens held (defaults to one second of rate, at least 1)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0.0
+        self.waits = 0
+        self.waited = 0.0  # Seconds callers were told to wait, in total
+
+    def reserve(self, amount: float = 1) -> float:
+        """Take tokens now, returning how long the caller must wait to use them.
+
+        Args:
+            amount: Tokens to take
+
+        Returns:
+            Seconds to wait (0 if the tokens were available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            self.acquired += amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if wait > 0:
+                self.waits += 1
+                self.waited += wait
+            return wait
+
+    def refund(self, amount: float) -> None:
+        """Return reserved tokens that were not used (e.g. unused output tokens).
+
+        Args:
+            amount: Tokens to give back
+        """
+        if amount <= 0:
+            return
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+            self.acquired -= amount
+
+
+class RateLimiter:
+    """Named token buckets shared by every caller in the process.
+
+    Acquiring from a bucket that was not configured returns at once, so
+    callers can always acquire and a limit is switched off by not
+    configuring it.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, name: str, rate: float, capacity: Optional[float] = None) -> None:
+        """Set (or with rate <= 0, remove) the limit of a bucket.
+
+        Args:
+            name: Bucket name, e.g. "wikipedia.en" or "anthropic.requests"
+            rate: Tokens per second
+            capacity: Burst size (defaults to one second of rate, at least 1)
+        """
+        with self._lock:
+            if rate > 0:
+                self._buckets[name] = TokenBucket(rate, capacity)
+            else:
+                self._buckets.pop(name, None)
+
+    def bucket(self, name: str) -> Optional[TokenBucket]:
+        """The bucket with this name, or None if it is not limited."""
+        with self._lock:
+            return self._buckets.get(name)
+
+    def acquire(self, name: str, amount: float = 1, deadline: Optional[Deadline] = None) -> float:
+        """Block until tokens are available.
+
+        Args:
+            name: Bucket name
+            amount: Tokens to take
+            deadline: Run budget the wait must fit in (optional)
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            DeadlineExceeded: If the wait would outlast the run budget
+        """
+        wait = self._reserve(name, amount, deadline)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, name: str, amount: float = 1,
+                            deadline: Optional[Deadline] = None) -> float:
+        """Async variant of acquire; waits without blocking the event loop.
+
+        Args:
+            name: Bucket name
+            amount: Tokens to take
+            deadline: Run budget the wait must fit in (optional)
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            DeadlineExceeded: If the wait would outlast the run budget
+        """
+        wait = self._reserve(name, amount, deadline)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.refund(name, amount)  # Cancelled callers never use their tokens
+                raise
+        return wait
+
+    def refund(self, name: str, amount: float) -> None:
+        """Give back tokens acquired but not used.
+
+        Args:
+            name: Bucket name
+            amount: Tokens to give back
+        """
+        bucket = self.bucket(name)
+        if bucket:
+            bucket.refund(amount)
+
+    def acquire_message(self, max_tokens: int, deadline: Optional[Deadline] = None) -> float:
+        """Acquire one Anthropic request and its max_tokens of output.
+
+        Output tokens are reserved at max_tokens since usage is only known
+        afterwards; settle_message gives back what the response did not use.
+        If the output tokens cannot be had, the request is given back too.
+
+        Args:
+            max_tokens: max_tokens of the request
+            deadline: Run budget the wait must fit in (optional)
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            DeadlineExceeded: If the wait would outlast the run budget
+        """
+        waited = self.acquire(ANTHROPIC_REQUESTS, deadline=deadline)
+        try:
+            return waited + self.acquire(ANTHROPIC_OUTPUT_TOKENS, max_tokens, deadline=deadline)
+        except BaseException:
+            self.refund(ANTHROPIC_REQUESTS, 1)
+            raise
+
+    async def acquire_message_async(self, max_tokens: int, deadline: Optional[Deadline] = None) -> float:
+        """Async variant of acquire_message.
+
+        Args:
+            max_tokens: max_tokens of the request
+            deadline: Run budget the wait must fit in (optional)
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            DeadlineExceeded: If the wait would outlast the run budget
+        """
+        waited = await self.acquire_async(ANTHROPIC_REQUESTS, deadline=deadline)
+        try:
+            return waited + await self.acquire_async(ANTHROPIC_OUTPUT_TOKENS, max_tokens, deadline=deadline)
+        except BaseException:  # Including cancellation
+            self.refund(ANTHROPIC_REQUESTS, 1)
+            raise
+
+    def settle_message(self, max_tokens: int, response=None) -> None:
+        """Give back the output tokens a request reserved but did not use.
+
+        Args:
+            max_tokens: max_tokens the request reserved
+            response: API response (None if the request failed, which refunds all)
+        """
+        usage = getattr(response, "usage", None)
+        used = usage.output_tokens if usage is not None else 0
+        self.refund(ANTHROPIC_OUTPUT_TOKENS, max_tokens - used)
+
+    @property
+    def stats(self) -> dict:
+        """Tokens acquired, waits and seconds waited per bucket."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            name: {"acquired": bucket.acquired, "waits": bucket.waits, "waited": round(bucket.waited, 3)}
+            for name, bucket in buckets.items()
+        }
+
+    def log_stats(self) -> None:
+        """Log, at info level, the buckets that made callers wait."""
+        for name, stats in self.stats.items():
+            if stats["waits"]:
+                logger.info(f"Rate limit {name}: {stats['waits']} waits, {stats['waited']:.1f}s in total")
+
+    def _reserve(self, name: str, amount: float, deadline: Optional[Deadline]) -> float:
+        """Reserve tokens, giving them back if the wait does not fit the budget."""
+        bucket = self.bucket(name)
+        if bucket is None:
+            return 0.0
+
+        wait = bucket.reserve(amount)
+        if wait > 0 and deadline is not None and not deadline.allows(wait):
+            bucket.refund(amount)
+            raise DeadlineExceeded(f"Rate limit {name} needs {wait:.1f}s, run budget has {deadline}")
+        if wait > 0:
+            logger.debug(f"Rate limit {name}: waiting {wait:.2f}s")
+        return wait
@@ -1,59 +1,293 @@
-"""Retry decorator with exponential backoff."""
+"""Retry decorator with decorrelated jitter, server wait hints and a shared retry budget."""
 
 import time
+import random
+import asyncio
 import functools
+import inspect
 import logging
-from typing import Callable, Type, Tuple
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Optional, Type, Tuple
 
 logger = logging.getLogger("AADD")
 
+# 4xx statuses worth retrying; any other 4xx is an answer, not a failure
+RETRYABLE_CLIENT_STATUSES = {408, 425, 429}
+
+# Anthropic rate limit headers: when each limit is fully replenished (RFC 3339)
+_RATE_LIMIT_RESETS = ("requests", "tokens", "input-tokens", "output-tokens")
+
+
+class RetryBudget:
+    """Caps retries at a share of first attempts, and counts them.
+
+    Shared by every retrying call in a run, so when a dependency fails
+    for many concurrent callers at once, retries stop growing with the
+    concurrency: at most ``min_retries + ratio * calls`` retries are made.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        """Initialize budget.
+
+        Args:
+            ratio: Retries allowed per first attempt
+            min_retries: Retries allowed regardless of the number of calls
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.denied = 0
+        self.by_function = {}  # name -> {"calls", "retries", "sleep", "failed"}
+
+    def record_call(self, name: str) -> None:
+        """Count the first attempt of a call."""
+        with self._lock:
+            self.calls += 1
+            self._function(name)["calls"] += 1
+
+    def try_retry(self, name: str, sleep: float) -> bool:
+        """Take one retry from the budget.
+
+        Args:
+            name: Retrying function
+            sleep: Seconds the retry will wait first
+
+        Returns:
+            True if the retry may go ahead
+        """
+        with self._lock:
+            if self.retries >= self.min_retries + self.ratio * self.calls:
+                self.denied += 1
+                return False
+            self.retries += 1
+            stats = self._function(name)
+            stats["retries"] += 1
+            stats["sleep"] += sleep
+            return True
+
+    def record_failure(self, name: str) -> None:
+        """Count a call that failed after its last attempt."""
+        with self._lock:
+            self._function(name)["failed"] += 1
+
+    def log_stats(self) -> None:
+        """Log, at info level, the functions that retried."""
+        with self._lock:
+            retried = {name: dict(stats) for name, stats in self.by_function.items() if stats["retries"]}
+            denied = self.denied
+        for name, stats in sorted(retried.items(), key=lambda item: -item[1]["sleep"]):
+            logger.info(
+                f"Retries {name}: {stats['retries']} in {stats['calls']} calls, "
+                f"{stats['sleep']:.1f}s asleep, {stats['failed']} failed"
+            )
+        if denied:
+            logger.warning(f"Retry budget exhausted: {denied} retries skipped")
+
+    def _function(self, name: str) -> dict:
+        """Counters of one function (lock held)."""
+        if name not in self.by_function:
+            self.by_function[name] = {"calls": 0, "retries": 0, "sleep": 0.0, "failed": 0}
+        return self.by_function[name]
+
+
+_budget = RetryBudget()
+
+
+def retry_budget() -> RetryBudget:
+    """The budget retries are currently drawn from."""
+    return _budget
+
+
+def start_retry_budget(ratio: float = 0.2, min_retries: int = 10) -> RetryBudget:
+    """Start a fresh budget (and counters) for a new run.
+
+    Args:
+        ratio: Retries allowed per first attempt
+        min_retries: Retries allowed regardless of the number of calls
+
+    Returns:
+        The new budget
+    """
+    global _budget
+    _budget = RetryBudget(ratio, min_retries)
+    return _budget
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status of the response attached to an error, if any."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check whether an error is worth retrying.
+
+    Errors without an HTTP error status (connection errors, timeouts,
+    broken bodies) and 5xx responses are; 4xx responses are not, except
+    408, 425 and 429.
+
+    Args:
+        error: Exception raised by the attempt
+
+    Returns:
+        True if another attempt may succeed
+    """
+    status = _status_code(error)
+    return status is None or status < 400 or status >= 500 or status in RETRYABLE_CLIENT_STATUSES
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Seconds the server asked the client to wait, from the error's response headers.
+
+    Reads retry-after-ms, Retry-After (seconds or an HTTP date) and, for
+    Anthropic, the reset time of an exhausted anthropic-ratelimit-* limit.
+
+    Args:
+        error: Exception raised by the attempt
+
+    Returns:
+        Seconds to wait, or None if the response gives no hint
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    try:
+        if headers.get("retry-after-ms"):
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        value = headers.get("retry-after")
+        if value:
+            if value.strip().isdigit():
+                return float(value)
+            from email.utils import parsedate_to_datetime
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+
+        resets = []
+        for limit in _RATE_LIMIT_RESETS:
+            reset = headers.get(f"anthropic-ratelimit-{limit}-reset")
+            if reset and headers.get(f"anthropic-ratelimit-{limit}-remaining") == "0":
+                reset_at = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+                resets.append((reset_at - datetime.now(timezone.utc)).total_seconds())
+        return max(0.0, min(resets)) if resets else None
+    except (TypeError, ValueError):
+        return None
+
 
 def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
-    backoff: float = 2.0,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,)
+    backoff: float = 3.0,
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    max_delay: float = 60.0,
+    attempt_seconds: float = 0.0,
 ):
-    """Retry decorator with exponential backoff.
+    """Retry decorator with decorrelated jitter.
+
+    Each wait is drawn from [delay, previous wait * backoff] (capped at
+    max_delay), so concurrent callers that failed together spread out
+    instead of retrying in lockstep. A wait the server asks for
+    (Retry-After, Anthropic rate limit resets) replaces the drawn one; if
+    it is longer than max_delay the call fails at once. Responses that
+    cannot succeed on retry (most 4xx) are not retried.
+
+    Every retry is drawn from the run's RetryBudget (see
+    start_retry_budget), which also counts retries and time asleep per
+    function. If the decorated function takes a ``deadline`` argument
+    (utils.deadline.Deadline), no retry is made once the wait plus
+    attempt_seconds would run past it.
 
     Args:
         max_attempts: Maximum number of attempts
-        delay: Initial delay between retries in seconds
-        backoff: Multiplier for delay after each retry
+        delay: Shortest wait between attempts in seconds
+        backoff: Growth factor of the wait window after each retry
         exceptions: Tuple of exception types to catch
+        max_delay: Longest wait between attempts in seconds
+        attempt_seconds: Expected duration of one attempt, to check the deadline with
 
     Returns:
-        Decorated function
+        Decorated function (coroutine functions stay coroutine functions)
 
     Example:
-        @retry(max_attempts=3, delay=1, backoff=2, exceptions=(requests.RequestException,))
+        @retry(max_attempts=3, delay=1, exceptions=(requests.RequestException,))
         def fetch_data():
             return requests.get("https://example.com")
     """
     def decorator(func: Callable):
+        name = func.__qualname__
+        signature = inspect.signature(func)
+
+        def next_wait(error: Exception, attempt: int, previous: float, args, kwargs) -> Optional[float]:
+            """Seconds to wait before the next attempt, or None to give up."""
+            budget = _budget
+            if attempt == max_attempts or not is_retryable(error):
+                logger.error(f"{name} failed after {attempt} attempts: {error}")
+                budget.record_failure(name)
+                return None
+
+            hint = retry_after(error)
+            if hint is not None and hint > max_delay:
+                logger.error(f"{name} failed: server asked to wait {hint:.0f}s: {error}")
+                budget.record_failure(name)
+                return None
+            if hint is not None:
+                wait = hint + random.uniform(0, min(1.0, hint * 0.1))
+            else:
+                wait = min(max_delay, random.uniform(delay, max(delay, previous * backoff)))
+
+            try:
+                deadline = signature.bind_partial(*args, **kwargs).arguments.get("deadline")
+            except TypeError:
+                deadline = None
+            if deadline is not None and not deadline.allows(wait + attempt_seconds):
+                logger.error(f"{name} failed after {attempt} attempts, "
+                             f"no run budget left to retry: {error}")
+                budget.record_failure(name)
+                return None
+
+            if not budget.try_retry(name, wait):
+                logger.error(f"{name} failed after {attempt} attempts, retry budget spent: {error}")
+                budget.record_failure(name)
+                return None
+
+            logger.warning(
+                f"{name} attempt {attempt}/{max_attempts} failed: {error}. "
+                f"Retrying in {wait:.1f}s{' (server hint)' if hint is not None else ''}..."
+            )
+            return wait
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                _budget.record_call(name)
+                wait = delay
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        wait = next_wait(e, attempt, wait, args, kwargs)
+                        if wait is None:
+                            raise
+                    await asyncio.sleep(wait)
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            attempt = 1
-            current_delay = delay
-
-            while attempt <= max_attempts:
+            _budget.record_call(name)
+            wait = delay
+            for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    if attempt == max_attempts:
-                        logger.error(
-                            f"{func.__name__} failed after {max_attempts} attempts: {e}"
-                        )
+                    wait = next_wait(e, attempt, wait, args, kwargs)
+                    if wait is None:
                         raise
-
-                    logger.warning(
-                        f"{func.__name__} attempt {attempt}/{max_attempts} failed: {e}. "
-                        f"Retrying in {current_delay:.1f}s..."
-                    )
-
-                    time.sleep(current_delay)
-                    current_delay *= backoff
-                    attempt += 1
+                time.sleep(wait)
 
         return wrapper
     return decorator
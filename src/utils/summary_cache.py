@@ -0,0 +1,120 @@
+"""Persistent cache of Wikipedia page summaries with time-to-live eviction."""
+
+import json
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger("AADD")
+
+
+@dataclass
+class PageSummary:
+    """Short description and lead extract of one article."""
+
+    title: str
+    description: str = ""  # e.g. "American astronaut (1930-2012)"
+    extract: str = ""  # Plain-text lead section
+    missing: bool = False  # No such article, or not one worth summarizing (disambiguation)
+    fetched_at: float = 0.0  # Wall-clock time the summary was fetched
+
+
+class SummaryCache:
+    """On-disk summary cache keyed by language and page title.
+
+    Entries older than ``ttl`` seconds count as absent and are deleted
+    when read; prune() deletes every expired entry. Missing pages are
+    cached too, so they are not requested again until they expire.
+
+    Layout: <cache_dir>/<language>/<sha1(title)>.json
+    """
+
+    def __init__(self, cache_dir: Path, ttl: float = 30 * 24 * 3600):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for cached summaries
+            ttl: Seconds a summary stays usable
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "stored": 0}
+
+    def get(self, language: str, title: str) -> Optional[PageSummary]:
+        """Cached summary of a page, if it has not expired.
+
+        Args:
+            language: Wikipedia edition, e.g. "en"
+            title: Page title
+
+        Returns:
+            PageSummary, or None on a miss
+        """
+        path = self._path(language, title)
+        try:
+            summary = PageSummary(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            self._count("misses")
+            return None
+
+        if time.time() - summary.fetched_at >= self.ttl:
+            path.unlink(missing_ok=True)
+            self._count("expired")
+            self._count("misses")
+            return None
+        self._count("hits")
+        return summary
+
+    def put(self, language: str, summary: PageSummary) -> None:
+        """Store a summary, replacing any older one of the same page.
+
+        Args:
+            language: Wikipedia edition
+            summary: Summary to store (fetched_at is set if missing)
+        """
+        if not summary.fetched_at:
+            summary.fetched_at = time.time()
+        path = self._path(language, summary.title)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(asdict(summary), ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(path)
+            self._count("stored")
+        except OSError as e:
+            logger.warning(f"Could not cache summary of {summary.title}: {e}")
+
+    def prune(self) -> int:
+        """Delete expired summaries.
+
+        Returns:
+            Number of summaries deleted
+        """
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                fetched_at = json.loads(path.read_text(encoding="utf-8")).get("fetched_at", 0)
+            except (OSError, ValueError):
+                fetched_at = 0  # Unreadable entries go too
+            if fetched_at < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.info(f"Pruned {removed} expired page summaries")
+        return removed
+
+    def _path(self, language: str, title: str) -> Path:
+        """File of one page's summary."""
+        return self.cache_dir / language / f"{hashlib.sha1(title.encode('utf-8')).hexdigest()}.json"
+
+    def _count(self, key: str) -> None:
+        """Add one to a counter."""
+        with self._lock:
+            self.stats[key] += 1